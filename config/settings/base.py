@@ -69,6 +69,7 @@ DJANGO_APPS = [
     "django.contrib.staticfiles",
     # "django.contrib.humanize", # Handy template tags
     "django.contrib.admin",
+    "django.contrib.postgres",
     "django.forms",
 ]
 THIRD_PARTY_APPS = [
@@ -148,6 +149,7 @@ MIDDLEWARE = [
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
+    "openvolunteer.orgs.middleware.PermissionContextMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
     "allauth.account.middleware.AccountMiddleware",
@@ -365,3 +367,45 @@ WEBPACK_LOADER = {
 }
 # Your stuff...
 # ------------------------------------------------------------------------------
+# Pagination
+# ------------------------------------------------------------------------------
+# Lists estimated above this many rows are not counted exactly on every request
+PAGINATION_EXACT_COUNT_LIMIT = env.int("PAGINATION_EXACT_COUNT_LIMIT", default=1000)
+# Seconds a count of a large list is cached for the same filters
+PAGINATION_COUNT_CACHE_TTL = env.int("PAGINATION_COUNT_CACHE_TTL", default=60)
+
+# Tickets
+# ------------------------------------------------------------------------------
+# Generating more tickets than this runs as a background job instead of in the request
+TICKET_GENERATION_SYNC_LIMIT = env.int("TICKET_GENERATION_SYNC_LIMIT", default=500)
+# Audit log partitions older than this many months are archived to disk
+TICKET_AUDIT_RETENTION_MONTHS = env.int("TICKET_AUDIT_RETENTION_MONTHS", default=12)
+# On the persistent media volume; the web server must not serve this directory
+TICKET_AUDIT_ARCHIVE_DIR = env.str(
+    "TICKET_AUDIT_ARCHIVE_DIR",
+    default=str(Path(MEDIA_ROOT) / "private" / "ticket-audit"),
+)
+
+# Orgs
+# ------------------------------------------------------------------------------
+# Seconds a user's cached org roles are kept; Membership writes invalidate them
+ORG_ROLE_CACHE_TTL = env.int("ORG_ROLE_CACHE_TTL", default=60 * 60)
+# Seconds org-over-global tag and ticket template lookups are cached; writes
+# to those models invalidate them
+ORG_PREFERRED_CACHE_TTL = env.int("ORG_PREFERRED_CACHE_TTL", default=60 * 60)
+
+# Filters
+# ------------------------------------------------------------------------------
+# Filters with more choices than this use a search box instead of a full select
+FILTER_CHOICES_INLINE_LIMIT = env.int("FILTER_CHOICES_INLINE_LIMIT", default=200)
+# Seconds filter choices are cached per org set; model writes invalidate them
+FILTER_CHOICES_CACHE_TTL = env.int("FILTER_CHOICES_CACHE_TTL", default=300)
+
+# People
+# ------------------------------------------------------------------------------
+# Seconds a "select all matching people" token stays valid for bulk actions
+PERSON_SELECTION_TTL = env.int("PERSON_SELECTION_TTL", default=60 * 60)
+# Seconds person_search results are cached per org scope; people writes invalidate
+PERSON_SEARCH_CACHE_TTL = env.int("PERSON_SEARCH_CACHE_TTL", default=30)
+# CSV uploads with more rows than this are imported by a background job
+PERSON_IMPORT_SYNC_LIMIT = env.int("PERSON_IMPORT_SYNC_LIMIT", default=1000)
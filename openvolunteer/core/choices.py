@@ -0,0 +1,167 @@
+"""
+Lazy, cached choice providers for list filters.
+
+A ChoiceProvider replaces a callable "choices" in a filter definition. Its
+choices are only queried when the filter panel is rendered, and are cached
+per (filter, set of orgs the user belongs to). Saving or deleting an instance
+of the model bumps a generation number that is part of the cache key. Choice
+sets larger than FILTER_CHOICES_INLINE_LIMIT are not inlined: the filter
+renders a search box backed by the core:filter_choices JSON endpoint.
+"""
+
+import hashlib
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+from django.db.models import F
+from django.db.models.signals import post_delete
+from django.db.models.signals import post_save
+from django.urls import reverse
+from django.utils.functional import cached_property
+
+from openvolunteer.orgs.permissions import permission_context
+
+from .generations import bump_generation
+from .generations import get_generation
+from .generations import invalidate_on_commit
+
+CHOICES_CACHE_PREFIX = "filter-choices"
+
+AUTOCOMPLETE_RESULTS = 20
+
+# key -> ChoiceProvider, for the autocomplete endpoint
+choice_providers = {}
+
+
+class ChoiceProvider:
+    """
+    Choices of `model` for a filter, scoped by `queryset(request)`.
+
+    `key` identifies the provider in cache keys and autocomplete URLs and
+    must be unique. `label` is a field name or expression used as the
+    option label, and for searching in autocomplete mode. The scoping
+    queryset may only depend on the orgs the user is a member of.
+    """
+
+    def __init__(self, key, model, queryset, *, label="name"):
+        if key in choice_providers:
+            msg = f"Duplicate choice provider {key!r}"
+            raise ValueError(msg)
+
+        self.key = key
+        self.model = model
+        self.queryset = queryset
+        self.label = F(label) if isinstance(label, str) else label
+
+        choice_providers[key] = self
+        for name, signal in (("save", post_save), ("delete", post_delete)):
+            signal.connect(
+                self.invalidate,
+                sender=model,
+                weak=False,
+                dispatch_uid=f"{CHOICES_CACHE_PREFIX}:{key}:{name}",
+            )
+
+    @property
+    def generation_key(self):
+        return f"{CHOICES_CACHE_PREFIX}:generation:{self.key}"
+
+    def invalidate(self, **kwargs):
+        invalidate_on_commit(lambda: bump_generation(self.generation_key))
+
+    def cache_key(self, request):
+        org_ids = sorted(
+            str(org_id) for org_id in permission_context(request.user).org_ids()
+        )
+        scope = hashlib.sha256(",".join(org_ids).encode()).hexdigest()
+        generation = get_generation(self.generation_key)
+        return f"{CHOICES_CACHE_PREFIX}:{self.key}:{generation}:{scope}"
+
+    def labelled(self, request):
+        return (
+            self.queryset(request)
+            .annotate(choice_label=self.label)
+            .order_by("choice_label", "pk")
+        )
+
+    def choices(self, request):
+        """
+        [(value, label), ...], or None if there are too many to inline.
+        """
+        key = self.cache_key(request)
+        cached = cache.get(key)
+        if cached is not None:
+            return cached["choices"]
+
+        limit = settings.FILTER_CHOICES_INLINE_LIMIT
+        rows = [
+            (str(pk), label)
+            for pk, label in self.labelled(request).values_list(
+                "pk",
+                "choice_label",
+            )[: limit + 1]
+        ]
+        choices = rows if len(rows) <= limit else None
+        # Wrapped, so a cached "too many" is told apart from a miss
+        cache.set(key, {"choices": choices}, settings.FILTER_CHOICES_CACHE_TTL)
+        return choices
+
+    def search(self, request, term, limit=AUTOCOMPLETE_RESULTS):
+        queryset = self.labelled(request)
+        if term:
+            queryset = queryset.filter(choice_label__icontains=term)
+        return [
+            (str(pk), label)
+            for pk, label in queryset.values_list("pk", "choice_label")[:limit]
+        ]
+
+    def label_for(self, request, value):
+        """
+        Label of the selected `value`, or None if it is not a valid choice.
+        """
+        try:
+            return (
+                self.labelled(request)
+                .filter(pk=value)
+                .values_list("choice_label", flat=True)
+                .first()
+            )
+        except (TypeError, ValueError, ValidationError):
+            return None
+
+    def bind(self, request, value):
+        return BoundChoices(self, request, value)
+
+
+class BoundChoices:
+    """
+    Choices of a provider for one request, evaluated when first used.
+
+    Iterates as [(value, label), ...] like static choices. When the set is too
+    large to inline, `autocomplete_url` is set and only the selected option is
+    iterated.
+    """
+
+    def __init__(self, provider, request, value):
+        self.provider = provider
+        self.request = request
+        self.value = value
+
+    @cached_property
+    def inline(self):
+        return self.provider.choices(self.request)
+
+    @property
+    def autocomplete_url(self):
+        if self.inline is not None:
+            return None
+        return reverse("core:filter_choices", args=[self.provider.key])
+
+    def __iter__(self):
+        if self.inline is not None:
+            return iter(self.inline)
+        if self.value in ("", None):
+            return iter(())
+        label = self.provider.label_for(self.request, self.value)
+        return iter([(self.value, label)] if label is not None else ())
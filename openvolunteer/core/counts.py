@@ -0,0 +1,88 @@
+"""
+Count strategies for paginated lists.
+
+An exact COUNT(*) over a filtered, joined and DISTINCT queryset costs about
+as much as fetching the page itself. Small results are always counted
+exactly; the query planner's row estimate decides what counts as small.
+Larger results use one of these strategies:
+
+- COUNT_EXACT: always COUNT(*)
+- COUNT_ESTIMATE: the planner estimate (EXPLAIN), which is free but can be off
+- COUNT_CACHED: an exact count cached for a short TTL per distinct query,
+  i.e. per normalized filter set
+"""
+
+import hashlib
+import json
+from dataclasses import dataclass
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connections
+
+COUNT_EXACT = "exact"
+COUNT_ESTIMATE = "estimate"
+COUNT_CACHED = "cached"
+
+COUNT_CACHE_PREFIX = "pagination-count"
+
+
+@dataclass(frozen=True)
+class ResultCount:
+    value: int
+    is_exact: bool
+
+    def __int__(self):
+        return self.value
+
+    def __str__(self):
+        return str(self.value)
+
+
+def estimate_count(queryset):
+    """
+    Planner row estimate for `queryset`, without executing it.
+    """
+    sql, params = queryset.order_by().query.sql_with_params()
+    with connections[queryset.db].cursor() as cursor:
+        cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+        plan = cursor.fetchone()[0]
+
+    # psycopg returns the json column decoded, but be lenient
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+def count_cache_key(queryset):
+    """
+    Cache key identifying the filter set of `queryset`, ignoring its ordering.
+    """
+    sql, params = queryset.order_by().query.sql_with_params()
+    digest = hashlib.sha256(repr((sql, params)).encode()).hexdigest()
+    return f"{COUNT_CACHE_PREFIX}:{queryset.model._meta.label_lower}:{digest}"  # noqa: SLF001
+
+
+def count_queryset(queryset, strategy=COUNT_CACHED):
+    """
+    Count `queryset` following `strategy`; returns a ResultCount.
+    """
+    if strategy == COUNT_EXACT:
+        return ResultCount(queryset.count(), is_exact=True)
+
+    estimate = estimate_count(queryset)
+    if estimate <= settings.PAGINATION_EXACT_COUNT_LIMIT:
+        return ResultCount(queryset.count(), is_exact=True)
+
+    if strategy == COUNT_ESTIMATE:
+        return ResultCount(estimate, is_exact=False)
+
+    key = count_cache_key(queryset)
+    value = cache.get(key)
+    if value is not None:
+        # Possibly up to the TTL old
+        return ResultCount(value, is_exact=False)
+
+    value = queryset.count()
+    cache.set(key, value, settings.PAGINATION_COUNT_CACHE_TTL)
+    return ResultCount(value, is_exact=True)
@@ -1,3 +1,9 @@
+from django.db.models import Exists
+from django.db.models import OuterRef
+from django.db.models.constants import LOOKUP_SEP
+
+from .choices import ChoiceProvider
+
 EXPECTED_TUPLE_LEN = 2
 
 
@@ -26,18 +32,65 @@ def normalize_choices(choices):
     return normalized
 
 
+def relation_exists(model, relation, **lookups):
+    """
+    Exists() condition on rows of `model` having at least one row through the
+    multi-valued `relation` matching `lookups`.
+
+    `relation` is a reverse foreign key, optionally reached through forward
+    (single-valued) relations, e.g. "org_links" on Person or "person__taggings"
+    on PersonOrganization. Unlike filtering across the join, this never
+    duplicates rows, so the queryset needs no DISTINCT.
+    """
+    *path, name = relation.split(LOOKUP_SEP)
+    for part in path:
+        model = model._meta.get_field(part).related_model  # noqa: SLF001
+
+    field = model._meta.get_field(name)  # noqa: SLF001
+    if not field.one_to_many:
+        msg = f"{relation!r} is not a reverse foreign key of {model.__name__}"
+        raise ValueError(msg)
+
+    related = field.related_model._default_manager.filter(  # noqa: SLF001
+        **{field.field.name: OuterRef(LOOKUP_SEP.join(path) or "pk")},
+        **lookups,
+    )
+    return Exists(related)
+
+
+def _filter_choices(request, f, value):
+    choices = f.get("choices")
+    if isinstance(choices, ChoiceProvider):
+        # Evaluated (from cache) only if the filter panel renders them
+        return choices.bind(request, value)
+    if callable(choices):
+        choices = choices(request)
+    if choices is not None:
+        choices = normalize_choices(choices)
+    return choices
+
+
 def apply_filters(request, queryset, filter_defs):
+    """
+    Apply the filters of `filter_defs` set in the request to `queryset`.
+
+    A filter definition either has a custom "filter" callable or a "lookup".
+    Its "choices" are static, a callable of the request, or a ChoiceProvider
+    (see core.choices) for model choices.
+    Filters over a multi-valued relation declare it as "relation" (with an
+    optional dict of "relation_filter" conditions); their "lookup" then
+    applies to the related rows and is compiled to an EXISTS subquery (see
+    relation_exists). Custom filters that join a multi-valued relation must
+    set "distinct": the queryset is only made DISTINCT when such a filter is
+    applied.
+    """
     filters_ctx = []
+    distinct = False
 
     for f in filter_defs:
         value = request.GET.get(f["name"])
 
-        choices = f.get("choices")
-        if callable(choices):
-            choices = choices(request)
-
-        if choices is not None:
-            choices = normalize_choices(choices)
+        choices = _filter_choices(request, f, value)
 
         ctx = {
             "name": f["name"],
@@ -54,15 +107,29 @@ def apply_filters(request, queryset, filter_defs):
         if f["type"] == "boolean":
             value = value == "1"
 
+        distinct = distinct or f.get("distinct", False)
+
         if "filter" in f:
             queryset = f["filter"](queryset, request, value)
             continue
 
         lookup = f.get("lookup")
-        if lookup:
+        if lookup and "relation" in f:
+            queryset = queryset.filter(
+                relation_exists(
+                    queryset.model,
+                    f["relation"],
+                    **{lookup: value},
+                    **f.get("relation_filter", {}),
+                ),
+            )
+        elif lookup:
             queryset = queryset.filter(**{lookup: value})
 
-    return queryset.distinct(), {
+    if distinct:
+        queryset = queryset.distinct()
+
+    return queryset, {
         "filters": filters_ctx,
         "filters_active": any(f["value"] for f in filters_ctx),
     }
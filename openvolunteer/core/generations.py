@@ -0,0 +1,70 @@
+"""
+Generation counters of caches that are invalidated wholesale.
+
+A cache that puts a generation number in its keys is invalidated by bumping
+the number, which orphans the old entries instead of racing to delete them.
+Generations live in the Django cache (Redis in production, local memory
+elsewhere), so every process sees a bump.
+"""
+
+import threading
+import time
+
+from django.core.cache import cache
+from django.db import transaction
+
+
+def get_generation(key):
+    # Generations start from the clock, so a key lost to eviction never
+    # comes back at a number an old entry is stored under
+    return cache.get_or_set(key, time.time_ns, timeout=None)
+
+
+async def aget_generation(key):
+    return await cache.aget_or_set(key, time.time_ns, timeout=None)
+
+
+def bump_generation(key):
+    try:
+        cache.incr(key)
+    except ValueError:
+        # Never cached or evicted
+        cache.set(key, time.time_ns(), timeout=None)
+
+
+def invalidate_on_commit(invalidate):
+    """
+    Call `invalidate()` now and again once the current transaction commits,
+    in case a concurrent request cached the old values in between.
+    """
+    invalidate()
+    transaction.on_commit(invalidate)
+
+
+class CacheStats:
+    """
+    Hit/miss/invalidation counters of a cache in this process, for
+    monitoring. Subclasses may track more `counters`.
+    """
+
+    counters = ("hits", "misses", "invalidations")
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset_stats()
+
+    def _count(self, counter, amount=1):
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + amount)
+
+    def info(self):
+        with self._lock:
+            info = {counter: getattr(self, counter) for counter in self.counters}
+        lookups = info["hits"] + info["misses"]
+        info["hit_rate"] = info["hits"] / lookups if lookups else None
+        return info
+
+    def reset_stats(self):
+        with self._lock:
+            for counter in self.counters:
+                setattr(self, counter, 0)
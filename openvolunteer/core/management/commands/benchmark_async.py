@@ -0,0 +1,125 @@
+import asyncio
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.core.management.base import CommandError
+from django.test import AsyncClient
+from django.test import Client
+from django.test.utils import override_settings
+from django.urls import reverse
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare the throughput of the async JSON endpoints served like sync "
+        "workers (WSGI handler, one thread per in-flight request) and like "
+        "uvicorn (ASGI handler, one event loop). Sends read-only requests "
+        "against the existing data as the given user."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("email", help="Email of the user sending the requests")
+        parser.add_argument("--requests", type=int, default=500)
+        parser.add_argument(
+            "--threads",
+            type=int,
+            default=4,
+            help="Worker threads of the sync run",
+        )
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=50,
+            help="Requests in flight in the async run",
+        )
+        parser.add_argument("--query", default="jo", help="person_search text")
+        parser.add_argument(
+            "--cached",
+            action="store_true",
+            help="Let person_search serve cached results",
+        )
+
+    def handle(self, *args, **options):
+        user = get_user_model().objects.filter(email=options["email"]).first()
+        if user is None:
+            msg = f"No user with email {options['email']!r}"
+            raise CommandError(msg)
+
+        endpoints = {
+            "person_search": (
+                f"{reverse('people:person_search')}?q={options['query']}"
+            ),
+            "calendar_events": reverse("events:calendar"),
+        }
+
+        # Measure the database round-trips, not the result cache. The test
+        # clients send requests to "testserver"
+        ttl = settings.PERSON_SEARCH_CACHE_TTL if options["cached"] else 0
+        with override_settings(
+            PERSON_SEARCH_CACHE_TTL=ttl,
+            ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, "testserver"],
+        ):
+            for name, url in endpoints.items():
+                self.stdout.write(self.style.MIGRATE_HEADING(f"# {name}"))
+                self.report(
+                    f"sync, {options['threads']} threads",
+                    *self.run_sync(user, url, options),
+                )
+                self.report(
+                    f"async, {options['concurrency']} in flight",
+                    *asyncio.run(self.run_async(user, url, options)),
+                )
+                self.stdout.write("")
+
+    def run_sync(self, user, url, options):
+        local = threading.local()
+
+        def get(_):
+            # One logged in client per worker thread
+            client = getattr(local, "client", None)
+            if client is None:
+                client = local.client = Client()
+                client.force_login(user)
+            start = time.perf_counter()
+            response = client.get(url)
+            elapsed = time.perf_counter() - start
+            return response.status_code, elapsed
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(options["threads"]) as executor:
+            results = list(executor.map(get, range(options["requests"])))
+        return time.perf_counter() - start, results
+
+    async def run_async(self, user, url, options):
+        client = AsyncClient()
+        await client.aforce_login(user)
+        semaphore = asyncio.Semaphore(options["concurrency"])
+
+        async def get():
+            async with semaphore:
+                start = time.perf_counter()
+                response = await client.get(url)
+                return response.status_code, time.perf_counter() - start
+
+        start = time.perf_counter()
+        results = await asyncio.gather(*(get() for _ in range(options["requests"])))
+        return time.perf_counter() - start, results
+
+    def report(self, label, total, results):
+        """
+        Throughput of a run and the latency of its requests.
+        """
+        failed = sum(status != 200 for status, _ in results)  # noqa: PLR2004
+        latencies = sorted(elapsed * 1000 for _, elapsed in results)
+        p95 = latencies[int(len(latencies) * 0.95) - 1] if latencies else 0
+        self.stdout.write(self.style.MIGRATE_LABEL(f"== {label}"))
+        self.stdout.write(
+            f"{len(results) / total:.1f} req/s, latency median "
+            f"{statistics.median(latencies):.2f} ms, p95 {p95:.2f} ms"
+            + (f", {failed} failed" if failed else ""),
+        )
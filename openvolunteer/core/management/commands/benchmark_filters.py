@@ -0,0 +1,149 @@
+import random
+import statistics
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.db import transaction
+
+from openvolunteer.core.filters import relation_exists
+from openvolunteer.orgs.models import Organization
+from openvolunteer.people.models import Person
+from openvolunteer.people.models import PersonOrganization
+from openvolunteer.people.models import PersonTag
+from openvolunteer.people.models import PersonTagging
+
+BATCH_SIZE = 5000
+PAGE_SIZE = 21
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare the person list filtered across joins with DISTINCT against "
+        "EXISTS subqueries on a seeded dataset. Everything is rolled back."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--people", type=int, default=50000)
+        parser.add_argument("--orgs", type=int, default=20)
+        parser.add_argument("--tags", type=int, default=50)
+        parser.add_argument("--repeat", type=int, default=20)
+        parser.add_argument("--seed", type=int, default=0)
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            self.run(options)
+            transaction.set_rollback(True)
+
+    def seed(self, options):
+        rng = random.Random(options["seed"])  # noqa: S311
+        orgs = Organization.objects.bulk_create(
+            [
+                Organization(name=f"Bench org {i}", slug=f"bench-org-{i}")
+                for i in range(options["orgs"])
+            ],
+        )
+        tags = PersonTag.objects.bulk_create(
+            [
+                PersonTag(org=rng.choice(orgs), name=f"Tag {i}")
+                for i in range(options["tags"])
+            ],
+        )
+        people = Person.objects.bulk_create(
+            [
+                Person(full_name=f"Person {rng.randrange(10**9):09d}")
+                for _ in range(options["people"])
+            ],
+            batch_size=BATCH_SIZE,
+        )
+
+        links = []
+        taggings = []
+        for person in people:
+            links.extend(
+                PersonOrganization(person=person, org=org)
+                for org in rng.sample(orgs, rng.randint(1, 4))
+            )
+            taggings.extend(
+                PersonTagging(person=person, tag=tag)
+                for tag in rng.sample(tags, rng.randint(0, 5))
+            )
+        PersonOrganization.objects.bulk_create(links, batch_size=BATCH_SIZE)
+        PersonTagging.objects.bulk_create(taggings, batch_size=BATCH_SIZE)
+
+        with connection.cursor() as cursor:
+            for model in (Person, PersonOrganization, PersonTagging):
+                cursor.execute(f"ANALYZE {model._meta.db_table}")  # noqa: SLF001
+
+        self.stdout.write(
+            f"Seeded {len(people)} people, {len(links)} org links and "
+            f"{len(taggings)} taggings",
+        )
+        return orgs, tags
+
+    def run(self, options):
+        orgs, tags = self.seed(options)
+        # A member of half of the orgs, as in person_list
+        visible = orgs[: len(orgs) // 2 or 1]
+        org, tag = visible[0], tags[0]
+
+        joined = Person.objects.filter(
+            org_links__org__in=visible,
+            org_links__is_active=True,
+        )
+        exists = Person.objects.filter(
+            relation_exists(Person, "org_links", org__in=visible, is_active=True),
+        )
+        scenarios = {
+            "first page": (joined, exists),
+            "filtered by org and tag": (
+                joined.filter(
+                    org_links__org_id=org.id,
+                    org_links__is_active=True,
+                ).filter(taggings__tag_id=tag.id),
+                exists.filter(
+                    relation_exists(
+                        Person,
+                        "org_links",
+                        org_id=org.id,
+                        is_active=True,
+                    ),
+                ).filter(relation_exists(Person, "taggings", tag_id=tag.id)),
+            ),
+        }
+
+        for scenario, (joined_qs, exists_qs) in scenarios.items():
+            before = joined_qs.distinct().order_by("full_name", "pk")
+            after = exists_qs.order_by("full_name", "pk")
+
+            self.stdout.write(self.style.MIGRATE_HEADING(f"# {scenario}"))
+            self.report("JOIN + DISTINCT", before, options["repeat"])
+            self.report("EXISTS", after, options["repeat"])
+
+            if list(before.values_list("pk", flat=True)[:PAGE_SIZE]) != list(
+                after.values_list("pk", flat=True)[:PAGE_SIZE],
+            ):
+                self.stderr.write("Pages differ between the two strategies")
+
+    def report(self, label, queryset, repeat):
+        """
+        Plan and latency of the first page of `queryset` and of its count.
+        """
+        page = queryset[:PAGE_SIZE]
+        self.stdout.write(self.style.MIGRATE_LABEL(f"== {label}"))
+        self.stdout.write(page.explain(analyze=True, buffers=True))
+
+        for name, run in (
+            ("page", lambda: list(page.all())),
+            ("count", queryset.count),
+        ):
+            timings = []
+            for _ in range(repeat):
+                start = time.perf_counter()
+                run()
+                timings.append((time.perf_counter() - start) * 1000)
+            self.stdout.write(
+                f"{name}: median {statistics.median(timings):.2f} ms, "
+                f"max {max(timings):.2f} ms over {repeat} runs",
+            )
+        self.stdout.write("")
@@ -0,0 +1,165 @@
+"""
+Cached "org overrides global" lookups of named rows.
+
+Tags and ticket templates can be defined globally (org=None) and overridden
+per org by a row of the same name. An OrgPreferredResolver maps names to the
+row of the org if there is one, else the global row. Results are cached in
+the Django cache (Redis in production) and in a small per-process LRU, both
+keyed by (model, generation, org, name). Saving or deleting a row of the
+model bumps the generation, which orphans every cached result of the model.
+"""
+
+import copy
+import hashlib
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Q
+from django.db.models.signals import post_delete
+from django.db.models.signals import post_save
+
+from .generations import CacheStats
+from .generations import bump_generation
+from .generations import get_generation
+from .generations import invalidate_on_commit
+
+ORG_PREFERRED_CACHE_PREFIX = "org-preferred"
+
+# Number of resolved (generation, org, name) entries kept per process
+ORG_PREFERRED_LOCAL_SIZE = 1024
+
+
+class OrgPreferredResolver(CacheStats):
+    """
+    Resolves names to rows of `model`, which has `name` and nullable `org`
+    fields, preferring the row of the org over the global one.
+
+    `local_hits` counts the hits served by the per-process LRU.
+    """
+
+    counters = (*CacheStats.counters, "local_hits")
+
+    def __init__(self, model, *, maxsize=ORG_PREFERRED_LOCAL_SIZE):
+        super().__init__()
+        self.model = model
+        self.label = model._meta.label_lower  # noqa: SLF001
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+
+        for name, signal in (("save", post_save), ("delete", post_delete)):
+            signal.connect(
+                self.invalidate_on_commit,
+                sender=model,
+                weak=False,
+                dispatch_uid=f"{ORG_PREFERRED_CACHE_PREFIX}:{self.label}:{name}",
+            )
+
+    @property
+    def _generation_key(self):
+        return f"{ORG_PREFERRED_CACHE_PREFIX}:generation:{self.label}"
+
+    def _key(self, generation, org_id, name):
+        digest = hashlib.sha256(name.encode()).hexdigest()
+        return (
+            f"{ORG_PREFERRED_CACHE_PREFIX}:{self.label}:{generation}:"
+            f"{org_id or 'global'}:{digest}"
+        )
+
+    def generation(self):
+        return get_generation(self._generation_key)
+
+    def _local_get(self, keys):
+        found = {}
+        with self._lock:
+            for name, key in keys.items():
+                if key in self._entries:
+                    self._entries.move_to_end(key)
+                    found[name] = self._entries[key]
+        return found
+
+    def _local_set(self, entries):
+        with self._lock:
+            for key, row in entries.items():
+                self._entries[key] = row
+                self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def _query(self, names, org):
+        scope = Q(org__isnull=True) if org is None else Q(org=org) | Q(org__isnull=True)
+        rows = {}
+        for row in self.model.objects.filter(scope, name__in=names).order_by("pk"):
+            current = rows.get(row.name)
+            if current is None or (current.org_id is None and row.org_id is not None):
+                rows[row.name] = row
+        return rows
+
+    def resolve_many(self, names, org=None):
+        """
+        {name: row} of the given names, with one query for the names that are
+        not cached. Names without a row of the org or a global row are left
+        out.
+        """
+        org_id = getattr(org, "pk", org)
+        generation = self.generation()
+        keys = {name: self._key(generation, org_id, name) for name in set(names)}
+
+        # Rows are cached as {"row": row}, so a cached "no row" is told apart
+        # from a miss
+        found = self._local_get(keys)
+        self._count("hits", len(found))
+        self._count("local_hits", len(found))
+        missing = {name: key for name, key in keys.items() if name not in found}
+        if missing:
+            shared = cache.get_many(missing.values())
+            hits = {name: shared[key] for name, key in missing.items() if key in shared}
+            self._count("hits", len(hits))
+            self._local_set({keys[name]: entry for name, entry in hits.items()})
+            found.update(hits)
+
+        missing = {name: key for name, key in keys.items() if name not in found}
+        if missing:
+            self._count("misses", len(missing))
+            rows = self._query(missing, org)
+            entries = {key: {"row": rows.get(name)} for name, key in missing.items()}
+            found.update((name, entries[key]) for name, key in missing.items())
+            # Only cached once committed, so rows of a transaction that is
+            # rolled back are never handed out
+            transaction.on_commit(lambda: self._store(entries))
+
+        # Callers get their own copy of the rows kept in the local cache
+        return {
+            name: copy.copy(entry["row"])
+            for name, entry in found.items()
+            if entry["row"] is not None
+        }
+
+    def resolve(self, name, org=None):
+        """
+        Row named `name` of `org`, else the global one, else None.
+        """
+        return self.resolve_many([name], org).get(name)
+
+    def _store(self, entries):
+        cache.set_many(entries, settings.ORG_PREFERRED_CACHE_TTL)
+        self._local_set(entries)
+
+    def invalidate(self, **kwargs):
+        bump_generation(self._generation_key)
+        self._count("invalidations")
+
+    def invalidate_on_commit(self, **kwargs):
+        """
+        Drop cached results now and once committed, e.g. after a bulk write
+        that sends no model signals.
+        """
+        invalidate_on_commit(self.invalidate)
+
+    def info(self):
+        return {**super().info(), "size": len(self._entries)}
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
@@ -1,10 +1,256 @@
+import base64
+import binascii
+import json
+from operator import attrgetter
+
 from django.core.paginator import EmptyPage
 from django.core.paginator import PageNotAnInteger
 from django.core.paginator import Paginator
+from django.db.models import Q
+from django.db.models import QuerySet
+from django.utils.functional import cached_property
+
+from .counts import COUNT_CACHED
+from .counts import ResultCount
+from .counts import count_queryset
+
+CURSOR_PARAM = "cursor"
+CURSOR_NEXT = "n"
+CURSOR_PREVIOUS = "p"
+
+
+class InvalidCursorError(ValueError):
+    pass
+
+
+def _cursor_value(value):
+    # Full precision: DjangoJSONEncoder truncates datetimes to milliseconds,
+    # which would break equality on the sort key
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    return str(value)
+
+
+def encode_cursor(direction, values):
+    payload = json.dumps([direction, values], default=_cursor_value)
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor):
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        direction, values = json.loads(base64.urlsafe_b64decode(padded))
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError) as exc:
+        msg = "Invalid pagination cursor"
+        raise InvalidCursorError(msg) from exc
+
+    if direction not in {CURSOR_NEXT, CURSOR_PREVIOUS} or not isinstance(
+        values,
+        list,
+    ):
+        msg = "Invalid pagination cursor"
+        raise InvalidCursorError(msg)
+    return direction, values
+
+
+class CountedPaginator(Paginator):
+    """
+    Paginator whose count follows a count strategy (see core.counts).
+    """
+
+    def __init__(self, object_list, per_page, *, count_strategy=COUNT_CACHED, **kwargs):
+        super().__init__(object_list, per_page, **kwargs)
+        self.count_strategy = count_strategy
+
+    @cached_property
+    def result_count(self):
+        if isinstance(self.object_list, QuerySet):
+            return count_queryset(self.object_list, self.count_strategy)
+        return ResultCount(len(self.object_list), is_exact=True)
+
+    @cached_property
+    def count(self):
+        return self.result_count.value
+
+
+class KeysetPage:
+    """
+    One page of a KeysetPaginator; iterable like a Django Page.
+    """
+
+    def __init__(
+        self,
+        object_list,
+        *,
+        has_next,
+        has_previous,
+        next_cursor,
+        previous_cursor,
+    ):
+        self.object_list = object_list
+        self._has_next = has_next
+        self._has_previous = has_previous
+        self.next_cursor = next_cursor
+        self.previous_cursor = previous_cursor
+        self.next_query = None
+        self.previous_query = None
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def __getitem__(self, index):
+        return self.object_list[index]
+
+    def has_next(self):
+        return self._has_next
+
+    def has_previous(self):
+        return self._has_previous
+
+    def has_other_pages(self):
+        return self._has_next or self._has_previous
+
+
+class KeysetPaginator:
+    """
+    Cursor based paginator seeking on the queryset ordering.
+
+    Unlike Paginator it does not count the queryset or use OFFSET: a page is
+    fetched with a WHERE clause on the sort key of the last row seen, so deep
+    pages are as cheap as the first one. The primary key is appended to the
+    ordering as a tie-breaker. Ordering fields must be field names, lookups or
+    annotation names (optionally prefixed with "-") and must not be NULL.
+    """
+
+    def __init__(self, queryset, per_page, ordering=None):
+        ordering = list(
+            ordering or queryset.query.order_by or queryset.model._meta.ordering,  # noqa: SLF001
+        )
+        if not all(isinstance(field, str) for field in ordering):
+            msg = "KeysetPaginator only supports field name orderings"
+            raise TypeError(msg)
+        if not {"pk", "-pk", "id", "-id"} & set(ordering):
+            ordering.append("pk")
+
+        self.ordering = ordering
+        self.keys = [(field.lstrip("-"), field.startswith("-")) for field in ordering]
+        self.queryset = queryset.order_by(*ordering)
+        self.per_page = per_page
+
+    def _values(self, obj):
+        return [attrgetter(field.replace("__", "."))(obj) for field, _ in self.keys]
+
+    def _seek(self, values, *, backwards):
+        """
+        Rows strictly after `values` in the ordering, or before if `backwards`.
+        """
+        seek = Q()
+        for index, (field, descending) in enumerate(self.keys):
+            lookup = "lt" if descending != backwards else "gt"
+            condition = Q(**{f"{field}__{lookup}": values[index]})
+            for previous_field, previous_value in zip(
+                (key for key, _ in self.keys[:index]),
+                values[:index],
+                strict=True,
+            ):
+                condition &= Q(**{previous_field: previous_value})
+            seek |= condition
+        return seek
+
+    def page(self, cursor=None):
+        direction, values = CURSOR_NEXT, None
+        if cursor:
+            try:
+                direction, values = decode_cursor(cursor)
+            except InvalidCursorError:
+                direction, values = CURSOR_NEXT, None
+            if values is not None and len(values) != len(self.keys):
+                direction, values = CURSOR_NEXT, None
+
+        backwards = direction == CURSOR_PREVIOUS
+        queryset = self.queryset
+        if values is not None:
+            queryset = queryset.filter(self._seek(values, backwards=backwards))
+        if backwards:
+            queryset = queryset.reverse()
+
+        rows = list(queryset[: self.per_page + 1])
+        has_more = len(rows) > self.per_page
+        rows = rows[: self.per_page]
+
+        if backwards:
+            rows.reverse()
+            has_previous, has_next = has_more, True
+        else:
+            has_previous, has_next = values is not None, has_more
+
+        return KeysetPage(
+            rows,
+            has_next=has_next and bool(rows),
+            has_previous=has_previous and bool(rows),
+            next_cursor=(
+                encode_cursor(CURSOR_NEXT, self._values(rows[-1]))
+                if has_next and rows
+                else None
+            ),
+            previous_cursor=(
+                encode_cursor(CURSOR_PREVIOUS, self._values(rows[0]))
+                if has_previous and rows
+                else None
+            ),
+        )
+
+
+def _cursor_query(request, cursor):
+    query = request.GET.copy()
+    query.pop("page", None)
+    query[CURSOR_PARAM] = cursor
+    return query.urlencode()
+
+
+def keyset_paginate(
+    request,
+    queryset,
+    per_page=25,
+    ordering=None,
+    count_strategy=COUNT_CACHED,
+):
+    paginator = KeysetPaginator(queryset, per_page, ordering=ordering)
+    page_obj = paginator.page(request.GET.get(CURSOR_PARAM))
+
+    if page_obj.next_cursor:
+        page_obj.next_query = _cursor_query(request, page_obj.next_cursor)
+    if page_obj.previous_cursor:
+        page_obj.previous_query = _cursor_query(request, page_obj.previous_cursor)
+
+    total = count_queryset(queryset, count_strategy)
+
+    return {
+        "total_count": total.value,
+        "count_is_exact": total.is_exact,
+        "paginator": paginator,
+        "page_obj": page_obj,
+        "is_paginated": page_obj.has_other_pages(),
+        "is_keyset": True,
+    }
+
+
+def paginate(request, queryset, per_page=25, *, keyset=False, count=COUNT_CACHED):
+    """
+    Paginate `queryset` for a list view.
 
+    With `keyset=True` the view opts into cursor pagination (KeysetPaginator):
+    no page numbers, but constant cost for deep pages. `count` is the count
+    strategy used for the total (see core.counts); `count_is_exact` tells
+    templates whether the total is approximate.
+    """
+    if keyset:
+        return keyset_paginate(request, queryset, per_page, count_strategy=count)
 
-def paginate(request, queryset, per_page=25):
-    paginator = Paginator(queryset, per_page)
+    paginator = CountedPaginator(queryset, per_page, count_strategy=count)
     page_number = request.GET.get("page", 1)
 
     try:
@@ -16,6 +262,7 @@ def paginate(request, queryset, per_page=25):
 
     return {
         "total_count": paginator.count,
+        "count_is_exact": paginator.result_count.is_exact,
         "paginator": paginator,
         "page_obj": page_obj,
         "is_paginated": paginator.num_pages > 1,
@@ -0,0 +1,65 @@
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test import RequestFactory
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from openvolunteer.core.choices import choice_providers
+from openvolunteer.orgs.models import Membership
+from openvolunteer.orgs.models import Organization
+from openvolunteer.orgs.models import OrgRole
+from openvolunteer.tickets.models import TicketBatch
+
+# Registered by TicketsConfig.ready(), like every app's filter choices
+BATCH_CHOICES = choice_providers["tickets.batch"]
+
+
+@pytest.fixture
+def batch_request(user):
+    org = Organization.objects.create(name="Org", slug="org")
+    Membership.objects.create(org=org, user=user, role=OrgRole.ADMIN)
+    other = Organization.objects.create(name="Other", slug="other")
+    TicketBatch.objects.create(org=other, name="Hidden")
+    request = RequestFactory().get("/tickets/")
+    request.user = user
+    cache.clear()
+    return org, request
+
+
+@pytest.mark.django_db
+def test_batch_choices_are_cached_and_invalidated(batch_request):
+    org, request = batch_request
+    batch = TicketBatch.objects.create(org=org, name="Calls")
+
+    assert BATCH_CHOICES.choices(request) == [(str(batch.id), "Calls")]
+    with CaptureQueriesContext(connection) as queries:
+        assert BATCH_CHOICES.choices(request) == [(str(batch.id), "Calls")]
+    assert len(queries) == 0
+
+    batch.name = "Texts"
+    batch.save()
+    assert BATCH_CHOICES.choices(request) == [(str(batch.id), "Texts")]
+
+
+@pytest.mark.django_db
+def test_large_batch_choices_use_autocomplete(batch_request, client, settings):
+    org, request = batch_request
+    settings.FILTER_CHOICES_INLINE_LIMIT = 2
+    batches = [
+        TicketBatch.objects.create(org=org, name=name)
+        for name in ("Calls", "Texts", "Visits")
+    ]
+
+    bound = BATCH_CHOICES.bind(request, str(batches[1].id))
+    assert bound.autocomplete_url == reverse(
+        "core:filter_choices",
+        args=[BATCH_CHOICES.key],
+    )
+    assert list(bound) == [(str(batches[1].id), "Texts")]
+
+    client.force_login(request.user)
+    response = client.get(bound.autocomplete_url, {"q": "i"})
+    assert response.json()["results"] == [
+        {"value": str(batches[2].id), "label": "Visits"},
+    ]
@@ -6,4 +6,9 @@ app_name = "core"
 
 urlpatterns = [
     path("", views.home, name="home"),
+    path(
+        "filters/<str:key>/choices/",
+        views.filter_choices,
+        name="filter_choices",
+    ),
 ]
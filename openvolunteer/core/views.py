@@ -1,14 +1,22 @@
 from django.contrib.auth.decorators import login_required
 from django.db.models import Count
+from django.http import Http404
+from django.http import JsonResponse
 from django.shortcuts import render
 
 from openvolunteer.orgs.models import Organization
 from openvolunteer.tickets.queryset import get_filtered_tickets
 
+from .choices import choice_providers
+
 
 @login_required
 def home(request):
-    ticket_ctx = get_filtered_tickets(claimed_by=request.user, limit=5)
+    ticket_ctx = get_filtered_tickets(
+        claimed_by=request.user,
+        limit=5,
+        user=request.user,
+    )
 
     orgs = (
         Organization.objects.filter(
@@ -34,3 +42,18 @@ def home(request):
             **ticket_ctx,
         },
     )
+
+
+@login_required
+def filter_choices(request, key):
+    """
+    Autocomplete for filters with too many choices to inline.
+    """
+    provider = choice_providers.get(key)
+    if provider is None:
+        raise Http404
+
+    results = provider.search(request, request.GET.get("q", "").strip())
+    return JsonResponse(
+        {"results": [{"value": value, "label": label} for value, label in results]},
+    )
@@ -1,10 +1,15 @@
 #!/usr/bin/env python3
+from django.conf import settings
 from django.contrib import admin
 from django.contrib import messages
 from django.shortcuts import redirect
 from django.shortcuts import render
+from django.urls import reverse
+from django.utils.html import format_html
 
+from openvolunteer.tickets.services import count_event_tickets
 from openvolunteer.tickets.services import generate_tickets_for_event
+from openvolunteer.tickets.tasks import enqueue_ticket_generation_job
 
 from .forms import GenerateTicketsForTemplateForm
 from .models import Event
@@ -278,6 +283,31 @@ class EventAdmin(admin.ModelAdmin):
                         ),
                     )
 
+                ticket_count = count_event_tickets(
+                    event=event,
+                    ticket_templates=selected_templates,
+                )
+                if ticket_count > settings.TICKET_GENERATION_SYNC_LIMIT:
+                    job = enqueue_ticket_generation_job(
+                        event=event,
+                        created_by=request.user,
+                        ticket_templates=selected_templates,
+                        batch_name=batch_name,
+                        reason="Generated via admin action",
+                    )
+                    created += 1
+                    messages.info(
+                        request,
+                        format_html(
+                            "Generating {} tickets for '{}' in the background "
+                            '(<a href="{}">view progress</a>)',
+                            ticket_count,
+                            event,
+                            reverse("tickets:generation_job", args=[job.id]),
+                        ),
+                    )
+                    continue
+
                 batch, tickets = generate_tickets_for_event(
                     event=event,
                     created_by=request.user,
@@ -11,6 +11,8 @@ class EventsConfig(AppConfig):
     def ready(self):
         # ruff: noqa: PLC0415
 
+        # Register the filter choice cache invalidation receivers
+        from . import filters  # noqa: F401
         from .defaults import install_default_tasks
 
         def install_defaults(sender, **kwargs):
@@ -1,5 +1,6 @@
 # events/filters.py
 
+from openvolunteer.core.choices import ChoiceProvider
 from openvolunteer.orgs.queryset import orgs_for_user
 
 from .models import EventStatus
@@ -23,8 +24,12 @@ EVENT_FILTERS = [
         "name": "type",
         "label": "Type",
         "type": "select",
-        "choices": lambda request: EventTemplate.objects.filter(
-            org__in=orgs_for_user(request.user),
+        "choices": ChoiceProvider(
+            "events.type",
+            EventTemplate,
+            lambda request: EventTemplate.objects.filter(
+                org__in=orgs_for_user(request.user),
+            ),
         ),
         "lookup": "template",
     },
@@ -6,7 +6,7 @@ from openvolunteer.orgs.permissions import user_can_view_org
 def user_can_assign_people(user, event):
     return user_can_manage_people(
         user,
-        event.org,
+        event.org_id,
     ) or (user == event.owned_by)
 
 
@@ -15,16 +15,16 @@ def user_can_manage_events(user, event=None, org=None):
         return False
     return user_can_manage_people(
         user,
-        (event and event.org) or org,
+        (event and event.org_id) or org,
     ) or (event and user == event.owned_by)
 
 
 def user_can_view_events(user, event):
     return user_can_view_org(
         user,
-        event.org,
+        event.org_id,
     ) or (user == event.owned_by)
 
 
 def user_can_edit_event_owner(user, event):
-    return user_can_edit_org(user, event.org)
+    return user_can_edit_org(user, event.org_id)
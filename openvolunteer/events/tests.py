@@ -1,2 +1,138 @@
 #!/usr/bin/env python3
-# Create your tests here.
+import csv
+import io
+from datetime import timedelta
+
+import pytest
+from django.urls import reverse
+from django.utils import timezone
+
+from openvolunteer.events.models import Event
+from openvolunteer.events.models import EventTemplate
+from openvolunteer.events.models import ShiftAssignment
+from openvolunteer.orgs.models import Membership
+from openvolunteer.orgs.models import Organization
+from openvolunteer.orgs.models import OrgRole
+from openvolunteer.people.models import Person
+from openvolunteer.people.models import PersonOrganization
+from openvolunteer.people.models import PersonTag
+from openvolunteer.people.models import PersonTagging
+from openvolunteer.users.tests.factories import UserFactory
+
+# ruff: noqa: PLR2004
+
+
+@pytest.mark.django_db
+def test_shift_assignment_from_selection(client, user):
+    org = Organization.objects.create(name="Org", slug="org")
+    other_org = Organization.objects.create(name="Other", slug="other")
+    Membership.objects.create(org=org, user=user, role=OrgRole.ADMIN)
+    tag = PersonTag.objects.create(org=org, name="Driver")
+
+    starts_at = timezone.now() + timedelta(days=1)
+    event = Event.objects.create(
+        org=org,
+        title="Canvass",
+        template=EventTemplate.objects.create(org=org, name="Canvass"),
+        starts_at=starts_at,
+        ends_at=starts_at + timedelta(hours=2),
+    )
+    shift = event.shifts.create(starts_at=starts_at, ends_at=event.ends_at)
+
+    people = [Person.objects.create(full_name=f"Person {i}") for i in range(5)]
+    for person in people[:4]:
+        PersonOrganization.objects.create(person=person, org=org)
+    # Tagged, but not visible to the user
+    PersonOrganization.objects.create(person=people[4], org=other_org)
+    for person in (*people[:3], people[4]):
+        PersonTagging.objects.create(person=person, tag=tag)
+    # Already assigned, neither posted nor selected
+    ShiftAssignment.objects.create(shift=shift, person=people[3])
+
+    client.force_login(user)
+    response = client.get(
+        reverse("people:person_search"),
+        {"org_id": org.id, "tag_ids": str(tag.id), "selection": "1"},
+    )
+    selection = response.json()
+    assert selection["count"] == 3
+
+    response = client.post(
+        reverse("events:shift_assign_people", args=[shift.id]),
+        {"people_selection": selection["selection"]},
+    )
+    assert response.status_code == 302
+    assignments = ShiftAssignment.objects.filter(shift=shift)
+    assert {a.person_id for a in assignments} == {p.id for p in people[:3]}
+    assert {a.assigned_by_id for a in assignments} == {user.id}
+    assert all(a.created_at and a.status == "init" for a in assignments)
+
+    # Selections are bound to the user who made them
+    other_user = UserFactory()
+    Membership.objects.create(org=org, user=other_user, role=OrgRole.ADMIN)
+    client.force_login(other_user)
+    response = client.post(
+        reverse("events:shift_assign_people", args=[shift.id]),
+        {"people_selection": selection["selection"]},
+    )
+    assert response.status_code == 400
+
+
+@pytest.mark.django_db
+def test_calendar_events(client, user):
+    org = Organization.objects.create(name="Org", slug="org")
+    Membership.objects.create(org=org, user=user, role=OrgRole.VOLUNTEER)
+    starts_at = timezone.now() + timedelta(days=1)
+    event = Event.objects.create(
+        org=org,
+        title="Canvass",
+        template=EventTemplate.objects.create(org=org, name="Canvass"),
+        starts_at=starts_at,
+        ends_at=starts_at + timedelta(hours=2),
+        owned_by=user,
+    )
+    event.default_shift(annotate=False)
+    event.shifts.create(name="Morning", starts_at=starts_at, ends_at=event.ends_at)
+
+    client.force_login(user)
+    data = client.get(reverse("events:calendar")).json()
+
+    # The hidden default shift is left out; owners can edit their events
+    assert [(item["title"], item["editable"]) for item in data] == [
+        ("Canvass (Org)", True),
+        ("Canvass: Morning", True),
+    ]
+
+
+@pytest.mark.django_db
+def test_assignment_export(client, user):
+    org = Organization.objects.create(name="Org", slug="org")
+    Membership.objects.create(org=org, user=user, role=OrgRole.ORGANIZER)
+    bob = Person.objects.create(full_name="Bob")
+    client.force_login(user)
+
+    starts_at = timezone.now() + timedelta(days=1)
+    event = Event.objects.create(
+        org=org,
+        title="Canvass",
+        template=EventTemplate.objects.create(org=org, name="Canvass"),
+        starts_at=starts_at,
+        ends_at=starts_at + timedelta(hours=2),
+    )
+    shift = event.shifts.create(
+        name="Morning",
+        starts_at=starts_at,
+        ends_at=event.ends_at,
+    )
+    ShiftAssignment.objects.create(shift=shift, person=bob, assigned_by=user)
+
+    response = client.get(reverse("events:assignment_export"), {"event": event.id})
+    rows = list(csv.DictReader(io.StringIO(response.getvalue().decode())))
+    assert [
+        (r["event_title"], r["shift_name"], r["person_name"], r["assigned_by_email"])
+        for r in rows
+    ] == [("Canvass", "Morning", "Bob", user.email)]
+
+    # No event matches the event list filters: only the header row
+    response = client.get(reverse("events:assignment_export"), {"q": "nothing"})
+    assert len(response.getvalue().decode().splitlines()) == 1
@@ -8,6 +8,11 @@ urlpatterns = [
     path("", views.event_list, name="event_list"),
     path("<uuid:event_id>/", views.event_detail, name="event_detail"),
     path("new/", views.event_create, name="event_create"),
+    path(
+        "assignments/export/",
+        views.assignment_export,
+        name="assignment_export",
+    ),
     path("<uuid:event_id>/edit/", views.event_edit, name="event_edit"),
     path(
         "shifts/<uuid:shift_id>/signup/",
@@ -2,7 +2,10 @@
 import uuid
 
 from django.contrib.auth.decorators import login_required
+from django.core.exceptions import BadRequest
 from django.core.exceptions import PermissionDenied
+from django.db import transaction
+from django.db.models import F
 from django.forms import modelformset_factory
 from django.http import HttpResponseForbidden
 from django.http import JsonResponse
@@ -13,12 +16,17 @@ from django.urls import reverse
 from django.utils.dateparse import parse_datetime
 from django.views.decorators.http import require_POST
 
+from openvolunteer.core.export import export_response
 from openvolunteer.core.filters import apply_filters
 from openvolunteer.core.pagination import paginate
 from openvolunteer.orgs.models import Organization
+from openvolunteer.orgs.permissions import apermission_context
 from openvolunteer.orgs.permissions import user_can_view_org
 from openvolunteer.orgs.queryset import orgs_for_user
+from openvolunteer.people.cache import invalidate_person_search
 from openvolunteer.people.models import Person
+from openvolunteer.people.selection import insert_for_people
+from openvolunteer.people.selection import selected_people
 from openvolunteer.tickets.models import TicketStatus
 from openvolunteer.tickets.queryset import get_filtered_tickets
 from openvolunteer.users.models import User
@@ -34,16 +42,21 @@ from .permissions import user_can_edit_event_owner
 from .permissions import user_can_manage_events
 
 
-@login_required
-def event_list(request):
-    qs = Event.objects.select_related("org").order_by("starts_at")
+def _visible_events(user):
+    qs = Event.objects.order_by("starts_at")
 
-    if request.user.is_staff or request.user.is_superuser:
+    if user.is_staff or user.is_superuser:
         pass
     else:
         qs = qs.filter(
-            org__in=orgs_for_user(request.user),
+            org__in=orgs_for_user(user),
         )
+    return qs
+
+
+@login_required
+def event_list(request):
+    qs = _visible_events(request.user).select_related("org")
 
     qs, filter_ctx = apply_filters(request, qs, EVENT_FILTERS)
     pagination = paginate(request, qs, per_page=20)
@@ -60,6 +73,64 @@ def event_list(request):
     )
 
 
+ASSIGNMENT_EXPORT_FIELDS = [
+    "id",
+    "event_id",
+    "event_title",
+    "shift_id",
+    "shift_name",
+    "shift_starts_at",
+    "shift_ends_at",
+    "person_id",
+    "person_name",
+    "person_email",
+    "person_phone",
+    "person_discord",
+    "status",
+    "checked_in_at",
+    "assigned_by_email",
+    "created_at",
+]
+
+
+@login_required
+def assignment_export(request):
+    """
+    Shift assignments of the events listed with the same filters, or of the
+    `event` given.
+    """
+    events, _ = apply_filters(request, _visible_events(request.user), EVENT_FILTERS)
+    if event_id := request.GET.get("event"):
+        try:
+            events = events.filter(id=uuid.UUID(event_id))
+        except ValueError as exc:
+            msg = "Invalid event"
+            raise BadRequest(msg) from exc
+
+    assignments = (
+        ShiftAssignment.objects.filter(shift__event__in=events)
+        .annotate(
+            event_id=F("shift__event_id"),
+            event_title=F("shift__event__title"),
+            shift_name=F("shift__name"),
+            shift_starts_at=F("shift__starts_at"),
+            shift_ends_at=F("shift__ends_at"),
+            person_name=F("person__full_name"),
+            person_email=F("person__email"),
+            person_phone=F("person__phone"),
+            person_discord=F("person__discord"),
+            assigned_by_email=F("assigned_by__email"),
+        )
+        .order_by("shift__starts_at", "shift_id", "person__full_name")
+    )
+    return export_response(
+        request,
+        assignments,
+        ASSIGNMENT_EXPORT_FIELDS,
+        "shift-assignments",
+    )
+
+
 @login_required
 def event_detail(request, event_id):
     event = get_object_or_404(Event.objects.select_related("org"), id=event_id)
@@ -78,13 +149,22 @@ def event_detail(request, event_id):
 
     if request.method == "POST" and can_assign:
         posted_ids = set(
-            map(int, request.POST.getlist("people")),
+            map(uuid.UUID, request.POST.getlist("people")),
+        )
+        selection = selected_people(
+            request.user,
+            request.POST.getlist("people_selection"),
         )
 
-        # Remove unchecked people
+        # Remove unchecked people, unless they are in a posted selection
+        to_remove = assigned_ids - posted_ids
+        if selection is not None and to_remove:
+            to_remove -= set(
+                selection.filter(id__in=to_remove).values_list("id", flat=True),
+            )
         ShiftAssignment.objects.filter(
             shift=default_shift,
-            person_id__in=(assigned_ids - posted_ids),
+            person_id__in=to_remove,
         ).delete()
 
         # Add newly checked people
@@ -98,6 +178,10 @@ def event_detail(request, event_id):
             ],
             ignore_conflicts=True,
         )
+        if selection is not None:
+            insert_for_people(ShiftAssignment, selection, shift_id=default_shift.id)
+        # bulk_create sends no post_save signals
+        invalidate_person_search()
 
         return redirect("events:event_detail", event.id)
 
@@ -128,6 +212,7 @@ def event_detail(request, event_id):
         if not user_can_manage_events(request.user, event)
         else None,
         limit=5,
+        user=request.user,
     )
 
     return render(
@@ -324,10 +409,20 @@ def shift_assign_people(request, shift_id):
         submitted_ids = set(
             map(uuid.UUID, request.POST.getlist("people")),
         )
+        selection = selected_people(
+            request.user,
+            request.POST.getlist("people_selection"),
+        )
 
         to_add = submitted_ids - assigned_ids
         to_remove = assigned_ids - submitted_ids
 
+        # People of a "select all matching" selection are kept as well
+        if selection is not None and to_remove:
+            to_remove -= set(
+                selection.filter(id__in=to_remove).values_list("id", flat=True),
+            )
+
         # ---- Remove assignments ----
         if to_remove:
             ShiftAssignment.objects.filter(
@@ -348,6 +443,15 @@ def shift_assign_people(request, shift_id):
                 ],
                 ignore_conflicts=True,
             )
+        if selection is not None:
+            insert_for_people(
+                ShiftAssignment,
+                selection,
+                shift_id=shift.id,
+                assigned_by_id=request.user.id,
+            )
+        # bulk_create sends no post_save signals
+        invalidate_person_search()
 
         return redirect("events:event_detail", shift.event.id)
 
@@ -363,9 +467,15 @@ def shift_assign_people(request, shift_id):
     )
 
 
+# Async: polled by every open calendar, and under ASGI waiting on the database
+# should not hold a worker thread. Read only, so no transaction.
+@transaction.non_atomic_requests
 @login_required
-def calendar_events(request):
-    user = request.user
+async def calendar_events(request):
+    user = await request.auser()
+    # The permission checks below then answer without I/O; owners are
+    # select_related for the same reason
+    await apermission_context(user)
     org_id = request.GET.get("org")
 
     # Determine orgs user can view
@@ -376,36 +486,35 @@ def calendar_events(request):
     if org_id:
         orgs_qs = orgs_qs.filter(id=org_id)
 
-    data = []
-
     # -------- EVENTS --------
-    events_qs = Event.objects.filter(org__in=orgs_qs)
-
-    data.extend(
-        [
-            {
-                "id": f"events:{event.id}",
-                "title": f"{event.title} ({event.org.name})",
-                "start": event.starts_at.isoformat(),
-                "end": event.ends_at.isoformat(),
-                "url": reverse("events:event_detail", args=[event.id]),
-                "editable": user_can_manage_events(user, event=event),
-                "extendedProps": {
-                    "type": "event",
-                    "status": event.event_status,
-                },
-            }
-            for event in events_qs.select_related("org")
-        ],
+    events_qs = Event.objects.filter(org__in=orgs_qs).select_related(
+        "org",
+        "owned_by",
     )
 
+    data = [
+        {
+            "id": f"events:{event.id}",
+            "title": f"{event.title} ({event.org.name})",
+            "start": event.starts_at.isoformat(),
+            "end": event.ends_at.isoformat(),
+            "url": reverse("events:event_detail", args=[event.id]),
+            "editable": user_can_manage_events(user, event=event),
+            "extendedProps": {
+                "type": "event",
+                "status": event.event_status,
+            },
+        }
+        async for event in events_qs.aiterator()
+    ]
+
     # -------- SHIFTS --------
     shifts = Shift.objects.filter(
         event__org__in=orgs_qs,
         is_hidden=False,
-    ).select_related("event", "event__org")
+    ).select_related("event", "event__org", "event__owned_by")
 
-    for shift in shifts:
+    async for shift in shifts.aiterator():
         if not user_can_view_org(user, shift.event.org):
             continue
 
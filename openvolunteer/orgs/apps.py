@@ -5,3 +5,7 @@ from django.apps import AppConfig
 class OrgsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "openvolunteer.orgs"
+
+    def ready(self):
+        # Register the membership cache invalidation receivers
+        from . import signals  # noqa: F401, PLC0415
@@ -0,0 +1,84 @@
+"""
+Cross-request cache of each user's {org_id: role} memberships.
+
+Memberships change rarely but are read on every page view, so the map is kept
+in the Django cache (Redis in production, local memory elsewhere). Each user
+has a version number that is part of the cache key; Membership writes bump it,
+which orphans the old entry instead of racing to delete it.
+"""
+
+from django.conf import settings
+from django.core.cache import cache
+
+from openvolunteer.core.generations import CacheStats
+from openvolunteer.core.generations import aget_generation
+from openvolunteer.core.generations import bump_generation
+from openvolunteer.core.generations import get_generation
+
+from .models import Membership
+
+ROLE_CACHE_PREFIX = "org-roles"
+
+
+class MembershipRoleCache(CacheStats):
+    def _version_key(self, user_id):
+        return f"{ROLE_CACHE_PREFIX}:version:{user_id}"
+
+    def _roles_key(self, user_id, version):
+        return f"{ROLE_CACHE_PREFIX}:{user_id}:{version}"
+
+    def version(self, user_id):
+        return get_generation(self._version_key(user_id))
+
+    def get_roles(self, user_id):
+        """
+        {org_id: role} of the active memberships of user `user_id`.
+        """
+        # Read the version first: a concurrent invalidation makes whatever
+        # we store below unreachable rather than stale
+        key = self._roles_key(user_id, self.version(user_id))
+        roles = cache.get(key)
+        if roles is not None:
+            self._count("hits")
+            return roles
+
+        self._count("misses")
+        roles = dict(
+            Membership.objects.filter(
+                user_id=user_id,
+                is_active=True,
+            ).values_list("org_id", "role"),
+        )
+        cache.set(key, roles, settings.ORG_ROLE_CACHE_TTL)
+        return roles
+
+    async def aversion(self, user_id):
+        return await aget_generation(self._version_key(user_id))
+
+    async def aget_roles(self, user_id):
+        """
+        get_roles() for async views, with the async cache API and ORM.
+        """
+        key = self._roles_key(user_id, await self.aversion(user_id))
+        roles = await cache.aget(key)
+        if roles is not None:
+            self._count("hits")
+            return roles
+
+        self._count("misses")
+        roles = {
+            org_id: role
+            async for org_id, role in Membership.objects.filter(
+                user_id=user_id,
+                is_active=True,
+            ).values_list("org_id", "role")
+        }
+        await cache.aset(key, roles, settings.ORG_ROLE_CACHE_TTL)
+        return roles
+
+    def invalidate(self, user_id):
+        bump_generation(self._version_key(user_id))
+        self._count("invalidations")
+
+
+membership_role_cache = MembershipRoleCache()
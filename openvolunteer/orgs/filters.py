@@ -1,6 +1,6 @@
 from django.db.models import Q
 
-from openvolunteer.people.models import PersonTag
+from openvolunteer.people.filters import PERSON_TAG_CHOICES
 
 from .models import OrgRole
 
@@ -67,15 +67,6 @@ def search_people_orgs(qs, request, value):
     )
 
 
-def filter_by_tag(qs, request, value):
-    """
-    Filter PersonOrganization rows by person tag.
-    """
-    return qs.filter(
-        person__taggings__tag_id=value,
-    )
-
-
 def filter_has_discord(qs, request, value):
     if value is True:
         return qs.exclude(person__discord__isnull=True).exclude(
@@ -99,11 +90,9 @@ PERSON_ORG_FILTERS = [
         "name": "tag",
         "label": "Tag",
         "type": "select",
-        "filter": filter_by_tag,
-        "choices": lambda request: PersonTag.objects.filter(
-            org__in=request.user.memberships.values("org"),
-        )
-        | PersonTag.objects.filter(org__isnull=True),
+        "relation": "person__taggings",
+        "lookup": "tag_id",
+        "choices": PERSON_TAG_CHOICES,
     },
     {
         "name": "is_active",
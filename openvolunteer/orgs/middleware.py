@@ -0,0 +1,37 @@
+from asgiref.sync import iscoroutinefunction
+from asgiref.sync import markcoroutinefunction
+from django.utils.functional import SimpleLazyObject
+
+from .permissions import attach_permission_context
+
+
+class PermissionContextMiddleware:
+    """
+    Attach a PermissionContext to request.user, so the user_can_* checks of
+    a request share one lookup of the user's memberships.
+
+    Must come after AuthenticationMiddleware. In async mode request.user must
+    not be loaded synchronously, so request.permissions is lazy there; async
+    views use `await apermission_context(await request.auser())` instead.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        request.permissions = attach_permission_context(request.user)
+        return self.get_response(request)
+
+    async def __acall__(self, request):
+        request.permissions = SimpleLazyObject(
+            lambda: attach_permission_context(request.user),
+        )
+        return await self.get_response(request)
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.9 on 2026-10-17 00:33
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('orgs', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='organization',
+            name='timezones',
+            field=models.JSONField(blank=True, default=dict, help_text='Timezones available to ticket templates, as {"key": ["Label", "IANA/Zone"]}. Leave empty to use the defaults.'),
+        ),
+    ]
@@ -1,19 +1,67 @@
 #!/usr/bin/env python3
 import uuid
+from zoneinfo import ZoneInfo
+from zoneinfo import ZoneInfoNotFoundError
 
 from django.conf import settings
+from django.core.exceptions import ValidationError
 from django.db import models
 
+# Timezones available to ticket templates (e.g. {{ event_starts_at.est }})
+# key -> (label, IANA zone name)
+DEFAULT_DISPLAY_TIMEZONES = {
+    "utc": ("UTC", "UTC"),
+    "est": ("EST", "America/New_York"),
+    "cdt": ("CDT", "America/Chicago"),
+    "mst": ("MT", "America/Denver"),
+    "pdt": ("PDT", "America/Los_Angeles"),
+    "cet": ("CET", "Europe/Paris"),
+}
+
+TIMEZONE_ENTRY_LEN = 2
+
 
 class Organization(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     slug = models.SlugField(unique=True)
     name = models.CharField(max_length=200)
+    timezones = models.JSONField(
+        default=dict,
+        blank=True,
+        help_text=(
+            "Timezones available to ticket templates, as "
+            '{"key": ["Label", "IANA/Zone"]}. Leave empty to use the defaults.'
+        ),
+    )
     created_at = models.DateTimeField(auto_now_add=True)
 
     def __str__(self):
         return self.name
 
+    def clean(self):
+        super().clean()
+
+        if not isinstance(self.timezones, dict):
+            raise ValidationError({"timezones": "Timezones must be a mapping."})
+
+        for key, entry in self.timezones.items():
+            if not isinstance(entry, (list, tuple)) or len(entry) != TIMEZONE_ENTRY_LEN:
+                msg = f"Timezone '{key}' must be a [label, zone] pair."
+                raise ValidationError({"timezones": msg})
+            try:
+                ZoneInfo(entry[1])
+            except (ZoneInfoNotFoundError, ValueError):
+                msg = f"Unknown timezone '{entry[1]}'."
+                raise ValidationError({"timezones": msg}) from None
+
+    @property
+    def display_timezones(self):
+        """
+        (key, label, zone name) tuples used when formatting event times.
+        """
+        config = self.timezones or DEFAULT_DISPLAY_TIMEZONES
+        return tuple((key, label, zone) for key, (label, zone) in config.items())
+
 
 class OrgRole(models.TextChoices):
     OWNER = "owner", "Owner"
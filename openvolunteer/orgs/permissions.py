@@ -1,26 +1,114 @@
-from .models import Membership
+from .cache import membership_role_cache
 from .models import OrgRole
 
 
-def _membership(user, org):
-    return Membership.objects.filter(
-        user=user,
-        org=org,
-        is_active=True,
-    ).first()
+class PermissionContext:
+    """
+    Request-scoped view of a user's active memberships.
+
+    All of the user's {org_id: role} pairs are loaded once on first use (from
+    the membership role cache, see orgs.cache), so any number of permission
+    checks in a request cost O(1) lookups. Attached to request.user by
+    PermissionContextMiddleware.
+    """
+
+    def __init__(self, user):
+        self.user = user
+        self._roles = None
+
+    @property
+    def roles(self):
+        if self._roles is None:
+            if self.user.is_authenticated:
+                self._roles = membership_role_cache.get_roles(self.user.pk)
+            else:
+                self._roles = {}
+        return self._roles
+
+    async def aload(self):
+        """
+        Load the roles with async I/O. Afterwards the (sync) user_can_* checks
+        answer without I/O, so they are safe to call from async views.
+        """
+        if self._roles is None:
+            if self.user.is_authenticated:
+                self._roles = await membership_role_cache.aget_roles(self.user.pk)
+            else:
+                self._roles = {}
+        return self._roles
+
+    def role(self, org):
+        return self.roles.get(getattr(org, "pk", org))
+
+    def org_ids(self, roles=None):
+        """
+        Ids of orgs the user is an active member of, optionally with one of
+        `roles`.
+        """
+        return {
+            org_id
+            for org_id, role in self.roles.items()
+            if roles is None or role in roles
+        }
+
+    def invalidate(self):
+        self._roles = None
+
+
+def attach_permission_context(user):
+    """
+    Attach (or return the already attached) PermissionContext of `user`.
+    """
+    context = getattr(user, "_permission_context", None)
+    if context is None:
+        context = PermissionContext(user)
+        user._permission_context = context  # noqa: SLF001
+    return context
+
+
+async def apermission_context(user):
+    """
+    Attach the PermissionContext of `user` with its roles loaded, for async
+    views. Pass the user from `await request.auser()`.
+    """
+    context = attach_permission_context(user)
+    await context.aload()
+    return context
+
+
+def permission_context(user):
+    """
+    The PermissionContext attached to `user`, or a fresh unattached one.
+    """
+    context = getattr(user, "_permission_context", None)
+    if context is None:
+        return PermissionContext(user)
+    return context
+
+
+def _membership_role(user, org):
+    """
+    Role of `user` in `org` (instance or id), or None if not an active member.
+
+    Answered from the request PermissionContext when there is one; otherwise
+    (tasks, shell) from the membership role cache.
+    """
+    if org is None:
+        return None
+    return permission_context(user).role(org)
 
 
 def user_can_view_org(user, org):
     if user.is_staff or user.is_superuser:
         return True
-    return _membership(user, org) is not None
+    return _membership_role(user, org) is not None
 
 
 def user_can_edit_org(user, org):
     if user.is_staff or user.is_superuser:
         return True
-    m = _membership(user, org)
-    return m and m.role in {OrgRole.OWNER, OrgRole.ADMIN}
+    role = _membership_role(user, org)
+    return role in {OrgRole.OWNER, OrgRole.ADMIN}
 
 
 def user_can_create_org(user):
@@ -36,8 +124,8 @@ def user_can_manage_members(user, org) -> bool:
     if not user.is_authenticated:
         return False
 
-    m = _membership(user, org)
-    return m and m.role in {OrgRole.OWNER, OrgRole.ADMIN}
+    role = _membership_role(user, org)
+    return role in {OrgRole.OWNER, OrgRole.ADMIN}
 
 
 # Can this user assign some role to a user for some org
@@ -46,20 +134,20 @@ def user_can_set_role(user, org, new_role=None, old_role=None) -> bool:
     if not user_can_manage_members(user, org):
         return True
 
-    m = _membership(user, org)
+    role = _membership_role(user, org)
 
     # Do not update OWNER roles
     if old_role == OrgRole.OWNER:
         return False
 
     # Only owners can update admins
-    if old_role == OrgRole.ADMIN and m.role != OrgRole.OWNER:
+    if old_role == OrgRole.ADMIN and role != OrgRole.OWNER:
         return False
 
     # Org admins are limited in who they can add (none means remove)
-    if m.role == OrgRole.ADMIN:
+    if role == OrgRole.ADMIN:
         return new_role in [OrgRole.VIEWER, OrgRole.VOLUNTEER, OrgRole.ORGANIZER, None]
-    if m.role == OrgRole.OWNER:
+    if role == OrgRole.OWNER:
         # Org owners can add anyone but owners
         return new_role != OrgRole.OWNER
     return False
@@ -72,8 +160,8 @@ def user_can_manage_people(user, org) -> bool:
     if user.is_staff or user.is_superuser:
         return True
 
-    m = _membership(user, org)
-    return m and m.role in {OrgRole.OWNER, OrgRole.ADMIN, OrgRole.ORGANIZER}
+    role = _membership_role(user, org)
+    return role in {OrgRole.OWNER, OrgRole.ADMIN, OrgRole.ORGANIZER}
 
 
 # User has some level of edit participation
@@ -87,5 +175,5 @@ def user_can_participate(user, org) -> bool:
     if not org:
         return False
 
-    m = _membership(user, org)
-    return m and m.role is not OrgRole.VIEWER
+    role = _membership_role(user, org)
+    return role is not None and role != OrgRole.VIEWER
@@ -1,8 +1,9 @@
 from .models import Organization
+from .permissions import permission_context
 
 
 def orgs_for_user(user):
-    return Organization.objects.filter(
-        memberships__user=user,
-        memberships__is_active=True,
-    )
+    if not user.is_authenticated:
+        return Organization.objects.none()
+    # Filter on the (cached) memberships rather than joining them
+    return Organization.objects.filter(id__in=permission_context(user).org_ids())
@@ -0,0 +1,15 @@
+from django.db.models.signals import post_delete
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from openvolunteer.core.generations import invalidate_on_commit
+
+from .cache import membership_role_cache
+from .models import Membership
+
+
+@receiver(post_save, sender=Membership)
+@receiver(post_delete, sender=Membership)
+def invalidate_membership_roles(sender, instance, **kwargs):
+    user_id = instance.user_id
+    invalidate_on_commit(lambda: membership_role_cache.invalidate(user_id))
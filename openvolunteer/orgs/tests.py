@@ -1,2 +1,69 @@
 #!/usr/bin/env python3
-# Create your tests here.
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from openvolunteer.orgs.cache import membership_role_cache
+from openvolunteer.orgs.models import Membership
+from openvolunteer.orgs.models import Organization
+from openvolunteer.orgs.models import OrgRole
+from openvolunteer.orgs.permissions import attach_permission_context
+from openvolunteer.orgs.permissions import user_can_edit_org
+from openvolunteer.orgs.permissions import user_can_manage_people
+from openvolunteer.orgs.permissions import user_can_participate
+from openvolunteer.orgs.permissions import user_can_view_org
+from openvolunteer.orgs.queryset import orgs_for_user
+
+# ruff: noqa: PLR2004
+
+
+@pytest.mark.django_db
+def test_permission_context_loads_memberships_once(user):
+    orgs = [
+        Organization.objects.create(name=f"Org {i}", slug=f"org-{i}") for i in range(3)
+    ]
+    Membership.objects.create(org=orgs[0], user=user, role=OrgRole.ADMIN)
+    Membership.objects.create(org=orgs[1], user=user, role=OrgRole.VOLUNTEER)
+    Membership.objects.create(
+        org=orgs[2],
+        user=user,
+        role=OrgRole.OWNER,
+        is_active=False,
+    )
+
+    attach_permission_context(user)
+    with CaptureQueriesContext(connection) as queries:
+        assert [user_can_view_org(user, org) for org in orgs] == [True, True, False]
+        assert [user_can_edit_org(user, org) for org in orgs] == [True, False, False]
+        assert user_can_manage_people(user, orgs[0].id)
+        assert user_can_participate(user, orgs[1])
+
+    assert len(queries) == 1
+
+
+@pytest.mark.django_db
+def test_membership_role_cache_is_invalidated_by_membership_writes(user):
+    org = Organization.objects.create(name="Org", slug="org")
+    membership_role_cache.reset_stats()
+
+    assert list(orgs_for_user(user)) == []
+    assert not user_can_view_org(user, org)
+    assert membership_role_cache.info()["misses"] == 1
+    assert membership_role_cache.info()["hits"] == 1
+
+    membership = Membership.objects.create(org=org, user=user, role=OrgRole.VIEWER)
+    assert list(orgs_for_user(user)) == [org]
+    assert not user_can_edit_org(user, org)
+    # Cached roles are plain strings, not OrgRole members
+    assert not user_can_participate(user, org)
+
+    membership.role = OrgRole.ADMIN
+    membership.save()
+    with CaptureQueriesContext(connection) as queries:
+        assert user_can_edit_org(user, org)
+        assert user_can_edit_org(user, org)
+    assert len(queries) == 1
+
+    membership.delete()
+    assert not user_can_view_org(user, org)
+    assert membership_role_cache.info()["invalidations"] == 3
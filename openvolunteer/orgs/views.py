@@ -17,7 +17,10 @@ from openvolunteer.core.pagination import paginate
 from openvolunteer.events.models import Event
 from openvolunteer.events.models import EventStatus
 from openvolunteer.events.permissions import user_can_manage_events
+from openvolunteer.people.cache import invalidate_person_search
 from openvolunteer.people.models import PersonOrganization
+from openvolunteer.people.selection import insert_for_people
+from openvolunteer.people.selection import selected_people
 from openvolunteer.tickets.models import TicketStatus
 from openvolunteer.tickets.queryset import get_filtered_tickets
 
@@ -120,6 +123,7 @@ def org_detail(request, slug):
         if not user_can_manage_events(request.user, org=org)
         else None,
         limit=5,
+        user=request.user,
     )
 
     events = Event.objects.filter(org=org)
@@ -315,6 +319,10 @@ def org_people(request, slug):
         # ---- ADD PEOPLE (new selector) ----
         if "add_people" in request.POST:
             person_ids = request.POST.getlist("people")
+            selection = selected_people(
+                request.user,
+                request.POST.getlist("people_selection"),
+            )
 
             if person_ids:
                 PersonOrganization.objects.bulk_create(
@@ -328,6 +336,15 @@ def org_people(request, slug):
                     ],
                     ignore_conflicts=True,
                 )
+            if selection is not None:
+                insert_for_people(
+                    PersonOrganization,
+                    selection,
+                    org_id=org.id,
+                    is_active=True,
+                )
+            # bulk_create sends no post_save signals
+            invalidate_person_search()
 
             return redirect("orgs:org_people", slug=slug)
 
@@ -347,7 +364,7 @@ def org_people(request, slug):
         PERSON_ORG_FILTERS,
     )
 
-    pagination = paginate(request, people_links, per_page=20)
+    pagination = paginate(request, people_links, per_page=20, keyset=True)
 
     return render(
         request,
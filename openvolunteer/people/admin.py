@@ -6,11 +6,18 @@ from django.shortcuts import render
 from django.utils.html import format_html
 from django.utils.html import format_html_join
 
+from .dedup import merge_people
+from .forms import PersonBulkUpdateForm
 from .forms import PersonOrgAssignForm
 from .models import Person
+from .models import PersonDuplicate
+from .models import PersonImportJob
 from .models import PersonOrganization
 from .models import PersonTag
 from .models import PersonTagging
+from .services import bulk_update_orgs
+from .services import bulk_update_summary
+from .services import bulk_update_tags
 
 
 @admin.action(description="Assign all selected people to the same org")
@@ -24,29 +31,13 @@ def mass_join_org(modeladmin, request, queryset):
         form = PersonOrgAssignForm(request.POST)
         if form.is_valid():
             orgs = form.cleaned_data["organizations"]
-
-            created = 0
-            reactivated = 0
-
-            for person in queryset:
-                for org in orgs:
-                    link, was_created = PersonOrganization.objects.get_or_create(
-                        person=person,
-                        org=org,
-                        defaults={"is_active": True},
-                    )
-                    if was_created:
-                        created += 1
-                    elif not link.is_active:
-                        link.is_active = True
-                        link.save(update_fields=["is_active"])
-                        reactivated += 1
+            counts = bulk_update_orgs(queryset, add=orgs)
 
             messages.success(
                 request,
                 f"Assigned {queryset.count()} people to "
                 f"{orgs.count()} org(s). "
-                f"({created} new, {reactivated} reactivated)",
+                f"({counts['added']} new, {counts['reactivated']} reactivated)",
             )
             return redirect(request.get_full_path())
 
@@ -65,6 +56,62 @@ def mass_join_org(modeladmin, request, queryset):
     )
 
 
+@admin.action(description="Add or remove tags and orgs of selected people")
+def mass_update_tags(modeladmin, request, queryset):
+    if "apply" in request.POST:
+        form = PersonBulkUpdateForm(request.POST, user=request.user)
+        if form.is_valid():
+            tags = bulk_update_tags(
+                queryset,
+                add=form.cleaned_data["add_tags"],
+                remove=form.cleaned_data["remove_tags"],
+            )
+            orgs = bulk_update_orgs(
+                queryset,
+                add=form.cleaned_data["add_orgs"],
+                remove=form.cleaned_data["remove_orgs"],
+            )
+            messages.success(request, bulk_update_summary(tags, orgs))
+            return redirect(request.get_full_path())
+    else:
+        form = PersonBulkUpdateForm(user=request.user)
+
+    return render(
+        request,
+        "admin/people/mass_update_tags.html",
+        {
+            "title": "Update tags and organizations of selected people",
+            "people": queryset,
+            "form": form,
+            "action_checkbox_name": admin.helpers.ACTION_CHECKBOX_NAME,
+        },
+    )
+
+
+@admin.action(description="Merge selected people into the oldest one")
+def merge_selected_people(modeladmin, request, queryset):
+    people = list(queryset.order_by("created_at"))
+    if len(people) < 2:  # noqa: PLR2004
+        messages.warning(request, "Select at least two people to merge.")
+        return
+    person = merge_people(people[0], people[1:])
+    messages.success(request, f"Merged {len(people) - 1} people into {person}.")
+
+
+@admin.action(description="Merge selected duplicates into the kept person")
+def merge_duplicates(modeladmin, request, queryset):
+    by_person = {}
+    for duplicate in queryset.select_related("person", "duplicate_of"):
+        by_person.setdefault(duplicate.duplicate_of, []).append(duplicate.person)
+    for person, duplicates in by_person.items():
+        merge_people(person, duplicates)
+    messages.success(
+        request,
+        f"Merged {sum(map(len, by_person.values()))} duplicates into "
+        f"{len(by_person)} people.",
+    )
+
+
 # Inline for editing tags on a Person
 class PersonTaggingInline(admin.TabularInline):
     model = PersonTagging
@@ -168,7 +215,7 @@ class PersonAdmin(admin.ModelAdmin):
     )
     search_fields = ("full_name", "discord", "email", "phone")
     ordering = ("full_name",)
-    actions = [mass_join_org]
+    actions = [mass_join_org, mass_update_tags, merge_selected_people]
     list_filter = (
         OrganizationMembershipFilter,
         TagMembershipFilter,
@@ -246,3 +293,56 @@ class PersonTagAdmin(admin.ModelAdmin):
     )
     def org_display(self, obj):
         return obj.org.name if obj.org else "Global"
+
+
+@admin.register(PersonImportJob)
+class PersonImportJobAdmin(admin.ModelAdmin):
+    list_display = (
+        "file_name",
+        "status",
+        "processed",
+        "total",
+        "created_count",
+        "skipped_count",
+        "created_by",
+        "created_at",
+        "finished_at",
+    )
+
+    list_filter = ("status",)
+
+    readonly_fields = (
+        "file",
+        "file_name",
+        "status",
+        "total",
+        "processed",
+        "created_count",
+        "skipped_count",
+        "errors",
+        "created_by",
+        "created_at",
+        "started_at",
+        "finished_at",
+    )
+
+    def has_add_permission(self, request):
+        return False
+
+
+@admin.register(PersonDuplicate)
+class PersonDuplicateAdmin(admin.ModelAdmin):
+    list_display = (
+        "person",
+        "duplicate_of",
+        "matched_on",
+        "detected_at",
+    )
+
+    list_select_related = ("person", "duplicate_of")
+    search_fields = ("person__full_name", "duplicate_of__full_name")
+    readonly_fields = ("person", "duplicate_of", "matched_on", "detected_at")
+    actions = [merge_duplicates]
+
+    def has_add_permission(self, request):
+        return False
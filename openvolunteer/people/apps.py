@@ -6,3 +6,10 @@ class PeopleConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "openvolunteer.people"
     verbose_name = "People & Contacts"
+
+    def ready(self):
+        # Register the person_search, org-preferred tag and filter choice
+        # cache invalidation receivers
+        from . import filters  # noqa: F401, PLC0415
+        from . import resolvers  # noqa: F401, PLC0415
+        from . import signals  # noqa: F401, PLC0415
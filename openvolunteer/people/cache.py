@@ -0,0 +1,90 @@
+"""
+Short-lived cache of person_search results.
+
+The person selector searches on every keystroke, and organizers of the same
+org repeat the same searches. Results are cached per (visibility scope,
+filters) for PERSON_SEARCH_CACHE_TTL seconds. A global generation number that
+is part of every key is bumped by writes to people, tags, org links and shift
+assignments, which orphans all cached results at once. The key doubles as the
+ETag of the response.
+"""
+
+import hashlib
+import json
+
+from django.conf import settings
+from django.core.cache import cache
+
+from openvolunteer.core.generations import CacheStats
+from openvolunteer.core.generations import aget_generation
+from openvolunteer.core.generations import bump_generation
+from openvolunteer.core.generations import invalidate_on_commit
+from openvolunteer.orgs.permissions import permission_context
+
+from .search import PERSON_SEARCH_FILTERS
+from .search import normalize_search_text
+
+SEARCH_CACHE_PREFIX = "person-search"
+
+
+class PersonSearchCache(CacheStats):
+    @property
+    def _generation_key(self):
+        return f"{SEARCH_CACHE_PREFIX}:generation"
+
+    async def ageneration(self):
+        return await aget_generation(self._generation_key)
+
+    async def akey(self, user, filters):
+        """
+        Cache key of the results of `filters` for `user`, whose permission
+        context must be loaded (see apermission_context).
+
+        Users who see the same people with the same fields share entries:
+        staff see everyone and contact details, others the people of the orgs
+        they are a member of.
+        """
+        if user.is_staff or user.is_superuser:
+            scope = ["*"]
+        else:
+            scope = sorted(str(org_id) for org_id in permission_context(user).org_ids())
+
+        normalized = {name: filters.get(name) or "" for name in PERSON_SEARCH_FILTERS}
+        normalized["q"] = normalize_search_text(normalized["q"])
+        normalized["tag_ids"] = ",".join(
+            sorted(tid for tid in normalized["tag_ids"].split(",") if tid),
+        )
+
+        digest = hashlib.sha256(
+            json.dumps([scope, user.is_staff, normalized], sort_keys=True).encode(),
+        ).hexdigest()
+        return f"{SEARCH_CACHE_PREFIX}:{await self.ageneration()}:{digest}"
+
+    async def aget_or_set(self, key, build):
+        """
+        Cached results under `key`, or the results of `await build()`, cached.
+        """
+        results = await cache.aget(key)
+        if results is not None:
+            self._count("hits")
+            return results
+
+        self._count("misses")
+        results = await build()
+        await cache.aset(key, results, settings.PERSON_SEARCH_CACHE_TTL)
+        return results
+
+    def invalidate(self):
+        bump_generation(self._generation_key)
+        self._count("invalidations")
+
+
+person_search_cache = PersonSearchCache()
+
+
+def invalidate_person_search():
+    """
+    Drop cached person_search results, e.g. after a bulk write that sends no
+    model signals.
+    """
+    invalidate_on_commit(person_search_cache.invalidate)
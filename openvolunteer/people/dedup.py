@@ -0,0 +1,245 @@
+"""
+Duplicate detection and merging of people.
+
+People are compared on their normalized contact keys (Person.email_key,
+discord_key and phone_key). Each key is a blocking key: only people sharing
+a key value are candidates, found with one indexed GROUP BY per key instead
+of comparing all pairs. Groups sharing a person are joined, so people linked
+through different keys end up in one group, whose oldest person is kept.
+"""
+
+from django.contrib.postgres.aggregates import ArrayAgg
+from django.db import transaction
+from django.db.models import Count
+from django.db.models import Exists
+from django.db.models import OuterRef
+
+from openvolunteer.events.models import ShiftAssignment
+from openvolunteer.tickets.models import Ticket
+from openvolunteer.tickets.models import TicketStatus
+
+from .cache import invalidate_person_search
+from .models import DEFAULT_PHONE_COUNTRY_CODE
+from .models import NATIONAL_PHONE_DIGITS
+from .models import Person
+from .models import PersonDuplicate
+from .models import PersonOrganization
+from .models import PersonTagging
+
+# Contact fields and their normalized key columns
+CONTACT_KEYS = {
+    "email": "email_key",
+    "discord": "discord_key",
+    "phone": "phone_key",
+}
+
+# Fields a merge copies from a duplicate when the kept person has none
+MERGE_FILL_FIELDS = (
+    "email",
+    "discord",
+    "phone",
+    "address_line1",
+    "address_line2",
+    "city",
+    "state",
+    "postal_code",
+)
+
+
+def normalize_text_key(value):
+    """
+    Python side of the email_key / discord_key columns.
+    """
+    return (value or "").strip().lower() or None
+
+
+def normalize_phone_key(value):
+    """
+    Python side of the phone_key column.
+    """
+    digits = "".join(char for char in value or "" if char in "0123456789")
+    if len(digits) == NATIONAL_PHONE_DIGITS:
+        digits = DEFAULT_PHONE_COUNTRY_CODE + digits
+    return digits or None
+
+
+CONTACT_KEY_NORMALIZERS = {
+    "email": normalize_text_key,
+    "discord": normalize_text_key,
+    "phone": normalize_phone_key,
+}
+
+
+def find_duplicate_groups():
+    """
+    Groups of people sharing a contact key, oldest person first.
+
+    Returns a list of (people ids, {person id: matched key names}).
+    """
+    parent = {}
+
+    def root(person_id):
+        parent.setdefault(person_id, person_id)
+        while parent[person_id] != person_id:
+            parent[person_id] = parent[parent[person_id]]
+            person_id = parent[person_id]
+        return person_id
+
+    matched_on = {}
+    for key in CONTACT_KEYS.values():
+        blocks = (
+            Person.objects.filter(**{f"{key}__isnull": False})
+            .values(key)
+            .annotate(size=Count("id"), ids=ArrayAgg("id"))
+            .filter(size__gt=1)
+            .values_list("ids", flat=True)
+        )
+        for ids in blocks.iterator():
+            for person_id in ids:
+                matched_on.setdefault(person_id, []).append(key)
+                parent[root(person_id)] = root(ids[0])
+
+    groups = {}
+    for person_id in parent:
+        groups.setdefault(root(person_id), []).append(person_id)
+
+    created = dict(
+        Person.objects.filter(id__in=parent).values_list("id", "created_at"),
+    )
+    return [
+        (
+            sorted(ids, key=lambda person_id: (created[person_id], str(person_id))),
+            {person_id: matched_on[person_id] for person_id in ids},
+        )
+        for ids in groups.values()
+    ]
+
+
+@transaction.atomic
+def refresh_person_duplicates():
+    """
+    Replace the PersonDuplicate rows with the current duplicate groups.
+
+    Returns the number of duplicates found.
+    """
+    duplicates = [
+        PersonDuplicate(
+            person_id=person_id,
+            duplicate_of_id=ids[0],
+            matched_on=matched_on[person_id],
+        )
+        for ids, matched_on in find_duplicate_groups()
+        for person_id in ids[1:]
+    ]
+    PersonDuplicate.objects.all().delete()
+    PersonDuplicate.objects.bulk_create(duplicates, batch_size=1000)
+    return len(duplicates)
+
+
+def _repoint(model, duplicate, person, unique_field):
+    """
+    Move the `model` rows of `duplicate` to `person`, dropping those that
+    would repeat one of `person`'s rows on `unique_field`.
+    """
+    rows = model.objects.filter(person=duplicate)
+    rows.filter(
+        Exists(
+            model.objects.filter(
+                person=person,
+                **{unique_field: OuterRef(unique_field)},
+            ),
+        ),
+    ).delete()
+    return rows.update(person=person)
+
+
+def _repoint_tickets(duplicate, person):
+    """
+    Move the tickets of `duplicate` to `person` with their dedup keys
+    recomputed.
+
+    Generated tickets `person` already has are dropped while still open and
+    unassigned; tickets that were worked on are kept, without a dedup key.
+    """
+    tickets = list(
+        Ticket.objects.filter(person=duplicate).only(
+            "template",
+            "org",
+            "person",
+            "event",
+            "shift",
+            "dedup_key",
+            "status",
+            "assigned_to",
+        ),
+    )
+    for ticket in tickets:
+        ticket.person = person
+        ticket.dedup_key = ticket.compute_dedup_key()
+
+    existing = set(
+        Ticket.objects.filter(
+            dedup_key__in=[ticket.dedup_key for ticket in tickets if ticket.dedup_key],
+        ).values_list("dedup_key", flat=True),
+    )
+    dropped = []
+    moved = []
+    for ticket in tickets:
+        if ticket.dedup_key in existing:
+            if ticket.status == TicketStatus.OPEN and ticket.assigned_to_id is None:
+                dropped.append(ticket.pk)
+                continue
+            ticket.dedup_key = None
+        moved.append(ticket)
+
+    Ticket.objects.filter(pk__in=dropped).delete()
+    Ticket.objects.bulk_update(moved, ["person", "dedup_key"], batch_size=1000)
+
+
+@transaction.atomic
+def merge_people(person, duplicates):
+    """
+    Merge `duplicates` into `person` and delete them.
+
+    Shift assignments, org links, taggings and tickets are moved with one
+    UPDATE per table and duplicate; rows `person` already has (same shift,
+    org or tag) are kept over the duplicate's, as are generated tickets
+    unless the duplicate's was worked on (see _repoint_tickets). Blank
+    contact and address fields of `person` are filled from the duplicates,
+    oldest first.
+    """
+    duplicates = sorted(
+        (dup for dup in duplicates if dup.pk != person.pk),
+        key=lambda dup: dup.created_at,
+    )
+    if not duplicates:
+        return person
+
+    for duplicate in duplicates:
+        # An org link active on either side stays active
+        PersonOrganization.objects.filter(
+            person=person,
+            is_active=False,
+            org__in=duplicate.org_links.filter(is_active=True).values("org"),
+        ).update(is_active=True)
+
+        _repoint(ShiftAssignment, duplicate, person, "shift")
+        _repoint(PersonOrganization, duplicate, person, "org")
+        _repoint(PersonTagging, duplicate, person, "tag")
+        _repoint_tickets(duplicate, person)
+
+    for field in MERGE_FILL_FIELDS:
+        if not getattr(person, field):
+            values = (getattr(dup, field) for dup in duplicates)
+            setattr(person, field, next((value for value in values if value), ""))
+
+    attributes = {}
+    for duplicate in reversed(duplicates):
+        attributes.update(duplicate.attributes)
+    person.attributes = {**attributes, **person.attributes}
+    person.save()
+
+    Person.objects.filter(pk__in=[dup.pk for dup in duplicates]).delete()
+    # The updates above send no model signals
+    invalidate_person_search()
+    return person
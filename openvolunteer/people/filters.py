@@ -1,39 +1,36 @@
+from django.db.models import Q
+from django.db.models import Value
+from django.db.models.functions import Coalesce
+from django.db.models.functions import Concat
+
+from openvolunteer.core.choices import ChoiceProvider
 from openvolunteer.orgs.models import Organization
+from openvolunteer.orgs.queryset import orgs_for_user
 
 from .models import PersonTag
+from .search import search_people as search_people_text
+
+# Org tags and global tags, labelled like PersonTag.__str__
+PERSON_TAG_CHOICES = ChoiceProvider(
+    "people.tag",
+    PersonTag,
+    lambda request: PersonTag.objects.filter(
+        Q(org__in=orgs_for_user(request.user)) | Q(org__isnull=True),
+    ),
+    label=Concat(
+        "name",
+        Value(" ("),
+        Coalesce("org__name", Value("Global")),
+        Value(")"),
+    ),
+)
 
 
 def search_people(qs, request, value):
     """
-    Search across multiple person identity fields.
+    Search across person identity fields and tags, ranked by similarity.
     """
-    return (
-        qs.filter(
-            full_name__icontains=value,
-        )
-        | qs.filter(
-            email__icontains=value,
-        )
-        | qs.filter(
-            discord__icontains=value,
-        )
-        | qs.filter(
-            phone__icontains=value,
-        )
-    )
-
-
-def filter_by_org(qs, request, value):
-    return qs.filter(
-        org_links__org_id=value,
-        org_links__is_active=True,
-    )
-
-
-def filter_by_tag(qs, request, value):
-    return qs.filter(
-        taggings__tag_id=value,
-    )
+    return search_people_text(qs, value)
 
 
 def filter_has_discord(qs, request, value):
@@ -55,22 +52,22 @@ PERSON_FILTERS = [
         "name": "org",
         "label": "Organization",
         "type": "select",
-        "filter": filter_by_org,
-        "choices": lambda request: Organization.objects.filter(
-            memberships__user=request.user,
-        )
-        .distinct()
-        .values_list("id", "name"),
+        "relation": "org_links",
+        "relation_filter": {"is_active": True},
+        "lookup": "org_id",
+        "choices": ChoiceProvider(
+            "people.org",
+            Organization,
+            lambda request: orgs_for_user(request.user),
+        ),
     },
     {
         "name": "tag",
         "label": "Tag",
         "type": "select",
-        "filter": filter_by_tag,
-        "choices": lambda request: PersonTag.objects.filter(
-            org__in=request.user.memberships.values("org"),
-        )
-        | PersonTag.objects.filter(org__isnull=True),
+        "relation": "taggings",
+        "lookup": "tag_id",
+        "choices": PERSON_TAG_CHOICES,
     },
     {
         "name": "has_discord",
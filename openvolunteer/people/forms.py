@@ -1,12 +1,15 @@
 from django import forms
+from django.db.models import Q
 
 from openvolunteer.orgs.models import Organization
+from openvolunteer.orgs.permissions import permission_context
 from openvolunteer.orgs.permissions import user_can_manage_people
 from openvolunteer.people.models import PersonOrganization
 from openvolunteer.people.models import PersonTagging
 
 from .models import Person
 from .models import PersonTag
+from .permissions import PERSON_EDIT_ROLES
 
 
 class PersonForm(forms.ModelForm):
@@ -148,6 +151,54 @@ class PersonOrgAssignForm(forms.Form):
     )
 
 
+class PersonBulkUpdateForm(forms.Form):
+    """
+    Tags and orgs to add to or remove from many people at once, limited to
+    the tags and orgs the user may use.
+    """
+
+    add_tags = forms.ModelMultipleChoiceField(
+        queryset=PersonTag.objects.none(),
+        required=False,
+    )
+    remove_tags = forms.ModelMultipleChoiceField(
+        queryset=PersonTag.objects.none(),
+        required=False,
+    )
+    add_orgs = forms.ModelMultipleChoiceField(
+        queryset=Organization.objects.none(),
+        required=False,
+    )
+    remove_orgs = forms.ModelMultipleChoiceField(
+        queryset=Organization.objects.none(),
+        required=False,
+    )
+
+    def __init__(self, *args, user, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        tags = PersonTag.objects.order_by("name")
+        orgs = Organization.objects.order_by("name")
+        if not (user.is_staff or user.is_superuser):
+            org_ids = permission_context(user).org_ids(PERSON_EDIT_ROLES)
+            tags = tags.filter(Q(org__isnull=True) | Q(org__in=org_ids))
+            orgs = orgs.filter(id__in=org_ids)
+
+        for name in ("add_tags", "remove_tags"):
+            self.fields[name].queryset = tags
+        for name in ("add_orgs", "remove_orgs"):
+            self.fields[name].queryset = orgs
+        for field in self.fields.values():
+            field.widget.attrs["class"] = "form-select"
+
+    def clean(self):
+        cleaned_data = super().clean()
+        if not any(cleaned_data.get(name) for name in self.fields):
+            msg = "Choose tags or organizations to add or remove."
+            raise forms.ValidationError(msg)
+        return cleaned_data
+
+
 class PersonCSVUploadForm(forms.Form):
     csv_file = forms.FileField(
         help_text="Upload a CSV file with people data",
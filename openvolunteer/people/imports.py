@@ -0,0 +1,305 @@
+"""
+Streaming CSV import of people.
+
+The upload is read row by row. The normalized contact keys of existing people
+(see people.dedup) are loaded into sets once, orgs and tags are resolved once
+per name, and people, org links and taggings are inserted with bulk_create in
+chunks that commit on their own. Rows that are skipped are reported with their line
+number. Large files are imported by a PersonImportJob in a worker.
+"""
+
+import csv
+import io
+from contextlib import contextmanager
+
+from django.core.exceptions import ValidationError
+from django.core.validators import validate_email
+from django.db import transaction
+from django.utils import timezone
+
+from openvolunteer.orgs.models import Organization
+from openvolunteer.orgs.permissions import user_can_manage_people
+
+from .cache import invalidate_person_search
+from .dedup import CONTACT_KEY_NORMALIZERS
+from .dedup import CONTACT_KEYS
+from .models import Person
+from .models import PersonImportJobStatus
+from .models import PersonOrganization
+from .models import PersonTag
+from .models import PersonTagging
+from .resolvers import person_tag_resolver
+
+IMPORT_CHUNK_SIZE = 1000
+
+# Errors kept per import; further skipped rows are only counted
+MAX_IMPORT_ERRORS = 500
+
+REQUIRED_COLUMNS = {"full_name"}
+DEDUP_FIELDS = ("email", "discord", "phone")
+LIST_SEPARATOR = "|"
+
+
+@contextmanager
+def csv_rows(fileobj):
+    """
+    DictReader over the binary file `fileobj`, decoded as it is read.
+
+    `fileobj` is left open, at the position the reader stopped.
+    """
+    text = io.TextIOWrapper(fileobj, encoding="utf-8-sig", newline="")
+    try:
+        reader = csv.DictReader(text)
+        missing = REQUIRED_COLUMNS - set(reader.fieldnames or ())
+        if missing:
+            msg = f"The CSV is missing the column(s): {', '.join(sorted(missing))}"
+            raise ValueError(msg)
+        yield reader
+    finally:
+        # Closing the wrapper would close the upload
+        text.detach()
+
+
+def count_csv_rows(fileobj):
+    """
+    Number of data rows of the CSV `fileobj`, which is rewound afterwards.
+    """
+    try:
+        with csv_rows(fileobj) as rows:
+            return sum(1 for _ in rows)
+    finally:
+        fileobj.seek(0)
+
+
+def _cell(row, column):
+    # Short rows have None for the missing cells
+    return (row.get(column) or "").strip()
+
+
+def _names(row, column):
+    names = (name.strip() for name in _cell(row, column).split(LIST_SEPARATOR))
+    return [name for name in names if name]
+
+
+class PersonImporter:
+    """
+    Imports people for `user` from the rows of csv_rows().
+
+    `on_progress(importer)` is called after every committed chunk.
+    """
+
+    def __init__(self, user, *, chunk_size=IMPORT_CHUNK_SIZE, on_progress=None):
+        self.user = user
+        self.chunk_size = chunk_size
+        self.on_progress = on_progress
+
+        self.processed = 0
+        self.created = 0
+        self.skipped = 0
+        self.errors = []
+
+        self.orgs = {
+            org.name: org
+            for org in Organization.objects.all()
+            if user_can_manage_people(user, org)
+        }
+        # Normalized contact keys, so "+1 (555) 123-4567" matches "5551234567"
+        self.seen = {
+            field: set(
+                Person.objects.filter(**{f"{key}__isnull": False})
+                .values_list(key, flat=True)
+                .iterator(),
+            )
+            for field, key in CONTACT_KEYS.items()
+        }
+        self.tags = {}
+        self.max_lengths = {
+            field: Person._meta.get_field(field).max_length  # noqa: SLF001
+            for field in ("full_name", *DEDUP_FIELDS)
+        }
+
+    def skip(self, line, message):
+        self.skipped += 1
+        if len(self.errors) < MAX_IMPORT_ERRORS:
+            self.errors.append(f"Row {line}: {message}")
+
+    def validate(self, values):
+        """
+        Why the person of a row is skipped, or None to import it.
+        """
+        if not values["full_name"]:
+            return "missing full_name"
+
+        for field, max_length in self.max_lengths.items():
+            if len(values[field]) > max_length:
+                return f"{field} is longer than {max_length} characters"
+
+        if values["email"]:
+            try:
+                validate_email(values["email"])
+            except ValidationError:
+                return f"invalid email {values['email']!r}"
+
+        for field, key in self.contact_keys(values).items():
+            if key in self.seen[field]:
+                return f"a person with {field} {values[field]!r} already exists"
+        return None
+
+    def contact_keys(self, values):
+        keys = {
+            field: CONTACT_KEY_NORMALIZERS[field](values[field])
+            for field in DEDUP_FIELDS
+        }
+        return {field: key for field, key in keys.items() if key}
+
+    def validate_links(self, org_names, tag_names):
+        """
+        Why the orgs or tags of a row are rejected, or None.
+        """
+        unknown = [name for name in org_names if name not in self.orgs]
+        if unknown:
+            return f"unknown org or no permission: {', '.join(unknown)}"
+
+        long_tags = [
+            name
+            for name in tag_names
+            if len(name) > PersonTag._meta.get_field("name").max_length  # noqa: SLF001
+        ]
+        if long_tags:
+            return f"tag name too long: {', '.join(long_tags)}"
+        return None
+
+    def run(self, rows):
+        chunk = []
+        for row in rows:
+            self.processed += 1
+            # Quoted cells can span lines; report where the row ends
+            line = rows.line_num
+            values = {
+                field: _cell(row, field) for field in ("full_name", *DEDUP_FIELDS)
+            }
+            org_names = _names(row, "orgs")
+            tag_names = _names(row, "tags")
+
+            error = self.validate(values) or self.validate_links(org_names, tag_names)
+            if error:
+                self.skip(line, error)
+                continue
+
+            # Later rows are deduplicated against this one too
+            for field, key in self.contact_keys(values).items():
+                self.seen[field].add(key)
+
+            chunk.append((Person(**values), org_names, tag_names))
+            if len(chunk) >= self.chunk_size:
+                self.save_chunk(chunk)
+                chunk = []
+
+        self.save_chunk(chunk)
+        return self
+
+    def resolve_tags(self, names):
+        """
+        Global tags by name, created once when missing.
+        """
+        missing = set(names) - self.tags.keys()
+        if not missing:
+            return
+        for tag in PersonTag.objects.filter(org__isnull=True, name__in=missing):
+            self.tags.setdefault(tag.name, tag)
+        created = PersonTag.objects.bulk_create(
+            [
+                PersonTag(name=name, org=None)
+                for name in sorted(missing - self.tags.keys())
+            ],
+        )
+        self.tags.update((tag.name, tag) for tag in created)
+        if created:
+            # bulk_create sends no post_save signals
+            person_tag_resolver.invalidate_on_commit()
+
+    @transaction.atomic
+    def save_chunk(self, chunk):
+        if chunk:
+            self.resolve_tags(name for _, _, tag_names in chunk for name in tag_names)
+
+            people = Person.objects.bulk_create([person for person, _, _ in chunk])
+            PersonOrganization.objects.bulk_create(
+                [
+                    PersonOrganization(person=person, org=self.orgs[name])
+                    for person, (_, org_names, _) in zip(people, chunk, strict=True)
+                    for name in set(org_names)
+                ],
+                ignore_conflicts=True,
+            )
+            PersonTagging.objects.bulk_create(
+                [
+                    PersonTagging(person=person, tag=self.tags[name])
+                    for person, (_, _, tag_names) in zip(people, chunk, strict=True)
+                    for name in set(tag_names)
+                ],
+                ignore_conflicts=True,
+            )
+            self.created += len(people)
+            # bulk_create sends no post_save signals
+            invalidate_person_search()
+
+        if self.on_progress:
+            self.on_progress(self)
+
+
+def import_people_csv(user, fileobj, *, chunk_size=IMPORT_CHUNK_SIZE):
+    """
+    Import people from the binary CSV file `fileobj` in the request.
+
+    Returns the PersonImporter, with its created/skipped counts and errors.
+    """
+    with csv_rows(fileobj) as rows:
+        return PersonImporter(user, chunk_size=chunk_size).run(rows)
+
+
+def run_person_import_job(job, chunk_size=IMPORT_CHUNK_SIZE):
+    """
+    Execute a PersonImportJob, saving its progress after every chunk.
+    """
+    job.status = PersonImportJobStatus.RUNNING
+    job.started_at = timezone.now()
+    job.save(update_fields=["status", "started_at"])
+
+    def on_progress(importer):
+        job.processed = importer.processed
+        job.created_count = importer.created
+        job.skipped_count = importer.skipped
+        job.errors = importer.errors
+        job.save(
+            update_fields=["processed", "created_count", "skipped_count", "errors"],
+        )
+
+    importer = None
+    try:
+        importer = PersonImporter(
+            job.created_by,
+            chunk_size=chunk_size,
+            on_progress=on_progress,
+        )
+        with job.file.open("rb") as fileobj:
+            job.total = count_csv_rows(fileobj)
+            job.save(update_fields=["total"])
+            with csv_rows(fileobj) as rows:
+                importer.run(rows)
+    except Exception as exc:
+        job.file.delete(save=False)
+        job.status = PersonImportJobStatus.FAILED
+        job.errors = [*(importer.errors if importer else []), str(exc)]
+        job.finished_at = timezone.now()
+        job.save(update_fields=["file", "status", "errors", "finished_at"])
+        if not isinstance(exc, ValueError):
+            raise
+        return job
+
+    # The upload holds personal data and media is served publicly
+    job.file.delete(save=False)
+    job.status = PersonImportJobStatus.COMPLETED
+    job.finished_at = timezone.now()
+    job.save(update_fields=["file", "status", "finished_at"])
+    return job
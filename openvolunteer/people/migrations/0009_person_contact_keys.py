@@ -0,0 +1,70 @@
+# Generated by Django 5.2.9 on 2026-10-17 01:25
+
+import django.db.models.deletion
+import django.db.models.functions.comparison
+import django.db.models.functions.text
+import django.db.models.lookups
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('people', '0008_personimportjob'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PersonDuplicate',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('matched_on', models.JSONField(blank=True, default=list, help_text='Contact keys shared with other people of the group')),
+                ('detected_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'ordering': ['-detected_at'],
+            },
+        ),
+        migrations.AddField(
+            model_name='person',
+            name='discord_key',
+            field=models.GeneratedField(db_persist=True, expression=django.db.models.functions.comparison.NullIf(django.db.models.functions.text.Lower(django.db.models.functions.text.Trim('discord')), models.Value(''), output_field=models.TextField()), output_field=models.TextField()),
+        ),
+        migrations.AddField(
+            model_name='person',
+            name='email_key',
+            field=models.GeneratedField(db_persist=True, expression=django.db.models.functions.comparison.NullIf(django.db.models.functions.text.Lower(django.db.models.functions.text.Trim('email')), models.Value(''), output_field=models.TextField()), output_field=models.TextField()),
+        ),
+        migrations.AddField(
+            model_name='person',
+            name='phone_key',
+            field=models.GeneratedField(db_persist=True, expression=django.db.models.functions.comparison.NullIf(models.Case(models.When(django.db.models.lookups.Exact(django.db.models.functions.text.Length(models.Func('phone', models.Value('\\D'), models.Value(''), models.Value('g'), function='REGEXP_REPLACE', output_field=models.TextField())), 10), then=django.db.models.functions.text.Concat(models.Value('1'), models.Func('phone', models.Value('\\D'), models.Value(''), models.Value('g'), function='REGEXP_REPLACE', output_field=models.TextField()), output_field=models.TextField())), default=models.Func('phone', models.Value('\\D'), models.Value(''), models.Value('g'), function='REGEXP_REPLACE', output_field=models.TextField()), output_field=models.TextField()), models.Value(''), output_field=models.TextField()), output_field=models.TextField()),
+        ),
+        migrations.AddIndex(
+            model_name='person',
+            index=models.Index(fields=['email_key'], name='people_pers_email_k_355083_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='person',
+            index=models.Index(fields=['discord_key'], name='people_pers_discord_6a3a4f_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='person',
+            index=models.Index(fields=['phone_key'], name='people_pers_phone_k_13afed_idx'),
+        ),
+        migrations.AddField(
+            model_name='personduplicate',
+            name='duplicate_of',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='duplicates', to='people.person'),
+        ),
+        migrations.AddField(
+            model_name='personduplicate',
+            name='person',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='duplicates_of', to='people.person'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='personduplicate',
+            unique_together={('person', 'duplicate_of')},
+        ),
+    ]
@@ -2,10 +2,61 @@
 # people/models.py
 import uuid
 
+from django.conf import settings
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.indexes import OpClass
 from django.db import models
+from django.db.models.functions import Concat
+from django.db.models.functions import Length
+from django.db.models.functions import Lower
+from django.db.models.functions import NullIf
+from django.db.models.functions import Trim
+from django.db.models.functions import Upper
+from django.db.models.lookups import Exact
 
 from openvolunteer.orgs.models import Organization
 
+# Phone numbers with this many digits are national numbers, which get the
+# default country calling code prepended in Person.phone_key
+NATIONAL_PHONE_DIGITS = 10
+DEFAULT_PHONE_COUNTRY_CODE = "1"
+
+
+def _text_key(field):
+    # NULL rather than "" so blank values never match each other
+    return NullIf(
+        Lower(Trim(field)),
+        models.Value(""),
+        output_field=models.TextField(),
+    )
+
+
+def _phone_key(field):
+    digits = models.Func(
+        field,
+        models.Value(r"\D"),
+        models.Value(""),
+        models.Value("g"),
+        function="REGEXP_REPLACE",
+        output_field=models.TextField(),
+    )
+    return NullIf(
+        models.Case(
+            models.When(
+                Exact(Length(digits), NATIONAL_PHONE_DIGITS),
+                then=Concat(
+                    models.Value(DEFAULT_PHONE_COUNTRY_CODE),
+                    digits,
+                    output_field=models.TextField(),
+                ),
+            ),
+            default=digits,
+            output_field=models.TextField(),
+        ),
+        models.Value(""),
+        output_field=models.TextField(),
+    )
+
 
 class Person(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
@@ -26,11 +77,65 @@ class Person(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    # Lowercased identity fields (and the phone digits) for trigram search.
+    # Generated by the database, so bulk writes keep it up to date too
+    search_text = models.GeneratedField(
+        expression=Lower(
+            Concat(
+                "full_name",
+                models.Value(" "),
+                "email",
+                models.Value(" "),
+                "discord",
+                models.Value(" "),
+                "phone",
+                models.Value(" "),
+                models.Func(
+                    "phone",
+                    models.Value(r"\D"),
+                    models.Value(""),
+                    models.Value("g"),
+                    function="REGEXP_REPLACE",
+                ),
+                output_field=models.TextField(),
+            ),
+        ),
+        output_field=models.TextField(),
+        db_persist=True,
+    )
+
+    # Normalized contact details that identify a person, for deduplication:
+    # lowercased email and Discord handle, and the phone number's digits with
+    # a country code. Generated by the database like search_text, so bulk
+    # writes keep them up to date too (see people.dedup for the Python side)
+    email_key = models.GeneratedField(
+        expression=_text_key("email"),
+        output_field=models.TextField(),
+        db_persist=True,
+    )
+    discord_key = models.GeneratedField(
+        expression=_text_key("discord"),
+        output_field=models.TextField(),
+        db_persist=True,
+    )
+    phone_key = models.GeneratedField(
+        expression=_phone_key("phone"),
+        output_field=models.TextField(),
+        db_persist=True,
+    )
+
     class Meta:
         indexes = [
             models.Index(fields=["full_name"]),
             models.Index(fields=["email"]),
             models.Index(fields=["phone"]),
+            models.Index(fields=["email_key"]),
+            models.Index(fields=["discord_key"]),
+            models.Index(fields=["phone_key"]),
+            GinIndex(
+                OpClass("search_text", name="gin_trgm_ops"),
+                name="people_person_search_trgm",
+            ),
         ]
 
     def __str__(self):
@@ -98,6 +203,13 @@ class PersonTag(models.Model):
 
     class Meta:
         unique_together = [("org", "name")]  # still unique per org, NULLs can repeat
+        indexes = [
+            # name__icontains compares UPPER(name)
+            GinIndex(
+                OpClass(Upper("name"), name="gin_trgm_ops"),
+                name="people_persontag_name_trgm",
+            ),
+        ]
 
     def __str__(self):
         if self.org:
@@ -150,3 +262,109 @@ class PersonTagging(models.Model):
         if self.tag.org:
             return f"{self.tag.name} ({self.tag.org.name})"
         return f"{self.tag.name} (Global)"
+
+
+class PersonImportJobStatus(models.TextChoices):
+    PENDING = "pending", "Pending"
+    RUNNING = "running", "Running"
+    COMPLETED = "completed", "Completed"
+    FAILED = "failed", "Failed"
+
+
+def person_import_upload_to(instance, filename):
+    # Not guessable from the public media URL; deleted once imported
+    return f"person-imports/{uuid.uuid4().hex}.csv"
+
+
+class PersonImportJob(models.Model):
+    """
+    Background import of a people CSV that is too large for the request.
+
+    Tracks state, progress and skipped rows so the UI can poll while a worker
+    imports.
+    """
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+
+    file = models.FileField(upload_to=person_import_upload_to, blank=True)
+    file_name = models.CharField(max_length=255, blank=True)
+
+    status = models.CharField(
+        max_length=20,
+        choices=PersonImportJobStatus,
+        default=PersonImportJobStatus.PENDING,
+    )
+
+    total = models.PositiveIntegerField(default=0)
+    processed = models.PositiveIntegerField(default=0)
+    created_count = models.PositiveIntegerField(default=0)
+    skipped_count = models.PositiveIntegerField(default=0)
+    errors = models.JSONField(default=list, blank=True)
+
+    created_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        null=True,
+        blank=True,
+        on_delete=models.SET_NULL,
+        related_name="person_import_jobs",
+    )
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ["-created_at"]
+
+    def __str__(self):
+        return f"{self.file_name} ({self.get_status_display()})"
+
+    @property
+    def is_finished(self):
+        return self.status in {
+            PersonImportJobStatus.COMPLETED,
+            PersonImportJobStatus.FAILED,
+        }
+
+    @property
+    def progress_percent(self):
+        if not self.total:
+            return 100 if self.is_finished else 0
+        return min(100, int(self.processed * 100 / self.total))
+
+
+class PersonDuplicate(models.Model):
+    """
+    A person who shares contact keys with an older person, found by the
+    duplicate detector (see people.dedup). Merging folds `person` into
+    `duplicate_of`.
+    """
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+
+    person = models.ForeignKey(
+        Person,
+        on_delete=models.CASCADE,
+        related_name="duplicates_of",
+    )
+
+    duplicate_of = models.ForeignKey(
+        Person,
+        on_delete=models.CASCADE,
+        related_name="duplicates",
+    )
+
+    matched_on = models.JSONField(
+        default=list,
+        blank=True,
+        help_text="Contact keys shared with other people of the group",
+    )
+
+    detected_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ["-detected_at"]
+        unique_together = [("person", "duplicate_of")]
+
+    def __str__(self):
+        return f"{self.person} -> {self.duplicate_of}"
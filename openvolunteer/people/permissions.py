@@ -1,4 +1,16 @@
 # people/permissions.py
+from openvolunteer.core.filters import relation_exists
+from openvolunteer.orgs.models import OrgRole
+from openvolunteer.orgs.permissions import permission_context
+
+from .models import Person
+
+PERSON_EDIT_ROLES = {OrgRole.OWNER, OrgRole.ADMIN, OrgRole.ORGANIZER}
+
+
+def _person_org_ids(person):
+    # Honours org_links prefetched by the caller
+    return {link.org_id for link in person.org_links.all() if link.is_active}
 
 
 def user_can_view_person(user, person) -> bool:
@@ -8,11 +20,7 @@ def user_can_view_person(user, person) -> bool:
     if user.is_staff or user.is_superuser:
         return True
 
-    return person.org_links.filter(
-        org__memberships__user=user,
-        org__memberships__is_active=True,
-        is_active=True,
-    ).exists()
+    return bool(_person_org_ids(person) & permission_context(user).org_ids())
 
 
 def user_can_edit_person(user, person) -> bool:
@@ -22,16 +30,9 @@ def user_can_edit_person(user, person) -> bool:
     if user.is_staff or user.is_superuser:
         return True
 
-    return person.org_links.filter(
-        org__memberships__user=user,
-        org__memberships__role__in=[
-            "owner",
-            "admin",
-            "organizer",
-        ],
-        org__memberships__is_active=True,
-        is_active=True,
-    ).exists()
+    return bool(
+        _person_org_ids(person) & permission_context(user).org_ids(PERSON_EDIT_ROLES),
+    )
 
 
 def user_can_create_person(user) -> bool:
@@ -40,3 +41,31 @@ def user_can_create_person(user) -> bool:
 
     # Superusers / staff can always create
     return user.is_staff or user.is_superuser
+
+
+def user_can_bulk_edit_people(user) -> bool:
+    if not user.is_authenticated:
+        return False
+
+    if user.is_staff or user.is_superuser:
+        return True
+
+    return bool(permission_context(user).org_ids(PERSON_EDIT_ROLES))
+
+
+def editable_people(user, people):
+    """
+    The people of the queryset `people` that `user` can edit, like
+    user_can_edit_person.
+    """
+    if user.is_staff or user.is_superuser:
+        return people
+
+    return people.filter(
+        relation_exists(
+            Person,
+            "org_links",
+            org_id__in=permission_context(user).org_ids(PERSON_EDIT_ROLES),
+            is_active=True,
+        ),
+    )
@@ -0,0 +1,6 @@
+from openvolunteer.core.org_preferred import OrgPreferredResolver
+
+from .models import PersonTag
+
+# Tag of an org, else the global tag of the same name; see core.org_preferred
+person_tag_resolver = OrgPreferredResolver(PersonTag)
@@ -0,0 +1,138 @@
+"""
+Trigram search over Person.search_text and tag names.
+"""
+
+import re
+
+from django.contrib.postgres.search import TrigramWordSimilarity
+from django.core.exceptions import BadRequest
+from django.db.models import Q
+
+from openvolunteer.core.filters import relation_exists
+from openvolunteer.orgs.queryset import orgs_for_user
+
+from .models import Person
+from .models import PersonTag
+
+# Phone searches also match the digits only, e.g. "(555) 010" -> "555010"
+MIN_PHONE_DIGITS = 3
+
+# Query parameters of person_search that narrow down the people
+PERSON_SEARCH_FILTERS = (
+    "q",
+    "org_id",
+    "exclude_org_id",
+    "tag_ids",
+    "event_id",
+    "participated_event_id",
+)
+
+
+def normalize_search_text(text):
+    """
+    Normalize `text` the way Person.search_text is.
+    """
+    return " ".join(text.lower().split())
+
+
+def search_people(queryset, text):
+    """
+    People of `queryset` whose name, email, discord, phone or tags contain
+    `text`, most similar first and otherwise in the queryset ordering.
+    Annotates `search_rank`.
+
+    The substring matches use the trigram indexes on Person.search_text and
+    PersonTag.name; tags are matched in their own subquery.
+    """
+    term = normalize_search_text(text)
+    match = Q(search_text__contains=term)
+
+    digits = re.sub(r"\D", "", term)
+    if len(digits) >= MIN_PHONE_DIGITS and digits != term:
+        match |= Q(search_text__contains=digits)
+
+    match |= relation_exists(
+        Person,
+        "taggings",
+        tag__in=PersonTag.objects.filter(name__icontains=term).values("id"),
+    )
+
+    return (
+        queryset.filter(match)
+        .annotate(search_rank=TrigramWordSimilarity(term, "search_text"))
+        .order_by("-search_rank", *queryset.query.order_by)
+    )
+
+
+def filter_people(user, filters):
+    """
+    People visible to `user` matching the person_search `filters`, a dict
+    keyed by PERSON_SEARCH_FILTERS (missing or empty values are ignored).
+
+    Relations are matched with EXISTS subqueries, so no DISTINCT is needed.
+    """
+    org_id = filters.get("org_id")
+    exclude_org_id = filters.get("exclude_org_id")
+    event_id = filters.get("event_id")
+    participated_event_id = filters.get("participated_event_id")
+
+    if exclude_org_id and exclude_org_id == org_id:
+        msg = "Exclude and include org IDs match"
+        raise BadRequest(msg)
+
+    if event_id and participated_event_id:
+        msg = "event_id and participated_event_id cannot be used together"
+        raise BadRequest(msg)
+
+    people = Person.objects.all()
+
+    # ---- Visibility scoping ----
+    if not (user.is_staff or user.is_superuser):
+        people = people.filter(
+            relation_exists(
+                Person,
+                "org_links",
+                org__in=orgs_for_user(user),
+                is_active=True,
+            ),
+        )
+
+    # ---- Org include / exclude ----
+    if org_id:
+        people = people.filter(
+            relation_exists(Person, "org_links", org_id=org_id, is_active=True),
+        )
+
+    if exclude_org_id:
+        people = people.exclude(
+            relation_exists(
+                Person,
+                "org_links",
+                org_id=exclude_org_id,
+                is_active=True,
+            ),
+        )
+
+    # ---- Tag filter (ANY of these tags) ----
+    tag_ids = [tid for tid in (filters.get("tag_ids") or "").split(",") if tid]
+    if tag_ids:
+        people = people.filter(relation_exists(Person, "taggings", tag_id__in=tag_ids))
+
+    # ---- Event participation ----
+    query_event_id = event_id or participated_event_id
+    if query_event_id:
+        people = people.filter(
+            relation_exists(
+                Person,
+                "shift_assignments",
+                shift__event_id=query_event_id,
+            ),
+        )
+
+    people = people.order_by("full_name")
+
+    # ---- Free text search ----
+    if filters.get("q"):
+        people = search_people(people, filters["q"])
+
+    return people
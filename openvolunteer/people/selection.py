@@ -0,0 +1,157 @@
+"""
+Server-side selection sets of people for bulk operations.
+
+Selecting "all matching people" used to send every matching id to the browser
+and back. Instead, person_search stores the filters under a short token; bulk
+endpoints resolve the token to the same queryset (with the visibility of the
+user submitting it) and insert from it with a single INSERT ... SELECT.
+"""
+
+import secrets
+from functools import reduce
+from operator import or_
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import BadRequest
+from django.db import connection
+from django.db.models import Q
+from django.db.models import UUIDField
+from django.utils import timezone
+
+from .cache import invalidate_person_search
+from .models import Person
+from .search import PERSON_SEARCH_FILTERS
+from .search import filter_people
+
+SELECTION_CACHE_PREFIX = "person-selection"
+
+
+def _selection_key(token):
+    return f"{SELECTION_CACHE_PREFIX}:{token}"
+
+
+async def acreate_selection(user, filters):
+    """
+    Store the person_search `filters` for `user` and return their token.
+    """
+    token = secrets.token_urlsafe(12)
+    stored = {
+        name: filters[name] for name in PERSON_SEARCH_FILTERS if filters.get(name)
+    }
+    await cache.aset(
+        _selection_key(token),
+        {"user_id": user.pk, "filters": stored},
+        settings.PERSON_SELECTION_TTL,
+    )
+    return token
+
+
+def resolve_selection(user, token):
+    """
+    People of the selection `token`, or None if it expired or belongs to
+    another user.
+    """
+    selection = cache.get(_selection_key(token))
+    if selection is None or selection["user_id"] != user.pk:
+        return None
+    return filter_people(user, selection["filters"])
+
+
+def selected_people(user, tokens):
+    """
+    People in any of the selections `tokens`, or None if there are none.
+
+    Raises BadRequest if a token is no longer valid, rather than silently
+    acting on fewer people than were selected.
+    """
+    selections = []
+    for token in tokens:
+        if not token:
+            continue
+        people = resolve_selection(user, token)
+        if people is None:
+            msg = "The selection has expired, please select the people again."
+            raise BadRequest(msg)
+        selections.append(people)
+
+    if not selections:
+        return None
+    if len(selections) == 1:
+        return selections[0]
+    return Person.objects.filter(
+        reduce(or_, (Q(id__in=people.values("id")) for people in selections)),
+    )
+
+
+def insert_for_people(model, people, *, person_field="person", **values):
+    """
+    Insert a `model` row for every person of `people` with one INSERT ...
+    SELECT, skipping rows that conflict with a unique constraint. Returns the
+    number of rows inserted.
+
+    `values` are the other columns by attname (e.g. shift_id=...). Columns
+    not given get their field default, or the current time for auto_now(_add)
+    fields. `model` must have a UUID primary key, generated by the database.
+    No model signals are sent; cached person_search results are invalidated.
+    """
+    opts = model._meta  # noqa: SLF001
+    now = timezone.now()
+
+    columns, selects, params = [], [], []
+    for field in opts.concrete_fields:
+        if field.generated:
+            continue
+        columns.append(connection.ops.quote_name(field.column))
+
+        if field.primary_key:
+            if not isinstance(field, UUIDField):
+                msg = f"{opts.label} does not have a UUID primary key"
+                raise TypeError(msg)
+            selects.append("gen_random_uuid()")
+            continue
+        if field.name == person_field:
+            selects.append("selection.id")
+            continue
+
+        if field.attname in values:
+            value = values.pop(field.attname)
+        elif getattr(field, "auto_now", False) or getattr(field, "auto_now_add", False):
+            value = now
+        else:
+            value = field.get_default()
+        selects.append("%s")
+        params.append(field.get_db_prep_save(value, connection))
+
+    if values:
+        msg = f"Unknown {opts.label} columns: {', '.join(values)}"
+        raise TypeError(msg)
+
+    select_sql, select_params = people.order_by().values("id").query.sql_with_params()
+    sql = (
+        f"INSERT INTO {connection.ops.quote_name(opts.db_table)} "  # noqa: S608
+        f"({', '.join(columns)}) "
+        f"SELECT {', '.join(selects)} FROM ({select_sql}) AS selection "
+        "ON CONFLICT DO NOTHING"
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(sql, [*params, *select_params])
+        inserted = cursor.rowcount
+    if inserted:
+        invalidate_person_search()
+    return inserted
+
+
+def delete_rows(queryset):
+    """
+    Delete the rows of `queryset` with a single DELETE. Returns the number of
+    deleted rows.
+
+    Unlike QuerySet.delete(), rows are not loaded to send model signals or to
+    cascade, so this is only for models nothing references, such as taggings
+    and org links. Cached person_search results are invalidated.
+    """
+    deleted = queryset._raw_delete(queryset.db)  # noqa: SLF001
+    if deleted:
+        invalidate_person_search()
+    return deleted
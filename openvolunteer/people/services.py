@@ -1,20 +1,13 @@
-import csv
-import io
-
 from django.db import transaction
-from django.db.models import Case
-from django.db.models import IntegerField
-from django.db.models import Q
-from django.db.models import Value
-from django.db.models import When
-
-from openvolunteer.orgs.models import Organization
-from openvolunteer.orgs.permissions import user_can_manage_people
 
+from .cache import invalidate_person_search
 from .models import Person
 from .models import PersonOrganization
 from .models import PersonTag
 from .models import PersonTagging
+from .resolvers import person_tag_resolver
+from .selection import delete_rows
+from .selection import insert_for_people
 
 
 @transaction.atomic
@@ -26,107 +19,95 @@ def create_person(*, data: dict) -> Person:
 
 @transaction.atomic
 def set_person_tags(*, person: Person, tag_names: list[str]) -> None:
-    PersonTagging.objects.filter(person=person).delete()
+    tags = [
+        PersonTag.objects.get_or_create(org=None, name=name.strip())[0]
+        for name in tag_names
+        if name.strip()
+    ]
+    bulk_update_tags(
+        Person.objects.filter(pk=person.pk),
+        add=tags,
+        remove=PersonTag.objects.exclude(pk__in=[tag.pk for tag in tags]),
+    )
 
-    for name in tag_names:
-        tag, _ = PersonTag.objects.get_or_create(
-            org=person.org,
-            name=name.strip(),
-        )
-        PersonTagging.objects.create(
-            person=person,
-            tag=tag,
+
+@transaction.atomic
+def bulk_update_tags(people, *, add=(), remove=None) -> dict:
+    """
+    Tag every person of the queryset `people` with the tags of `add` and
+    untag them from those of `remove` (a list or queryset of tags).
+
+    The diff is left to the database: each added tag is one INSERT ... SELECT
+    that skips people who already have it, and removal is one DELETE. Returns
+    the number of added and removed taggings.
+    """
+    added = sum(insert_for_people(PersonTagging, people, tag_id=tag.pk) for tag in add)
+    removed = 0
+    # Not `if remove`, which would load a queryset of tags or orgs
+    if remove is not None:
+        removed = delete_rows(
+            PersonTagging.objects.filter(
+                person__in=people.values("pk"),
+                tag__in=remove,
+            ),
         )
+    return {"added": added, "removed": removed}
 
 
 @transaction.atomic
-def handle_person_csv(user, uploaded_file):
-    decoded = uploaded_file.read().decode("utf-8-sig")
-    reader = csv.DictReader(io.StringIO(decoded))
-
-    allowed_orgs = {
-        org.name: org
-        for org in Organization.objects.all()
-        if user_can_manage_people(user, org)
-    }
-
-    created = 0
-    skipped = 0
-
-    for row in reader:
-        full_name = (row.get("full_name") or "").strip()
-        if not full_name:
-            skipped += 1
-            continue
-
-        email = (row.get("email") or "").strip()
-        # de-dupe by email
-        if email and Person.objects.filter(email=email).exists():
-            skipped += 1
-            continue
-
-        discord = (row.get("discord") or "").strip()
-        # de-dupe by Discord
-        if discord and Person.objects.filter(discord=discord).exists():
-            skipped += 1
-            continue
-
-        phone = (row.get("phone") or "").strip()
-        # de-dupe by Phone Number
-        if phone and Person.objects.filter(phone=phone).exists():
-            skipped += 1
-            continue
-
-        person = Person.objects.create(
-            full_name=full_name,
-            email=email,
-            phone=row.get("phone", "").strip(),
-            discord=row.get("discord", "").strip(),
+def bulk_update_orgs(people, *, add=(), remove=None) -> dict:
+    """
+    Link every person of the queryset `people` to the orgs of `add` and
+    unlink them from those of `remove`, like bulk_update_tags.
+
+    Inactive links to added orgs are reactivated. Returns the number of
+    added, reactivated and removed links.
+    """
+    reactivated = 0
+    if add:
+        reactivated = PersonOrganization.objects.filter(
+            person__in=people.values("pk"),
+            org__in=add,
+            is_active=False,
+        ).update(is_active=True)
+    added = sum(
+        insert_for_people(PersonOrganization, people, org_id=org.pk) for org in add
+    )
+    removed = 0
+    if remove is not None:
+        removed = delete_rows(
+            PersonOrganization.objects.filter(
+                person__in=people.values("pk"),
+                org__in=remove,
+            ),
         )
+    if reactivated:
+        invalidate_person_search()
+    return {"added": added, "reactivated": reactivated, "removed": removed}
+
+
+def bulk_update_summary(tags, orgs):
+    """
+    Message describing the counts of bulk_update_tags and bulk_update_orgs.
+    """
+    return (
+        f"Tags: {tags['added']} added, {tags['removed']} removed. "
+        f"Organizations: {orgs['added']} added, {orgs['reactivated']} "
+        f"reactivated, {orgs['removed']} removed."
+    )
 
-        # --- Organizations ---
-        org_names = row.get("orgs", "")
-        for name in [n.strip() for n in org_names.split("|") if n.strip()]:
-            org = allowed_orgs.get(name)
-            if org:
-                PersonOrganization.objects.get_or_create(
-                    person=person,
-                    org=org,
-                )
-
-        # --- Tags ---
-        tag_names = row.get("tags", "")
-        for name in [n.strip() for n in tag_names.split("|") if n.strip()]:
-            tag, _ = PersonTag.objects.get_or_create(
-                name=name,
-                org=None,  # global tag by default
-            )
-            PersonTagging.objects.get_or_create(
-                person=person,
-                tag=tag,
-            )
-
-        created += 1
-
-    return created, skipped
+
+def generate_tags_org_prefered(tag_names, org=None) -> dict:
+    """
+    {name: PersonTag} of `tag_names`, preferring the tags of `org` over the
+    global ones. Missing tags are created for `org` (global if None).
+    """
+    tags = person_tag_resolver.resolve_many(tag_names, org)
+    for tag_name in sorted(set(tag_names) - tags.keys()):
+        tags[tag_name] = PersonTag.objects.create(name=tag_name, org=org)
+    return tags
 
 
 # Gets/creates the tag, with preference to the org first
 def generate_tag_org_prefered(tag_name, org=None):
-    if org is None:
-        return PersonTag.objects.get_or_create(Q(name=tag_name) & Q(org__isnull=True))
-    tag = (
-        PersonTag.objects.filter(Q(name=tag_name) & (Q(org=org) | Q(org__isnull=True)))
-        .order_by(
-            Case(
-                When(org=org, then=Value(0)),
-                When(org__isnull=True, then=Value(1)),
-                output_field=IntegerField(),
-            ),
-        )
-        .first()
-    )
-    if tag:
-        return tag
-
-    return PersonTag.objects.create(name=tag_name, org=org)
+    return generate_tags_org_prefered([tag_name], org)[tag_name]
@@ -0,0 +1,26 @@
+from django.db.models.signals import post_delete
+from django.db.models.signals import post_save
+
+from openvolunteer.events.models import ShiftAssignment
+
+from .cache import invalidate_person_search
+from .models import Person
+from .models import PersonOrganization
+from .models import PersonTag
+from .models import PersonTagging
+
+# Models whose writes change person_search results
+SEARCH_MODELS = (Person, PersonTag, PersonTagging, PersonOrganization, ShiftAssignment)
+
+
+def invalidate_person_search_results(sender, **kwargs):
+    invalidate_person_search()
+
+
+for model in SEARCH_MODELS:
+    for name, signal in (("save", post_save), ("delete", post_delete)):
+        signal.connect(
+            invalidate_person_search_results,
+            sender=model,
+            dispatch_uid=f"person-search:{model._meta.label}:{name}",  # noqa: SLF001
+        )
@@ -0,0 +1,43 @@
+from celery import shared_task
+from django.db import transaction
+
+from .dedup import refresh_person_duplicates
+from .imports import run_person_import_job
+from .models import PersonImportJob
+
+
+@shared_task(bind=True, soft_time_limit=30 * 60, time_limit=35 * 60)
+def import_people_job(self, *, job_id: str) -> int:
+    """
+    Run a PersonImportJob in the background.
+
+    Returns the number of created people.
+    """
+    job = PersonImportJob.objects.select_related("created_by").get(id=job_id)
+
+    run_person_import_job(job)
+    return job.created_count
+
+
+@shared_task(bind=True)
+def detect_duplicate_people(self) -> int:
+    """
+    Refresh the PersonDuplicate candidates over all people, for review in the
+    admin. Meant to run periodically (see the django-celery-beat admin).
+
+    Returns the number of duplicates found.
+    """
+    return refresh_person_duplicates()
+
+
+def enqueue_person_import_job(*, uploaded_file, created_by):
+    """
+    Persist a PersonImportJob with its upload and start it once the
+    transaction commits.
+    """
+    job = PersonImportJob(file_name=uploaded_file.name, created_by=created_by)
+    job.file.save(uploaded_file.name, uploaded_file, save=False)
+    job.save()
+
+    transaction.on_commit(lambda: import_people_job.delay(job_id=str(job.id)))
+    return job
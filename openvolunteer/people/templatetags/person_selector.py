@@ -21,6 +21,8 @@ def person_selector(context, **kwargs):
     - org_id
     - exclude_org_id
     - placeholder
+    - bulk_selection: post bulk adds as server-side selections
+      (<input_name>_selection tokens) instead of person ids
     """
 
     org_id = kwargs.get("org_id")
@@ -0,0 +1,71 @@
+import pytest
+from django.urls import reverse
+
+from openvolunteer.orgs.models import Membership
+from openvolunteer.orgs.models import Organization
+from openvolunteer.orgs.models import OrgRole
+from openvolunteer.people.models import Person
+from openvolunteer.people.models import PersonOrganization
+from openvolunteer.people.models import PersonTag
+from openvolunteer.people.models import PersonTagging
+
+# ruff: noqa: PLR2004
+
+
+@pytest.mark.django_db
+def test_person_bulk_update(client, user):
+    org = Organization.objects.create(name="Org", slug="org")
+    viewed_org = Organization.objects.create(name="Viewed", slug="viewed")
+    Membership.objects.create(org=org, user=user, role=OrgRole.ORGANIZER)
+    Membership.objects.create(org=viewed_org, user=user, role=OrgRole.VOLUNTEER)
+    driver = PersonTag.objects.create(org=org, name="Driver")
+    old = PersonTag.objects.create(name="Old")
+    people = [Person.objects.create(full_name=f"Person {i}") for i in range(3)]
+    for person in people[:2]:
+        PersonOrganization.objects.create(person=person, org=org)
+    # Visible, but the user can not edit people of this org
+    PersonOrganization.objects.create(person=people[2], org=viewed_org)
+    PersonOrganization.objects.create(person=people[1], org=viewed_org)
+    for person in people:
+        PersonTagging.objects.create(person=person, tag=old)
+    PersonTagging.objects.create(person=people[0], tag=driver)
+    client.force_login(user)
+
+    response = client.post(
+        f"{reverse('people:person_bulk_update')}?q=person",
+        {
+            "scope": "all",
+            "add_tags": [driver.id],
+            "remove_tags": [old.id],
+            "add_orgs": [org.id],
+        },
+    )
+    assert response.status_code == 302
+    assert response["Location"] == f"{reverse('people:person_list')}?q=person"
+    assert set(PersonTagging.objects.values_list("person", "tag")) == {
+        (people[0].id, driver.id),
+        (people[1].id, driver.id),
+        (people[2].id, old.id),
+    }
+
+    # Only the checked people; orgs the user can not manage are rejected
+    client.post(
+        reverse("people:person_bulk_update"),
+        {"people": [people[0].id], "remove_orgs": [org.id]},
+    )
+    assert list(
+        PersonOrganization.objects.filter(org=org).values_list("person", flat=True),
+    ) == [people[1].id]
+    client.post(
+        reverse("people:person_bulk_update"),
+        {"people": [people[0].id], "remove_orgs": [viewed_org.id]},
+    )
+    assert PersonOrganization.objects.filter(org=viewed_org).count() == 2
+
+    # Tags of orgs the user can not edit people of are rejected too
+    viewed_tag = PersonTag.objects.create(org=viewed_org, name="Viewed")
+    client.post(
+        reverse("people:person_bulk_update"),
+        {"people": [people[1].id], "add_tags": [viewed_tag.id]},
+    )
+    assert not PersonTagging.objects.filter(tag=viewed_tag).exists()
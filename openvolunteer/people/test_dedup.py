@@ -0,0 +1,111 @@
+from datetime import timedelta
+
+import pytest
+from django.utils import timezone
+
+from openvolunteer.events.models import Event
+from openvolunteer.events.models import EventTemplate
+from openvolunteer.events.models import ShiftAssignment
+from openvolunteer.orgs.models import Organization
+from openvolunteer.people.dedup import merge_people
+from openvolunteer.people.models import Person
+from openvolunteer.people.models import PersonDuplicate
+from openvolunteer.people.models import PersonOrganization
+from openvolunteer.people.models import PersonTag
+from openvolunteer.people.models import PersonTagging
+from openvolunteer.people.tasks import detect_duplicate_people
+from openvolunteer.tickets.models import Ticket
+from openvolunteer.tickets.models import TicketStatus
+from openvolunteer.tickets.models import TicketTemplate
+
+# ruff: noqa: PLR2004
+
+
+@pytest.mark.django_db
+def test_duplicate_detection_and_merge():
+    org = Organization.objects.create(name="Org", slug="org")
+    tag = PersonTag.objects.create(org=org, name="Driver")
+    ann = Person.objects.create(full_name="Ann", phone="+1 (555) 123-4567")
+    # Same phone, and the same email as the next one
+    ann_phone = Person.objects.create(
+        full_name="Ann P",
+        phone="5551234567",
+        email="Ann@Example.com",
+        attributes={"source": "csv"},
+    )
+    ann_email = Person.objects.create(full_name="A", email=" ann@example.com ")
+    Person.objects.create(full_name="Bob", phone="555 000 1111", email="")
+    ann_phone.refresh_from_db()
+    assert (ann_phone.phone_key, ann_phone.email_key) == (
+        "15551234567",
+        "ann@example.com",
+    )
+
+    assert detect_duplicate_people() == 2
+    duplicates = PersonDuplicate.objects.order_by("person__created_at")
+    assert [(d.person, d.duplicate_of) for d in duplicates] == [
+        (ann_phone, ann),
+        (ann_email, ann),
+    ]
+    assert duplicates[0].matched_on == ["email_key", "phone_key"]
+
+    starts_at = timezone.now() + timedelta(days=1)
+    event = Event.objects.create(
+        org=org,
+        title="Canvass",
+        template=EventTemplate.objects.create(org=org, name="Canvass"),
+        starts_at=starts_at,
+        ends_at=starts_at + timedelta(hours=2),
+    )
+    shift = event.shifts.create(starts_at=starts_at, ends_at=event.ends_at)
+    other_shift = event.shifts.create(starts_at=starts_at, ends_at=event.ends_at)
+    ShiftAssignment.objects.create(shift=shift, person=ann)
+    ShiftAssignment.objects.create(shift=shift, person=ann_phone)
+    ShiftAssignment.objects.create(shift=other_shift, person=ann_email)
+    PersonOrganization.objects.create(person=ann, org=org, is_active=False)
+    PersonOrganization.objects.create(person=ann_email, org=org)
+    PersonTagging.objects.create(person=ann_phone, tag=tag)
+    PersonTagging.objects.create(person=ann_email, tag=tag)
+    ticket = Ticket.objects.create(org=org, name="Call", person=ann_email)
+    template = TicketTemplate.objects.create(org=org, name="Confirm")
+    generated = {
+        (person, target): Ticket.objects.create(
+            org=org,
+            name="Confirm",
+            person=person,
+            template=template,
+            event=event,
+            shift=target,
+        )
+        for person, target in (
+            (ann, shift),
+            (ann_phone, shift),
+            (ann_phone, other_shift),
+            (ann_email, shift),
+        )
+    }
+    Ticket.objects.filter(pk=generated[ann_email, shift].pk).update(
+        status=TicketStatus.COMPLETED,
+    )
+
+    merge_people(ann, [ann_phone, ann_email])
+    ann.refresh_from_db()
+    assert (ann.email, ann.attributes) == ("Ann@Example.com", {"source": "csv"})
+    assert set(ann.shift_assignments.values_list("shift", flat=True)) == {
+        shift.id,
+        other_shift.id,
+    }
+    assert list(ann.org_links.values_list("is_active", flat=True)) == [True]
+    assert ann.taggings.get().tag == tag
+    ticket.refresh_from_db()
+    assert ticket.person == ann
+    # The duplicate's ticket for a shift Ann already has a ticket for is dropped
+    assert not Ticket.objects.filter(pk=generated[ann_phone, shift].pk).exists()
+    moved = Ticket.objects.get(pk=generated[ann_phone, other_shift].pk)
+    assert moved.person == ann
+    assert moved.dedup_key == moved.compute_dedup_key()
+    # Worked on, so kept despite Ann's ticket, without a dedup key
+    worked = Ticket.objects.get(pk=generated[ann_email, shift].pk)
+    assert (worked.person, worked.dedup_key) == (ann, None)
+    assert not Person.objects.filter(id__in=[ann_phone.id, ann_email.id]).exists()
+    assert not PersonDuplicate.objects.exists()
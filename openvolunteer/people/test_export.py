@@ -0,0 +1,66 @@
+import csv
+import io
+import json
+
+import pytest
+from django.urls import reverse
+
+from openvolunteer.orgs.models import Membership
+from openvolunteer.orgs.models import Organization
+from openvolunteer.orgs.models import OrgRole
+from openvolunteer.people.models import Person
+from openvolunteer.people.models import PersonOrganization
+from openvolunteer.people.models import PersonTag
+from openvolunteer.people.models import PersonTagging
+
+
+@pytest.mark.django_db
+def test_person_export(client, user):
+    org = Organization.objects.create(name="Org", slug="org")
+    other_org = Organization.objects.create(name="Other", slug="other")
+    Membership.objects.create(org=org, user=user, role=OrgRole.ORGANIZER)
+    tag = PersonTag.objects.create(org=org, name="Driver")
+    ann = Person.objects.create(full_name="Ann", email="ann@example.com")
+    bob = Person.objects.create(full_name="Bob")
+    hidden = Person.objects.create(full_name="Cid")
+    for person in (ann, bob):
+        PersonOrganization.objects.create(person=person, org=org)
+    for person in (ann, hidden):
+        PersonOrganization.objects.create(person=person, org=other_org)
+    PersonTagging.objects.create(person=ann, tag=tag)
+    client.force_login(user)
+
+    # Only people of the user's orgs, and only those orgs
+    response = client.get(reverse("people:person_export"))
+    rows = list(csv.DictReader(io.StringIO(response.getvalue().decode())))
+    assert [(r["full_name"], r["orgs"]) for r in rows] == [
+        ("Ann", "Org"),
+        ("Bob", "Org"),
+    ]
+    assert rows[0]["tags"] == "Driver"
+
+    # The list filters apply
+    response = client.get(
+        reverse("people:person_export"),
+        {"tag": tag.id, "format": "jsonl"},
+    )
+    assert response["Content-Type"].startswith("application/jsonl")
+    rows = [json.loads(line) for line in response.getvalue().decode().splitlines()]
+    assert [(r["id"], r["tags"]) for r in rows] == [(str(ann.id), ["Driver"])]
+
+
+@pytest.mark.django_db
+def test_person_export_quotes_formulas(client, user):
+    org = Organization.objects.create(name="Org", slug="org")
+    Membership.objects.create(org=org, user=user, role=OrgRole.ORGANIZER)
+    person = Person.objects.create(full_name="=HYPERLINK(1)", phone="+15550100")
+    PersonOrganization.objects.create(person=person, org=org)
+    client.force_login(user)
+
+    response = client.get(reverse("people:person_export"))
+    rows = list(csv.DictReader(io.StringIO(response.getvalue().decode())))
+    assert (rows[0]["full_name"], rows[0]["phone"]) == ("'=HYPERLINK(1)", "'+15550100")
+
+    # JSONL is left as is
+    response = client.get(reverse("people:person_export"), {"format": "jsonl"})
+    assert json.loads(response.getvalue())["full_name"] == "=HYPERLINK(1)"
@@ -0,0 +1,76 @@
+import pytest
+from django.contrib.messages import get_messages
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.urls import reverse
+
+from openvolunteer.orgs.models import Organization
+from openvolunteer.people.models import Person
+from openvolunteer.people.models import PersonImportJobStatus
+from openvolunteer.people.tasks import enqueue_person_import_job
+from openvolunteer.people.tasks import import_people_job
+
+# ruff: noqa: PLR2004
+
+
+PEOPLE_CSV = """full_name,email,phone,discord,orgs,tags
+Ann Example,ann@example.com,555-0100,,Org,Driver|Canvasser
+Bob Example,bob@example.com,,Bob,Org,Driver
+,nobody@example.com,,,,
+Ann Again,ANN@example.com,,,,
+Cid Example,not-an-email,,,,
+Dee Example,,,,Nowhere,
+"""
+
+
+@pytest.mark.django_db
+def test_person_csv_import(client, user, settings, tmp_path):
+    Organization.objects.create(name="Org", slug="org")
+    Person.objects.create(full_name="Bob Existing", discord="bob")
+    user.is_staff = True
+    user.save()
+    client.force_login(user)
+
+    response = client.post(
+        reverse("people:person_upload"),
+        {"csv_file": SimpleUploadedFile("people.csv", PEOPLE_CSV.encode())},
+    )
+    assert response.status_code == 302
+    ann = Person.objects.get(email="ann@example.com")
+    assert ann.full_name == "Ann Example"
+    assert set(ann.org_links.values_list("org__name", flat=True)) == {"Org"}
+    assert set(ann.taggings.values_list("tag__name", flat=True)) == {
+        "Driver",
+        "Canvasser",
+    }
+    assert Person.objects.count() == 2
+    assert [str(m) for m in get_messages(response.wsgi_request)][1:] == [
+        "Row 3: a person with discord 'Bob' already exists",
+        "Row 4: missing full_name",
+        "Row 5: a person with email 'ANN@example.com' already exists",
+        "Row 6: invalid email 'not-an-email'",
+        "Row 7: unknown org or no permission: Nowhere",
+    ]
+
+    # Larger files are imported by a job, which drops the upload when done
+    settings.PERSON_IMPORT_SYNC_LIMIT = 1
+    settings.MEDIA_ROOT = tmp_path
+    csv_file = SimpleUploadedFile(
+        "more.csv",
+        b"full_name,email,tags\n"
+        b"Eve Example,eve@example.com,Driver\n"
+        b"Ann,ann@example.com,\n",
+    )
+    job = enqueue_person_import_job(uploaded_file=csv_file, created_by=user)
+    assert import_people_job(job_id=str(job.id)) == 1
+    job.refresh_from_db()
+    assert job.status == PersonImportJobStatus.COMPLETED
+    assert (job.total, job.processed, job.skipped_count) == (2, 2, 1)
+    assert not job.file
+    assert not list(tmp_path.rglob("*.csv"))
+    eve = Person.objects.get(email="eve@example.com")
+    assert eve.taggings.get().tag == ann.taggings.get(tag__name="Driver").tag
+
+    status = client.get(reverse("people:import_job_status", args=[job.id])).json()
+    assert status["errors"] == [
+        "Row 3: a person with email 'ann@example.com' already exists",
+    ]
@@ -0,0 +1,38 @@
+import pytest
+from django.urls import reverse
+
+from openvolunteer.orgs.models import Membership
+from openvolunteer.orgs.models import Organization
+from openvolunteer.orgs.models import OrgRole
+from openvolunteer.people.cache import person_search_cache
+from openvolunteer.people.models import Person
+from openvolunteer.people.models import PersonOrganization
+
+# ruff: noqa: PLR2004
+
+
+@pytest.mark.django_db
+def test_person_search_cache_and_etag(client, user):
+    org = Organization.objects.create(name="Org", slug="org")
+    Membership.objects.create(org=org, user=user, role=OrgRole.ADMIN)
+    person = Person.objects.create(full_name="John Smith")
+    PersonOrganization.objects.create(person=person, org=org)
+    url = reverse("people:person_search")
+    client.force_login(user)
+
+    person_search_cache.reset_stats()
+    response = client.get(url, {"q": "john"})
+    assert [p["name"] for p in response.json()["results"]] == ["John Smith"]
+    etag = response["ETag"]
+
+    # Same normalized query: served from the cache, and revalidated cheaply
+    assert client.get(url, {"q": " JOHN "}).json() == response.json()
+    assert client.get(url, {"q": "john"}, HTTP_IF_NONE_MATCH=etag).status_code == 304
+    assert person_search_cache.info()["hits"] == 1
+
+    # A write changes the generation, and with it the key and the ETag
+    person.full_name = "John Smythe"
+    person.save()
+    response = client.get(url, {"q": "john"}, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 200
+    assert [p["name"] for p in response.json()["results"]] == ["John Smythe"]
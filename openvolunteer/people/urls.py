@@ -13,6 +13,14 @@ urlpatterns = [
         views.person_form,
         name="person_edit",
     ),
+    path("bulk/", views.person_bulk_update, name="person_bulk_update"),
+    path("export/", views.person_export, name="person_export"),
     path("upload/", views.person_upload_csv, name="person_upload"),
+    path("upload/jobs/<uuid:job_id>/", views.import_job_detail, name="import_job"),
+    path(
+        "upload/jobs/<uuid:job_id>/status/",
+        views.import_job_status,
+        name="import_job_status",
+    ),
     path("search/", views.person_search, name="person_search"),
 ]
@@ -1,59 +1,102 @@
 #!/usr/bin/env python3
+import csv
+import hashlib
+import uuid
+
+from django.conf import settings
 from django.contrib import messages
 from django.contrib.auth.decorators import login_required
+from django.contrib.postgres.expressions import ArraySubquery
 from django.core.exceptions import BadRequest
 from django.core.exceptions import PermissionDenied
-from django.db.models import Q
+from django.db import transaction
+from django.db.models import OuterRef
 from django.http import JsonResponse
 from django.shortcuts import get_object_or_404
 from django.shortcuts import redirect
 from django.shortcuts import render
+from django.urls import reverse
+from django.utils.cache import get_conditional_response
+from django.utils.http import quote_etag
+from django.views.decorators.cache import cache_control
+from django.views.decorators.http import require_POST
 
+from openvolunteer.core.export import export_response
 from openvolunteer.core.filters import apply_filters
+from openvolunteer.core.filters import relation_exists
 from openvolunteer.core.pagination import paginate
 from openvolunteer.events.models import Event
 from openvolunteer.events.models import EventStatus
-from openvolunteer.orgs.models import Membership
 from openvolunteer.orgs.models import Organization
+from openvolunteer.orgs.permissions import apermission_context
 from openvolunteer.orgs.permissions import user_can_manage_people
 from openvolunteer.orgs.queryset import orgs_for_user
 from openvolunteer.tickets.queryset import get_filtered_tickets
 
+from .cache import person_search_cache
 from .filters import PERSON_FILTERS
+from .forms import PersonBulkUpdateForm
 from .forms import PersonCSVUploadForm
 from .forms import PersonForm
+from .imports import count_csv_rows
+from .imports import import_people_csv
 from .models import Person
+from .models import PersonImportJob
+from .models import PersonOrganization
+from .models import PersonTag
+from .permissions import editable_people
+from .permissions import user_can_bulk_edit_people
 from .permissions import user_can_create_person
 from .permissions import user_can_edit_person
 from .permissions import user_can_view_person
-from .services import handle_person_csv
+from .search import PERSON_SEARCH_FILTERS
+from .search import filter_people
+from .selection import acreate_selection
+from .services import bulk_update_orgs
+from .services import bulk_update_summary
+from .services import bulk_update_tags
+from .tasks import enqueue_person_import_job
 
 
-@login_required
-def person_list(request):
-    # ================= BASE QUERYSET =================
+def _visible_people(user):
     people = Person.objects.all()
 
     # Non-admin users only see people in their orgs
-    if not (request.user.is_staff or request.user.is_superuser):
+    if not (user.is_staff or user.is_superuser):
         people = people.filter(
-            org_links__org__in=orgs_for_user(request.user),
-            org_links__is_active=True,
+            relation_exists(
+                Person,
+                "org_links",
+                org__in=orgs_for_user(user),
+                is_active=True,
+            ),
         )
 
-    people = people.distinct().order_by("full_name")
+    return people.order_by("full_name")
+
+
+@login_required
+def person_list(request):
+    # ================= BASE QUERYSET =================
+    people = _visible_people(request.user)
 
     # ================= FILTERS =================
     people, filter_ctx = apply_filters(request, people, PERSON_FILTERS)
 
     # ================= PAGINATION =================
-    pagination = paginate(request, people, per_page=20)
+    pagination = paginate(request, people, per_page=20, keyset=True)
+
+    can_bulk_edit = user_can_bulk_edit_people(request.user)
 
     return render(
         request,
         "people/person_list.html",
         {
             "can_edit": user_can_create_person(request.user),
+            "can_bulk_edit": can_bulk_edit,
+            "bulk_form": (
+                PersonBulkUpdateForm(user=request.user) if can_bulk_edit else None
+            ),
             "people": pagination["page_obj"],
             **pagination,
             **filter_ctx,
@@ -61,6 +104,84 @@ def person_list(request):
     )
 
 
+@login_required
+@require_POST
+def person_bulk_update(request):
+    """
+    Add or remove tags and orgs of the people checked on the person list, or
+    of all people matching its filters (kept in the query string).
+    """
+    if not user_can_bulk_edit_people(request.user):
+        msg = "You do not have permission to edit people."
+        raise PermissionDenied(msg)
+
+    people, _ = apply_filters(request, _visible_people(request.user), PERSON_FILTERS)
+    if request.POST.get("scope") != "all":
+        try:
+            person_ids = [uuid.UUID(pid) for pid in request.POST.getlist("people")]
+        except ValueError as exc:
+            msg = "Invalid person id"
+            raise BadRequest(msg) from exc
+        people = people.filter(id__in=person_ids)
+    people = editable_people(request.user, people)
+
+    form = PersonBulkUpdateForm(request.POST, user=request.user)
+    if form.is_valid():
+        tags = bulk_update_tags(
+            people,
+            add=form.cleaned_data["add_tags"],
+            remove=form.cleaned_data["remove_tags"],
+        )
+        orgs = bulk_update_orgs(
+            people,
+            add=form.cleaned_data["add_orgs"],
+            remove=form.cleaned_data["remove_orgs"],
+        )
+        messages.success(request, bulk_update_summary(tags, orgs))
+    else:
+        for error in form.errors.values():
+            messages.error(request, error.as_text())
+
+    return redirect(f"{reverse('people:person_list')}?{request.GET.urlencode()}")
+
+
+PERSON_EXPORT_FIELDS = [
+    "id",
+    "full_name",
+    "email",
+    "phone",
+    "discord",
+    "address_line1",
+    "address_line2",
+    "city",
+    "state",
+    "postal_code",
+    "orgs",
+    "tags",
+    "attributes",
+    "created_at",
+]
+
+
+@login_required
+def person_export(request):
+    people, _ = apply_filters(request, _visible_people(request.user), PERSON_FILTERS)
+
+    org_links = PersonOrganization.objects.filter(person=OuterRef("pk"), is_active=True)
+    if not (request.user.is_staff or request.user.is_superuser):
+        org_links = org_links.filter(org__in=orgs_for_user(request.user))
+
+    people = people.annotate(
+        orgs=ArraySubquery(org_links.order_by("org__name").values("org__name")),
+        tags=ArraySubquery(
+            PersonTag.objects.filter(taggings__person=OuterRef("pk"))
+            .order_by("name")
+            .values("name"),
+        ),
+    )
+    return export_response(request, people, PERSON_EXPORT_FIELDS, "people")
+
+
 @login_required
 def person_detail(request, person_id):
     person = get_object_or_404(Person, id=person_id)
@@ -82,6 +203,7 @@ def person_detail(request, person_id):
     ticket_ctx = get_filtered_tickets(
         person=person,
         limit=10,
+        user=request.user,
     )
 
     return render(
@@ -164,6 +286,10 @@ def person_form(request, person_id=None):
     )
 
 
+# Skipped rows listed after a synchronous import
+MAX_IMPORT_MESSAGES = 10
+
+
 @login_required
 def person_upload_csv(request):
     if not user_can_create_person(request.user):
@@ -173,15 +299,35 @@ def person_upload_csv(request):
     if request.method == "POST":
         form = PersonCSVUploadForm(request.POST, request.FILES)
         if form.is_valid():
-            created, skipped = handle_person_csv(
-                request.user,
-                request.FILES["csv_file"],
-            )
-            messages.success(
-                request,
-                f"Created {created} people. Skipped {skipped}.",
-            )
-            return redirect("people:person_list")
+            uploaded_file = form.cleaned_data["csv_file"]
+            try:
+                rows = count_csv_rows(uploaded_file)
+            except (ValueError, csv.Error) as exc:
+                form.add_error("csv_file", str(exc))
+            else:
+                # Large files are imported by a worker; the user follows the job
+                if rows > settings.PERSON_IMPORT_SYNC_LIMIT:
+                    job = enqueue_person_import_job(
+                        uploaded_file=uploaded_file,
+                        created_by=request.user,
+                    )
+                    messages.info(request, f"Importing {rows} rows in the background.")
+                    return redirect("people:import_job", job_id=job.id)
+
+                importer = import_people_csv(request.user, uploaded_file)
+                messages.success(
+                    request,
+                    f"Created {importer.created} people. Skipped {importer.skipped}.",
+                )
+                for error in importer.errors[:MAX_IMPORT_MESSAGES]:
+                    messages.warning(request, error)
+                if len(importer.errors) > MAX_IMPORT_MESSAGES:
+                    messages.warning(
+                        request,
+                        f"{importer.skipped - MAX_IMPORT_MESSAGES} more rows "
+                        "were skipped.",
+                    )
+                return redirect("people:person_list")
     else:
         form = PersonCSVUploadForm()
 
@@ -192,114 +338,112 @@ def person_upload_csv(request):
     )
 
 
-MIN_SEARCH_QUERY_LEN = 2
-MAX_RESULTS = 100
+def _get_import_job(request, job_id):
+    job = get_object_or_404(PersonImportJob, id=job_id)
+    if job.created_by_id != request.user.id and not request.user.is_staff:
+        msg = "User can not view this import job"
+        raise PermissionDenied(msg)
+    return job
 
 
 @login_required
-def person_search(request):  # noqa: C901
-    user = request.user
+def import_job_detail(request, job_id):
+    job = _get_import_job(request, job_id)
 
-    # ---- Permission gate ----
-    if not (user.is_staff or user.is_superuser):
-        if not Membership.objects.filter(user=user, is_active=True).exists():
-            msg = "You do not have permission to search people."
-            raise PermissionDenied(msg)
+    return render(
+        request,
+        "people/import_job.html",
+        {"job": job},
+    )
 
-    q = request.GET.get("q", "").strip()
-    event_id = request.GET.get("event_id")
-    org_id = request.GET.get("org_id")
-    exclude_org_id = request.GET.get("exclude_org_id")
-    tag_ids = request.GET.get("tag_ids")
-    participated_event_id = request.GET.get("participated_event_id")
 
-    return_ids = request.GET.get("return_ids") == "1"
+@login_required
+def import_job_status(request, job_id):
+    job = _get_import_job(request, job_id)
 
-    if exclude_org_id and exclude_org_id == org_id:
-        msg = "Exclude and include org IDs match"
-        raise BadRequest(msg)
+    return JsonResponse(
+        {
+            "status": job.status,
+            "status_display": job.get_status_display(),
+            "is_finished": job.is_finished,
+            "total": job.total,
+            "processed": job.processed,
+            "created": job.created_count,
+            "skipped": job.skipped_count,
+            "progress": job.progress_percent,
+            "errors": job.errors,
+        },
+    )
 
-    people = Person.objects.all()
 
-    # ---- Visibility scoping ----
-    if not (user.is_staff or user.is_superuser):
-        people = people.filter(
-            org_links__org__in=orgs_for_user(request.user),
-            org_links__is_active=True,
-        )
+MIN_SEARCH_QUERY_LEN = 2
+MAX_RESULTS = 100
 
-    # ---- Org include / exclude ----
-    if org_id:
-        people = people.filter(
-            org_links__org_id=org_id,
-            org_links__is_active=True,
-        )
 
-    if exclude_org_id:
-        people = people.exclude(
-            org_links__org_id=exclude_org_id,
-            org_links__is_active=True,
-        )
+def _search_filters(request):
+    return {name: request.GET.get(name, "").strip() for name in PERSON_SEARCH_FILTERS}
+
 
-    # ---- Tag filter (ANY of these tags) ----
-    if tag_ids:
-        tag_ids = [tid for tid in tag_ids.split(",") if tid]
-        people = people.filter(taggings__tag_id__in=tag_ids)
+async def _person_search_results(people, user):
+    people = people.prefetch_related("taggings__tag")[:MAX_RESULTS]
+    return [
+        {
+            "id": str(p.id),
+            "name": p.full_name,
+            "email": p.email if user.is_staff else None,
+            "phone": p.phone if user.is_staff else None,
+            "discord": p.discord,
+            "tags": [
+                {
+                    "name": t.tag.name,
+                    "color": t.tag.color_hex,
+                }
+                for t in p.taggings.all()
+            ],
+        }
+        async for p in people.aiterator(chunk_size=MAX_RESULTS)
+    ]
 
-    if event_id and participated_event_id:
-        msg = "event_id and participated_event_id cannot be used together"
-        raise BadRequest(msg)
 
-    query_event_id = event_id or participated_event_id
-    # ---- Event participation ----
-    if query_event_id:
-        event = Event.objects.get(id=query_event_id)
-        people = people.filter(
-            shift_assignments__shift__event=event,
-        )
+# Async: the selector searches on every keystroke, and under ASGI waiting on
+# the database should not hold a worker thread. Read only, so no transaction.
+@transaction.non_atomic_requests
+@login_required
+@cache_control(private=True, no_cache=True)
+async def person_search(request):
+    user = await request.auser()
+    permissions = await apermission_context(user)
 
-    # ---- Free text search ----
-    if q:
-        if len(q) < MIN_SEARCH_QUERY_LEN:
-            return JsonResponse({"results": []})
+    # ---- Permission gate ----
+    if not (user.is_staff or user.is_superuser) and not permissions.org_ids():
+        msg = "You do not have permission to search people."
+        raise PermissionDenied(msg)
 
-        people = people.filter(
-            Q(full_name__icontains=q)
-            | Q(email__icontains=q)
-            | Q(phone__icontains=q)
-            | Q(discord__icontains=q)
-            | Q(taggings__tag__name__icontains=q),
-        )
+    filters = _search_filters(request)
+    if filters["q"] and len(filters["q"]) < MIN_SEARCH_QUERY_LEN:
+        return JsonResponse({"results": []})
 
-    people = people.distinct().order_by("full_name")
+    # Lazy; the visibility scoping reads the loaded permission context
+    people = filter_people(user, filters)
 
-    # Only return list of people IDs
-    if return_ids:
-        ids = list(
-            people.values_list("id", flat=True),
+    # Store the filters server-side, for bulk endpoints to resolve
+    if request.GET.get("selection") == "1":
+        return JsonResponse(
+            {
+                "selection": await acreate_selection(user, filters),
+                "count": await people.acount(),
+            },
         )
-        return JsonResponse({"ids": [str(i) for i in ids]})
 
-    people = people.prefetch_related("taggings__tag")[:MAX_RESULTS]
-
-    return JsonResponse(
-        {
-            "results": [
-                {
-                    "id": str(p.id),
-                    "name": p.full_name,
-                    "email": p.email if user.is_staff else None,
-                    "phone": p.phone if user.is_staff else None,
-                    "discord": p.discord,
-                    "tags": [
-                        {
-                            "name": t.tag.name,
-                            "color": t.tag.color_hex,
-                        }
-                        for t in p.taggings.all()
-                    ],
-                }
-                for p in people
-            ],
-        },
-    )
+    # Results are cached per visibility scope; the key doubles as the ETag
+    key = await person_search_cache.akey(user, filters)
+    etag = quote_etag(hashlib.sha256(key.encode()).hexdigest()[:32])
+    response = get_conditional_response(request, etag=etag)
+    if response is None:
+        results = await person_search_cache.aget_or_set(
+            key,
+            lambda: _person_search_results(people, user),
+        )
+        response = JsonResponse({"results": results})
+    response.headers.setdefault("ETag", etag)
+    return response
@@ -1,7 +1,11 @@
+from collections import defaultdict
+
 from openvolunteer.events.models import ShiftAssignment
 from openvolunteer.events.models import ShiftAssignmentStatus
+from openvolunteer.people.cache import invalidate_person_search
 from openvolunteer.people.models import PersonTagging
 from openvolunteer.people.services import generate_tag_org_prefered
+from openvolunteer.people.services import generate_tags_org_prefered
 
 from .models import TicketActionType
 
@@ -93,3 +97,178 @@ ACTION_HANDLERS = {
     TicketActionType.UPSERT_TAG: upsert_tag,
     TicketActionType.REMOVE_TAG: remove_tag,
 }
+
+
+# --------------------
+# Batch handlers
+# --------------------
+# Set-based counterparts of the handlers above, used when many actions of the
+# same type run at once (e.g. ON_CREATE actions of a generated batch).
+# They take a list of actions and return {action.id: error} for the actions
+# that could not be applied; all other actions are considered executed.
+
+
+def _resolve_ticket_shifts(actions):
+    """
+    Map action.id -> shift id, resolving each event default shift only once.
+    """
+    default_shifts = {}
+    shifts = {}
+    for action in actions:
+        ticket = action.ticket
+        if ticket.shift_id:
+            shifts[action.id] = ticket.shift_id
+        elif ticket.event_id:
+            if ticket.event_id not in default_shifts:
+                default_shifts[ticket.event_id] = ticket.event.default_shift(
+                    annotate=False,
+                ).id
+            shifts[action.id] = default_shifts[ticket.event_id]
+    return shifts
+
+
+def _split_person_targets(actions):
+    """
+    Split actions into those targeting a person and failures for the rest.
+    """
+    targeted = [action for action in actions if action.ticket.person_id]
+    failures = {
+        action.id: "Ticket has no person"
+        for action in actions
+        if not action.ticket.person_id
+    }
+    return targeted, failures
+
+
+def batch_update_shift_status(*, actions):
+    actions, failures = _split_person_targets(actions)
+    shifts = _resolve_ticket_shifts(actions)
+
+    pairs = {}
+    for action in actions:
+        if action.id not in shifts:
+            failures[action.id] = "Ticket has no shift or event"
+            continue
+        pairs[action] = (shifts[action.id], action.ticket.person_id)
+
+    persons_by_shift = defaultdict(set)
+    for shift_id, person_id in pairs.values():
+        persons_by_shift[shift_id].add(person_id)
+
+    assignment_ids = {}
+    for shift_id, person_ids in persons_by_shift.items():
+        for assignment_id, person_id in ShiftAssignment.objects.filter(
+            shift_id=shift_id,
+            person_id__in=person_ids,
+        ).values_list("id", "person_id"):
+            assignment_ids[(shift_id, person_id)] = assignment_id
+
+    ids_by_status = defaultdict(set)
+    for action, pair in pairs.items():
+        if pair not in assignment_ids:
+            failures[action.id] = "ShiftAssignment matching query does not exist."
+            continue
+        ids_by_status[action.config.get("status")].add(assignment_ids[pair])
+
+    for status, ids in ids_by_status.items():
+        ShiftAssignment.objects.filter(id__in=ids).update(status=status)
+    if ids_by_status:
+        # The bulk writes of batch handlers send no model signals
+        invalidate_person_search()
+
+    return failures
+
+
+def batch_upsert_shift_assignment(*, actions):
+    actions, failures = _split_person_targets(actions)
+    shifts = _resolve_ticket_shifts(actions)
+
+    assignments = {}
+    for action in actions:
+        if action.id not in shifts:
+            failures[action.id] = "Ticket has no shift or event"
+            continue
+        key = (shifts[action.id], action.ticket.person_id)
+        assignments[key] = ShiftAssignment(
+            shift_id=key[0],
+            person_id=key[1],
+            status=action.config.get("status", ShiftAssignmentStatus.PENDING),
+        )
+
+    ShiftAssignment.objects.bulk_create(
+        assignments.values(),
+        update_conflicts=True,
+        unique_fields=["shift", "person"],
+        update_fields=["status"],
+    )
+    if assignments:
+        invalidate_person_search()
+    return failures
+
+
+def _resolve_action_tags(actions):
+    """
+    Map action.id -> PersonTag, resolving the tag names of each org at once.
+    """
+    orgs = {}
+    names_by_org = defaultdict(set)
+    for action in actions:
+        tag_name = action.config.get("tag", None)
+        if tag_name and action.ticket.person_id:
+            orgs[action.ticket.org_id] = action.ticket.org
+            names_by_org[action.ticket.org_id].add(tag_name)
+
+    tags = {
+        (tag_name, org_id): tag
+        for org_id, names in names_by_org.items()
+        for tag_name, tag in generate_tags_org_prefered(names, orgs[org_id]).items()
+    }
+
+    action_tags = {}
+    for action in actions:
+        key = (action.config.get("tag", None), action.ticket.org_id)
+        if key in tags and action.ticket.person_id:
+            action_tags[action.id] = tags[key]
+    return action_tags
+
+
+def batch_upsert_tag(*, actions):
+    action_tags = _resolve_action_tags(actions)
+
+    PersonTagging.objects.bulk_create(
+        [
+            PersonTagging(person_id=action.ticket.person_id, tag=action_tags[action.id])
+            for action in actions
+            if action.id in action_tags
+        ],
+        ignore_conflicts=True,
+    )
+    if action_tags:
+        invalidate_person_search()
+    return {}
+
+
+def batch_remove_tag(*, actions):
+    action_tags = _resolve_action_tags(actions)
+
+    persons_by_tag = defaultdict(set)
+    for action in actions:
+        if action.id in action_tags:
+            persons_by_tag[action_tags[action.id].id].add(action.ticket.person_id)
+
+    for tag_id, person_ids in persons_by_tag.items():
+        PersonTagging.objects.filter(tag_id=tag_id, person_id__in=person_ids).delete()
+    return {}
+
+
+def batch_noop_action(*, actions):
+    return {}
+
+
+BATCH_ACTION_HANDLERS = {
+    TicketActionType.NOOP: batch_noop_action,
+    TicketActionType.UPDATE_SHIFT_STATUS: batch_update_shift_status,
+    TicketActionType.UPSERT_SHIFT_ASSIGNMENT: batch_upsert_shift_assignment,
+    TicketActionType.UPSERT_TAG: batch_upsert_tag,
+    TicketActionType.REMOVE_TAG: batch_remove_tag,
+}
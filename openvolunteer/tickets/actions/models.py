@@ -1,7 +1,7 @@
 import uuid
 
 from django.db import models
-from django.db.models.signals import post_save
+from django.dispatch import Signal
 
 from openvolunteer.tickets.models import TicketStatus
 
@@ -67,13 +67,16 @@ class TicketActionTemplate(models.Model):
         return self.slug
 
 
+# Sent once per bulk_create with all created actions, so receivers can
+# handle them as a set instead of one post_save per object
+post_bulk_create = Signal()
+
+
 # Custom manager to trigger signals on bulk create
 class TicketActionManager(models.Manager):
     def bulk_create(self, objs, **kwargs):
         s = super().bulk_create(objs, **kwargs)
-        for i in objs:
-            # sending post_save signal for individual object
-            post_save.send(i.__class__, instance=i, created=True)
+        post_bulk_create.send(self.model, instances=s)
 
         return s
 
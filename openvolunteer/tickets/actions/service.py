@@ -1,16 +1,24 @@
+from collections import defaultdict
+
 from django.db import transaction
 from django.utils import timezone
 
+from openvolunteer.tickets.audit import atomic_audit
+from openvolunteer.tickets.audit import buffered_audit
 from openvolunteer.tickets.audit import log_ticket_event
+from openvolunteer.tickets.audit import save_ticket_audit_logs
+from openvolunteer.tickets.models import Ticket
 from openvolunteer.tickets.models import TicketAuditEvent
+from openvolunteer.tickets.models import TicketAuditLog
 
 from .handlers import ACTION_HANDLERS
+from .handlers import BATCH_ACTION_HANDLERS
 from .models import TicketAction
 
 
 class TicketActionService:
     @staticmethod
-    @transaction.atomic
+    @atomic_audit()
     def execute(action: TicketAction, user, is_system=True):  # noqa: FBT002
         ticket = action.ticket
 
@@ -74,3 +82,168 @@ class TicketActionService:
         action.is_completed = True
         action.completed_at = timezone.now()
         action.save(update_fields=["is_completed", "completed_at"])
+
+    @staticmethod
+    @transaction.atomic
+    def execute_batch(actions, is_system=True):  # noqa: FBT002
+        """
+        Execute many system actions set-wise.
+
+        Actions are grouped by action_type and applied with the matching batch
+        handler; completion, ticket status changes and audit logs are then
+        written in bulk. Types without a batch handler, or whose batch handler
+        raises, fall back to execute() one action at a time. Failures are
+        audited and do not stop the other actions.
+        """
+        groups = defaultdict(list)
+        for action in actions:
+            if not action.is_completed:
+                groups[action.action_type].append(action)
+
+        executed = []
+        audit_logs = []
+        with buffered_audit():
+            for group in groups.values():
+                group_executed, group_logs = TicketActionService._execute_group(
+                    group,
+                    is_system=is_system,
+                )
+                executed.extend(group_executed)
+                audit_logs.extend(group_logs)
+
+            audit_logs.extend(
+                TicketActionService._complete_executed(
+                    executed,
+                    is_system=is_system,
+                ),
+            )
+            save_ticket_audit_logs(audit_logs)
+
+    @staticmethod
+    def _execute_group(actions, *, is_system):
+        """
+        Apply one batch handler to actions of the same type.
+
+        Returns the actions left to be completed and audit logs for failures.
+        """
+        handler = BATCH_ACTION_HANDLERS.get(actions[0].action_type)
+        failures = None
+        if handler is not None:
+            try:
+                with atomic_audit():
+                    failures = handler(actions=actions)
+            except Exception:  # noqa: BLE001
+                failures = None
+
+        # execute() completes and audits the actions itself
+        if failures is None:
+            return [], TicketActionService._execute_each(actions, is_system=is_system)
+
+        executed = [action for action in actions if action.id not in failures]
+        failure_logs = [
+            TicketActionService._failure_log(
+                action,
+                failures[action.id],
+                is_system=is_system,
+            )
+            for action in actions
+            if action.id in failures
+        ]
+        return executed, failure_logs
+
+    @staticmethod
+    def _complete_executed(actions, *, is_system):
+        """
+        Bulk update ticket statuses and mark actions complete.
+
+        Returns the run and status change audit logs.
+        """
+        audit_logs = []
+        ticket_statuses = {}
+        for action in actions:
+            ticket = action.ticket
+            audit_logs.append(
+                TicketAuditLog(
+                    ticket=ticket,
+                    event_type=TicketAuditEvent.ACTION_RUN,
+                    message=f"Action '{action.label}' executed",
+                    actor_id=ticket.reporter_id,
+                    metadata={
+                        "action_type": action.action_type,
+                        "action_id": str(action.id),
+                        "is_system": is_system,
+                    },
+                ),
+            )
+            if action.updates_ticket_status:
+                old_status = ticket.status
+                ticket.status = action.updates_ticket_status
+                ticket_statuses[ticket.id] = ticket.status
+                audit_logs.append(
+                    TicketAuditLog(
+                        ticket=ticket,
+                        event_type=TicketAuditEvent.STATUS_CHANGED,
+                        message=(
+                            f"Status changed from '{old_status}' to '{ticket.status}'"
+                        ),
+                        actor_id=ticket.reporter_id,
+                        metadata={
+                            "from": old_status,
+                            "to": ticket.status,
+                        },
+                    ),
+                )
+
+        tickets_by_status = defaultdict(list)
+        for ticket_id, status in ticket_statuses.items():
+            tickets_by_status[status].append(ticket_id)
+        for status, ticket_ids in tickets_by_status.items():
+            Ticket.objects.filter(id__in=ticket_ids).update(status=status)
+
+        completed_at = timezone.now()
+        TicketAction.objects.filter(
+            id__in=[action.id for action in actions],
+        ).update(is_completed=True, completed_at=completed_at)
+        for action in actions:
+            action.is_completed = True
+            action.completed_at = completed_at
+
+        return audit_logs
+
+    @staticmethod
+    def _execute_each(actions, *, is_system):
+        """
+        Run execute() per action, returning audit logs for the failures.
+        """
+        failure_logs = []
+        for action in actions:
+            try:
+                TicketActionService.execute(
+                    action=action,
+                    user=action.ticket.reporter,
+                    is_system=is_system,
+                )
+            except Exception as exc:  # noqa: BLE001
+                failure_logs.append(
+                    TicketActionService._failure_log(
+                        action,
+                        str(exc),
+                        is_system=is_system,
+                    ),
+                )
+        return failure_logs
+
+    @staticmethod
+    def _failure_log(action, error, *, is_system):
+        return TicketAuditLog(
+            ticket=action.ticket,
+            event_type=TicketAuditEvent.ACTION_FAILED,
+            message=f"Action '{action.label}' failed: {error}",
+            actor_id=action.ticket.reporter_id,
+            success=False,
+            metadata={
+                "action_type": action.action_type,
+                "error": error,
+                "is_system": is_system,
+            },
+        )
@@ -4,6 +4,7 @@ from django.dispatch import receiver
 
 from .enum import TicketActionRunWhen
 from .models import TicketAction
+from .models import post_bulk_create
 from .service import TicketActionService
 
 
@@ -26,3 +27,21 @@ def run_on_create_actions(sender, instance, created, **kwargs):
             user=instance.ticket.reporter,
         ),
     )
+
+
+@receiver(post_bulk_create, sender=TicketAction)
+def run_bulk_on_create_actions(sender, instances, **kwargs):
+    # Only run ON_CREATEs that are not completed
+    pending = [
+        instance
+        for instance in instances
+        if instance.run_when == TicketActionRunWhen.ON_CREATE
+        and not instance.is_completed
+    ]
+    if not pending:
+        return
+
+    # One callback for the whole set instead of one per action
+    transaction.on_commit(
+        lambda: TicketActionService.execute_batch(actions=pending),
+    )
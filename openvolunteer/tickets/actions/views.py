@@ -5,6 +5,7 @@ from django.shortcuts import get_object_or_404
 from django.shortcuts import redirect
 from django.views.decorators.http import require_POST
 
+from openvolunteer.tickets.audit import buffered_audit
 from openvolunteer.tickets.permissions import user_can_run_action
 
 from .models import TicketAction
@@ -13,6 +14,7 @@ from .service import TicketActionService
 
 @login_required
 @require_POST
+@buffered_audit()
 def run_action(request, action_id):
     action = get_object_or_404(
         TicketAction.objects.select_related("ticket", "ticket__assigned_to"),
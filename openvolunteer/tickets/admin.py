@@ -5,6 +5,7 @@ from django.utils.html import format_html
 from .actions.models import TicketActionTemplate
 from .models import Ticket
 from .models import TicketBatch
+from .models import TicketGenerationJob
 from .models import TicketStatus
 from .models import TicketTemplate
 from .services import create_ticket
@@ -178,6 +179,49 @@ class TicketBatchAdmin(admin.ModelAdmin):
             batch.tickets.update(assigned_to=None)
 
 
+@admin.register(TicketGenerationJob)
+class TicketGenerationJobAdmin(admin.ModelAdmin):
+    list_display = (
+        "event",
+        "status",
+        "processed",
+        "total",
+        "created_count",
+        "created_by",
+        "created_at",
+        "finished_at",
+    )
+
+    list_filter = (
+        "status",
+        "org",
+    )
+
+    readonly_fields = (
+        "org",
+        "event",
+        "shift",
+        "ticket_templates",
+        "person_ids",
+        "include_default_shift",
+        "batch_name",
+        "reason",
+        "batch",
+        "status",
+        "total",
+        "processed",
+        "created_count",
+        "errors",
+        "created_by",
+        "created_at",
+        "started_at",
+        "finished_at",
+    )
+
+    def has_add_permission(self, request):
+        return False
+
+
 # --------------------
 # Ticket Admin
 # --------------------
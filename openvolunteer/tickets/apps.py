@@ -12,7 +12,10 @@ class TicketsConfig(AppConfig):
         # ruff: noqa: PLC0415
         # Make sure recievers are registered
 
-        # Register on ticket create reciever
+        # Register on ticket create reciever and the org-preferred template
+        # and filter choice cache invalidation recievers
+        from . import filters  # noqa: F401
+        from . import resolvers  # noqa: F401
         from .actions import signals  # noqa: F401
         from .defaults import install_default_event_templates
         from .defaults import install_default_tasks
@@ -1,5 +1,35 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.db import transaction
+
+from .models import TicketAuditEvent
 from .models import TicketAuditLog
 
+AUDIT_BULK_BATCH_SIZE = 1000
+
+# Pending entries of the active buffered_audit() block, if any
+_audit_buffer = ContextVar("ticket_audit_buffer", default=None)
+
+
+def save_ticket_audit_logs(logs):
+    """
+    Insert unsaved TicketAuditLog instances with one bulk_create.
+
+    Inside a buffered_audit() block they are queued and written when the
+    block exits.
+    """
+    logs = list(logs)
+    if not logs:
+        return
+
+    buffer = _audit_buffer.get()
+    if buffer is not None:
+        buffer.extend(logs)
+        return
+
+    TicketAuditLog.objects.bulk_create(logs, batch_size=AUDIT_BULK_BATCH_SIZE)
+
 
 def log_ticket_event(  # noqa: PLR0913
     *,
@@ -10,11 +40,81 @@ def log_ticket_event(  # noqa: PLR0913
     success=True,
     metadata=None,
 ):
-    TicketAuditLog.objects.create(
-        ticket=ticket,
-        event_type=event_type,
-        message=message,
-        actor=actor,
-        success=success,
-        metadata=metadata or {},
+    save_ticket_audit_logs(
+        [
+            TicketAuditLog(
+                ticket=ticket,
+                event_type=event_type,
+                message=message,
+                actor=actor,
+                success=success,
+                metadata=metadata or {},
+            ),
+        ],
     )
+
+
+def log_ticket_events(events, *, actor=None, success=True):
+    """
+    Log many events at once.
+
+    `events` is an iterable of (ticket, event_type, metadata) tuples, optionally
+    followed by a message; the event type label is used when it is omitted.
+    """
+    logs = []
+    for ticket, event_type, metadata, *message in events:
+        logs.append(
+            TicketAuditLog(
+                ticket=ticket,
+                event_type=event_type,
+                message=message[0] if message else TicketAuditEvent(event_type).label,
+                actor=actor,
+                success=success,
+                metadata=metadata or {},
+            ),
+        )
+    save_ticket_audit_logs(logs)
+
+
+@contextmanager
+def buffered_audit():
+    """
+    Collect audit entries logged in this block and flush them with one
+    bulk_create when it exits. Used as a context manager or view decorator,
+    within the request transaction (ATOMIC_REQUESTS) so the entries commit
+    together with the changes they describe.
+
+    Nested blocks share the outermost buffer. Nothing is written if the block
+    raises. Savepoints within the block must be opened with atomic_audit(), so
+    the entries logged in those that roll back are dropped too.
+    """
+    if _audit_buffer.get() is not None:
+        yield
+        return
+
+    buffer = []
+    token = _audit_buffer.set(buffer)
+    try:
+        yield
+    finally:
+        _audit_buffer.reset(token)
+
+    TicketAuditLog.objects.bulk_create(buffer, batch_size=AUDIT_BULK_BATCH_SIZE)
+
+
+@contextmanager
+def atomic_audit():
+    """
+    transaction.atomic() that drops the audit entries it buffered if it rolls
+    back, so a buffered_audit() block only flushes entries of changes that
+    were kept.
+    """
+    buffer = _audit_buffer.get()
+    start = len(buffer) if buffer is not None else 0
+    try:
+        with transaction.atomic():
+            yield
+    except BaseException:
+        if buffer is not None:
+            del buffer[start:]
+        raise
@@ -0,0 +1,277 @@
+"""
+Monthly partitions of TicketAuditLog and their cold archive.
+
+tickets_ticketauditlog is a PostgreSQL table partitioned by range on
+created_at, with one partition per (UTC) month and a DEFAULT partition for
+anything outside them. Partitions older than the retention window are
+exported to gzipped JSONL files and dropped, which keeps the hot table and
+its indexes small. Archived entries remain readable per ticket: the months
+whose archive holds entries of a ticket are recorded as
+TicketAuditArchiveMonth rows, so only those archives are read.
+"""
+
+import datetime
+import gzip
+import json
+import os
+import re
+from pathlib import Path
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.db import transaction
+from django.utils import timezone
+
+from .models import TicketAuditArchiveMonth
+from .models import TicketAuditLog
+
+AUDIT_LOG_TABLE = TicketAuditLog._meta.db_table  # noqa: SLF001
+ARCHIVE_INDEX_TABLE = TicketAuditArchiveMonth._meta.db_table  # noqa: SLF001
+DEFAULT_PARTITION = f"{AUDIT_LOG_TABLE}_default"
+PARTITION_NAME_RE = re.compile(rf"^{AUDIT_LOG_TABLE}_p(\d{{4}})_(\d{{2}})$")
+
+# Number of months to create partitions for in advance
+PARTITION_MONTHS_AHEAD = 2
+
+EXPORT_CHUNK_SIZE = 2000
+
+ARCHIVE_COLUMNS = (
+    "id",
+    "ticket_id",
+    "event_type",
+    "message",
+    "actor_id",
+    "success",
+    "metadata",
+    "created_at",
+)
+
+MONTHS_PER_YEAR = 12
+
+
+def month_start(value):
+    """
+    First instant (UTC) of the month containing `value`.
+    """
+    value = value.astimezone(datetime.UTC)
+    return value.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+def add_months(month, months):
+    index = month.year * MONTHS_PER_YEAR + month.month - 1 + months
+    return month.replace(
+        year=index // MONTHS_PER_YEAR,
+        month=index % MONTHS_PER_YEAR + 1,
+    )
+
+
+def partition_name(month):
+    return f"{AUDIT_LOG_TABLE}_p{month.year:04d}_{month.month:02d}"
+
+
+def archive_cutoff(retention_months=None):
+    """
+    Partitions for months starting before this instant are archived.
+    """
+    if retention_months is None:
+        retention_months = settings.TICKET_AUDIT_RETENTION_MONTHS
+    return add_months(month_start(timezone.now()), -retention_months)
+
+
+def audit_log_partitions():
+    """
+    Return {month start: partition table name} of attached monthly partitions.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            """
+            SELECT child.relname
+            FROM pg_inherits
+            JOIN pg_class parent ON parent.oid = pg_inherits.inhparent
+            JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+            WHERE parent.relname = %s
+            """,
+            [AUDIT_LOG_TABLE],
+        )
+        names = [row[0] for row in cursor.fetchall()]
+
+    partitions = {}
+    for name in names:
+        match = PARTITION_NAME_RE.match(name)
+        if match:
+            month = datetime.datetime(
+                int(match[1]),
+                int(match[2]),
+                1,
+                tzinfo=datetime.UTC,
+            )
+            partitions[month] = name
+    return partitions
+
+
+@transaction.atomic
+def create_audit_log_partition(month):
+    """
+    Create and attach the partition for `month`, moving any rows of that
+    month out of the DEFAULT partition first.
+    """
+    name = partition_name(month)
+    start = month
+    end = add_months(month, 1)
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"CREATE TABLE {name} "
+            f"(LIKE {AUDIT_LOG_TABLE} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)",
+        )
+        cursor.execute(
+            f"WITH moved AS ("  # noqa: S608
+            f"DELETE FROM {DEFAULT_PARTITION} "
+            f"WHERE created_at >= %s AND created_at < %s RETURNING *"
+            f") INSERT INTO {name} SELECT * FROM moved",
+            [start, end],
+        )
+        cursor.execute(
+            f"ALTER TABLE {AUDIT_LOG_TABLE} ATTACH PARTITION {name} "
+            f"FOR VALUES FROM (%s) TO (%s)",
+            [start, end],
+        )
+    return name
+
+
+def ensure_audit_log_partitions(start=None, months_ahead=PARTITION_MONTHS_AHEAD):
+    """
+    Make sure monthly partitions exist from `start` (default: this month)
+    through `months_ahead` months from now.
+
+    Returns the names of the partitions created.
+    """
+    current = month_start(timezone.now())
+    month = month_start(start) if start else current
+    last = add_months(current, months_ahead)
+
+    existing = audit_log_partitions()
+    created = []
+    while month <= last:
+        if month not in existing:
+            created.append(create_audit_log_partition(month))
+        month = add_months(month, 1)
+    return created
+
+
+def archive_path(month):
+    return (
+        Path(settings.TICKET_AUDIT_ARCHIVE_DIR)
+        / f"ticketauditlog_{month.year:04d}_{month.month:02d}.jsonl.gz"
+    )
+
+
+def export_partition(name, path):
+    """
+    Write every row of partition `name` to `path` as gzipped JSONL.
+
+    The file is written next to its destination and renamed into place, so a
+    partially written archive is never picked up by readers.
+
+    Returns the number of exported rows.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(".tmp")
+
+    count = 0
+    with gzip.open(tmp_path, "wt", encoding="utf-8") as archive:
+        # A server side cursor needs a transaction
+        with transaction.atomic(), connection.chunked_cursor() as cursor:
+            cursor.execute(
+                f"SELECT {', '.join(ARCHIVE_COLUMNS)} FROM {name} "  # noqa: S608
+                "ORDER BY created_at",
+            )
+            while rows := cursor.fetchmany(EXPORT_CHUNK_SIZE):
+                for row in rows:
+                    entry = dict(zip(ARCHIVE_COLUMNS, row, strict=True))
+                    entry["id"] = str(entry["id"])
+                    entry["ticket_id"] = str(entry["ticket_id"])
+                    entry["created_at"] = entry["created_at"].isoformat()
+                    archive.write(json.dumps(entry, default=str) + "\n")
+                    count += 1
+        archive.flush()
+        os.fsync(archive.fileno())
+
+    tmp_path.replace(path)
+    return count
+
+
+def archive_audit_log_partitions(retention_months=None):
+    """
+    Export partitions older than the retention window and drop them.
+
+    Rows are exported while the partition is still attached, so inserts into
+    the audit log are only blocked for the short detach/drop.
+
+    Returns {partition name: archived row count}.
+    """
+    cutoff = archive_cutoff(retention_months)
+
+    archived = {}
+    for month, name in sorted(audit_log_partitions().items()):
+        if month >= cutoff:
+            continue
+
+        archived[name] = export_partition(name, archive_path(month))
+
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute(
+                f"INSERT INTO {ARCHIVE_INDEX_TABLE} (ticket_id, month) "  # noqa: S608
+                f"SELECT DISTINCT ticket_id, %s FROM {name} "
+                "ON CONFLICT (ticket_id, month) DO NOTHING",
+                [month.date()],
+            )
+            # Deferred FK checks pending on the partition would block the drop
+            cursor.execute("SET CONSTRAINTS ALL IMMEDIATE")
+            cursor.execute(f"ALTER TABLE {AUDIT_LOG_TABLE} DETACH PARTITION {name}")
+            cursor.execute(f"DROP TABLE {name}")
+
+    return archived
+
+
+def read_archived_audit_logs(ticket):
+    """
+    Archived audit entries of `ticket` as unsaved TicketAuditLog instances,
+    newest first.
+
+    Only the archives of the months indexed for the ticket are read.
+    """
+    ticket_id = str(ticket.id)
+
+    entries = []
+    for month in ticket.audit_archive_months.order_by("month").values_list(
+        "month",
+        flat=True,
+    ):
+        with gzip.open(archive_path(month), "rt", encoding="utf-8") as archive:
+            for line in archive:
+                entry = json.loads(line)
+                if entry["ticket_id"] == ticket_id:
+                    entries.append(entry)
+
+    actors = get_user_model().objects.in_bulk(
+        {entry["actor_id"] for entry in entries if entry["actor_id"]},
+    )
+
+    logs = []
+    for entry in entries:
+        log = TicketAuditLog(
+            id=entry["id"],
+            ticket=ticket,
+            event_type=entry["event_type"],
+            message=entry["message"],
+            actor_id=entry["actor_id"],
+            success=entry["success"],
+            metadata=entry["metadata"],
+            created_at=datetime.datetime.fromisoformat(entry["created_at"]),
+        )
+        log.actor = actors.get(entry["actor_id"])
+        logs.append(log)
+
+    logs.sort(key=lambda log: log.created_at, reverse=True)
+    return logs
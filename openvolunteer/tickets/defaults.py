@@ -427,6 +427,19 @@ def install_default_tasks():
         },
     )
 
+    fail_stale_generation_jobs = PeriodicTask.objects.get_or_create(
+        name="Fail interrupted ticket generation jobs",
+        defaults={
+            "task": "openvolunteer.tickets.tasks.fail_stale_ticket_generation_jobs",
+            "interval": every_fifteen_minutes,
+            "enabled": True,
+            "description": (
+                "Mark ticket generation jobs that are still running past their "
+                "time limit as failed"
+            ),
+        },
+    )
+
     midnight, _ = CrontabSchedule.objects.get_or_create(
         minute="0",
         hour="5",
@@ -497,9 +510,34 @@ def install_default_tasks():
         },
     )
 
+    create_audit_log_partitions = PeriodicTask.objects.get_or_create(
+        name="Create upcoming ticket audit log partitions",
+        defaults={
+            "task": "openvolunteer.tickets.tasks.create_ticket_audit_log_partitions",
+            "crontab": midnight,
+            "enabled": True,
+        },
+    )
+
+    archive_audit_logs = PeriodicTask.objects.get_or_create(
+        name="Archive old ticket audit logs",
+        defaults={
+            "task": "openvolunteer.tickets.tasks.archive_ticket_audit_logs",
+            "crontab": midnight,
+            "enabled": True,
+            "description": (
+                "Export audit log partitions older than the retention window "
+                "to compressed files and drop them"
+            ),
+        },
+    )
+
     return {
+        "create_audit_log_partitions": create_audit_log_partitions,
+        "archive_audit_logs": archive_audit_logs,
         "delete_completed_tickets": delete_completed_tickets,
         "create_intro_tix": create_intro_tix,
+        "fail_stale_generation_jobs": fail_stale_generation_jobs,
         "cancel_stale_tix": cancel_stale_tix,
         "cancel_tix_canceled_events": cancel_tix_canceled_events,
         "delete_ticket_batches": delete_ticket_batches,
@@ -1,21 +1,22 @@
 from django.db.models import Q
 
+from openvolunteer.core.choices import ChoiceProvider
 from openvolunteer.events.models import EventTemplate
 from openvolunteer.orgs.queryset import orgs_for_user
 
 from .models import TicketBatch
 from .models import TicketStatus
+from .search import full_text_search
 
 
 def search_tickets(qs, request, value):
+    """
+    Full text search on name, batch name and description, ranked.
+    """
     if not value:
         return qs
 
-    return qs.filter(
-        Q(name__icontains=value)
-        | Q(batch__name__icontains=value)
-        | Q(description__icontains=value),
-    )
+    return full_text_search(qs, value)
 
 
 def filter_assignment(qs, request, value):
@@ -106,10 +107,12 @@ TICKET_FILTERS = [
         "name": "event_type",
         "label": "Event Type",
         "type": "select",
-        "choices": lambda request: (
-            EventTemplate.objects.filter(
-                Q(org__memberships__user=request.user) | Q(org__isnull=True),
-            ).distinct()
+        "choices": ChoiceProvider(
+            "tickets.event_type",
+            EventTemplate,
+            lambda request: EventTemplate.objects.filter(
+                Q(org__in=orgs_for_user(request.user)) | Q(org__isnull=True),
+            ),
         ),
         "lookup": "event__template",
     },
@@ -117,8 +120,12 @@ TICKET_FILTERS = [
         "name": "batch",
         "label": "Ticket Batch",
         "type": "select",
-        "choices": lambda request: (
-            TicketBatch.objects.filter(org__in=orgs_for_user(request.user))
+        "choices": ChoiceProvider(
+            "tickets.batch",
+            TicketBatch,
+            lambda request: TicketBatch.objects.filter(
+                org__in=orgs_for_user(request.user),
+            ),
         ),
         "lookup": "batch",
     },
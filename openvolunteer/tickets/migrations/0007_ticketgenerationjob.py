@@ -0,0 +1,46 @@
+# Generated by Django 5.2.9 on 2026-10-17 00:34
+
+import django.db.models.deletion
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0002_initial'),
+        ('orgs', '0002_organization_timezones'),
+        ('tickets', '0006_ticket_template_ticketbatch_template'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TicketGenerationJob',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('person_ids', models.JSONField(blank=True, help_text='Restrict generation to these people; null means all assigned', null=True)),
+                ('include_default_shift', models.BooleanField(default=True)),
+                ('batch_name', models.CharField(blank=True, max_length=200)),
+                ('reason', models.TextField(blank=True)),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('running', 'Running'), ('completed', 'Completed'), ('failed', 'Failed')], default='pending', max_length=20)),
+                ('total', models.PositiveIntegerField(default=0)),
+                ('processed', models.PositiveIntegerField(default=0)),
+                ('created_count', models.PositiveIntegerField(default=0)),
+                ('errors', models.JSONField(blank=True, default=list)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('started_at', models.DateTimeField(blank=True, null=True)),
+                ('finished_at', models.DateTimeField(blank=True, null=True)),
+                ('batch', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='generation_jobs', to='tickets.ticketbatch')),
+                ('created_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='ticket_generation_jobs', to=settings.AUTH_USER_MODEL)),
+                ('event', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='ticket_generation_jobs', to='events.event')),
+                ('org', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='ticket_generation_jobs', to='orgs.organization')),
+                ('shift', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='ticket_generation_jobs', to='events.shift')),
+                ('ticket_templates', models.ManyToManyField(blank=True, help_text='Templates to generate; empty means the event template defaults', related_name='generation_jobs', to='tickets.tickettemplate')),
+            ],
+            options={
+                'ordering': ['-created_at'],
+            },
+        ),
+    ]
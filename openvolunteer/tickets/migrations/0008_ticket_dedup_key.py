@@ -0,0 +1,58 @@
+# Generated by Django 5.2.9 on 2026-10-17 00:37
+
+from django.db import migrations, models
+
+
+def backfill_dedup_keys(apps, schema_editor):
+    """
+    Key existing generated tickets. When duplicates already exist, only the
+    oldest ticket of each group gets the key; the others are left unkeyed.
+    """
+    Ticket = apps.get_model("tickets", "Ticket")
+
+    seen = set()
+    to_update = []
+    tickets = (
+        Ticket.objects.filter(template__isnull=False)
+        .order_by("created_at", "id")
+        .only("id", "template_id", "org_id", "person_id", "event_id", "shift_id")
+    )
+    for ticket in tickets.iterator(chunk_size=2000):
+        key = ":".join(
+            str(value) if value else "-"
+            for value in (
+                ticket.template_id,
+                ticket.org_id,
+                ticket.person_id,
+                ticket.event_id,
+                ticket.shift_id,
+            )
+        )
+        if key in seen:
+            continue
+        seen.add(key)
+        ticket.dedup_key = key
+        to_update.append(ticket)
+
+    Ticket.objects.bulk_update(to_update, ["dedup_key"], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tickets', '0007_ticketgenerationjob'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='ticket',
+            name='dedup_key',
+            field=models.CharField(blank=True, editable=False, help_text='Template and target of a generated ticket, unique per ticket', max_length=200, null=True),
+        ),
+        migrations.RunPython(backfill_dedup_keys, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='ticket',
+            name='dedup_key',
+            field=models.CharField(blank=True, editable=False, help_text='Template and target of a generated ticket, unique per ticket', max_length=200, null=True, unique=True),
+        ),
+    ]
@@ -0,0 +1,141 @@
+import datetime
+
+from django.db import migrations
+
+
+PARTITION_SQL = """
+CREATE TABLE tickets_ticketauditlog_partitioned (
+    id uuid NOT NULL,
+    event_type varchar(50) NOT NULL,
+    message text NOT NULL,
+    metadata jsonb NOT NULL,
+    success boolean NOT NULL,
+    created_at timestamp with time zone NOT NULL,
+    actor_id bigint NULL,
+    ticket_id uuid NOT NULL
+) PARTITION BY RANGE (created_at);
+
+CREATE TABLE tickets_ticketauditlog_default
+    PARTITION OF tickets_ticketauditlog_partitioned DEFAULT;
+
+INSERT INTO tickets_ticketauditlog_partitioned
+    (id, event_type, message, metadata, success, created_at, actor_id, ticket_id)
+SELECT id, event_type, message, metadata, success, created_at, actor_id, ticket_id
+FROM tickets_ticketauditlog;
+
+DROP TABLE tickets_ticketauditlog;
+ALTER TABLE tickets_ticketauditlog_partitioned RENAME TO tickets_ticketauditlog;
+
+-- The partition key must be part of the primary key
+ALTER TABLE tickets_ticketauditlog
+    ADD CONSTRAINT tickets_ticketauditlog_pkey PRIMARY KEY (id, created_at);
+CREATE INDEX tickets_ticketauditlog_actor_id_35edc55e
+    ON tickets_ticketauditlog (actor_id);
+CREATE INDEX tickets_ticketauditlog_ticket_id_edb11ddc
+    ON tickets_ticketauditlog (ticket_id);
+ALTER TABLE tickets_ticketauditlog
+    ADD CONSTRAINT tickets_ticketauditlog_actor_id_35edc55e_fk_users_user_id
+    FOREIGN KEY (actor_id) REFERENCES users_user (id) DEFERRABLE INITIALLY DEFERRED;
+ALTER TABLE tickets_ticketauditlog
+    ADD CONSTRAINT tickets_ticketauditlog_ticket_id_edb11ddc_fk_tickets_ticket_id
+    FOREIGN KEY (ticket_id) REFERENCES tickets_ticket (id) DEFERRABLE INITIALLY DEFERRED;
+"""
+
+UNPARTITION_SQL = """
+CREATE TABLE tickets_ticketauditlog_plain (
+    id uuid NOT NULL,
+    event_type varchar(50) NOT NULL,
+    message text NOT NULL,
+    metadata jsonb NOT NULL,
+    success boolean NOT NULL,
+    created_at timestamp with time zone NOT NULL,
+    actor_id bigint NULL,
+    ticket_id uuid NOT NULL
+);
+
+INSERT INTO tickets_ticketauditlog_plain
+    (id, event_type, message, metadata, success, created_at, actor_id, ticket_id)
+SELECT id, event_type, message, metadata, success, created_at, actor_id, ticket_id
+FROM tickets_ticketauditlog;
+
+DROP TABLE tickets_ticketauditlog;
+ALTER TABLE tickets_ticketauditlog_plain RENAME TO tickets_ticketauditlog;
+
+ALTER TABLE tickets_ticketauditlog
+    ADD CONSTRAINT tickets_ticketauditlog_pkey PRIMARY KEY (id);
+CREATE INDEX tickets_ticketauditlog_actor_id_35edc55e
+    ON tickets_ticketauditlog (actor_id);
+CREATE INDEX tickets_ticketauditlog_ticket_id_edb11ddc
+    ON tickets_ticketauditlog (ticket_id);
+ALTER TABLE tickets_ticketauditlog
+    ADD CONSTRAINT tickets_ticketauditlog_actor_id_35edc55e_fk_users_user_id
+    FOREIGN KEY (actor_id) REFERENCES users_user (id) DEFERRABLE INITIALLY DEFERRED;
+ALTER TABLE tickets_ticketauditlog
+    ADD CONSTRAINT tickets_ticketauditlog_ticket_id_edb11ddc_fk_tickets_ticket_id
+    FOREIGN KEY (ticket_id) REFERENCES tickets_ticket (id) DEFERRABLE INITIALLY DEFERRED;
+"""
+
+
+# Frozen copy of the partitioning of tickets.audit_archive at the time of
+# this migration, so later changes to that module do not change it
+PARTITION_MONTHS_AHEAD = 2
+
+
+def _add_month(month):
+    if month.month == 12:
+        return month.replace(year=month.year + 1, month=1)
+    return month.replace(month=month.month + 1)
+
+
+def create_monthly_partitions(apps, schema_editor):
+    """
+    Split existing rows out of the DEFAULT partition into monthly partitions,
+    from the oldest entry through PARTITION_MONTHS_AHEAD months from now.
+    """
+    table = "tickets_ticketauditlog"
+    now = datetime.datetime.now(datetime.UTC)
+
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(f"SELECT MIN(created_at) FROM {table}")
+        (oldest,) = cursor.fetchone()
+
+        month = (oldest or now).astimezone(datetime.UTC).replace(
+            day=1, hour=0, minute=0, second=0, microsecond=0,
+        )
+        last = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+        for _ in range(PARTITION_MONTHS_AHEAD):
+            last = _add_month(last)
+
+        while month <= last:
+            end = _add_month(month)
+            name = f"{table}_p{month.year:04d}_{month.month:02d}"
+            cursor.execute(
+                f"CREATE TABLE {name} "
+                f"(LIKE {table} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)",
+            )
+            cursor.execute(
+                f"WITH moved AS ("
+                f"DELETE FROM {table}_default "
+                f"WHERE created_at >= %s AND created_at < %s RETURNING *"
+                f") INSERT INTO {name} SELECT * FROM moved",
+                [month, end],
+            )
+            cursor.execute(
+                f"ALTER TABLE {table} ATTACH PARTITION {name} "
+                f"FOR VALUES FROM (%s) TO (%s)",
+                [month, end],
+            )
+            month = end
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tickets', '0008_ticket_dedup_key'),
+        ('users', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunSQL(PARTITION_SQL, UNPARTITION_SQL),
+        migrations.RunPython(create_monthly_partitions, migrations.RunPython.noop),
+    ]
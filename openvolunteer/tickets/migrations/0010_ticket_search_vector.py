@@ -0,0 +1,36 @@
+# Generated by Django 5.2.9 on 2026-10-17 00:57
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations
+
+# Same vector as tickets.models.ticket_search_vector()
+BACKFILL_SEARCH_VECTOR = """
+UPDATE tickets_ticket AS ticket SET search_vector =
+    setweight(to_tsvector('simple', coalesce(ticket.name, '')), 'A')
+    || setweight(to_tsvector('simple', coalesce((
+        SELECT batch.name FROM tickets_ticketbatch AS batch
+        WHERE batch.id = ticket.batch_id
+    ), '')), 'B')
+    || setweight(to_tsvector('simple', coalesce(ticket.description, '')), 'C')
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tickets', '0009_partition_ticketauditlog'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='ticket',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.RunSQL(BACKFILL_SEARCH_VECTOR, migrations.RunSQL.noop),
+        migrations.AddIndex(
+            model_name='ticket',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='tickets_ticket_search_gin'),
+        ),
+    ]
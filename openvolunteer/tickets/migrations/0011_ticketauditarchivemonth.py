@@ -0,0 +1,25 @@
+# Generated by Django 5.2.9 on 2026-10-17 01:49
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tickets', '0010_ticket_search_vector'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TicketAuditArchiveMonth',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('month', models.DateField(help_text='First day of the archived (UTC) month')),
+                ('ticket', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='audit_archive_months', to='tickets.ticket')),
+            ],
+            options={
+                'unique_together': {('ticket', 'month')},
+            },
+        ),
+    ]
@@ -2,6 +2,9 @@
 import uuid
 
 from django.conf import settings
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVector
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
 from django.utils import timezone
 from django.utils.functional import cached_property
@@ -118,6 +121,61 @@ class TicketBatch(models.Model):
     def __str__(self):
         return self.name
 
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get("update_fields")
+        # The batch name is part of its tickets' search vectors. Batches that
+        # were not loaded from the database are taken as renamed.
+        renamed = (
+            not self._state.adding
+            and "name" in self.__dict__
+            and self.name != getattr(self, "_loaded_name", None)
+            and (update_fields is None or "name" in update_fields)
+        )
+        super().save(*args, **kwargs)
+        if renamed:
+            self.tickets.update_search_vector()
+        if update_fields is None or "name" in update_fields:
+            self._loaded_name = self.__dict__.get("name")
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        batch = super().from_db(db, field_names, values)
+        batch._loaded_name = batch.__dict__.get("name")  # noqa: SLF001
+        return batch
+
+
+# Text search configuration of Ticket.search_vector. "simple" does not stem,
+# so prefixes typed in the search box match the indexed words
+TICKET_SEARCH_CONFIG = "simple"
+
+# Fields of a ticket that Ticket.search_vector is built from
+TICKET_SEARCH_FIELDS = {"name", "description", "batch", "batch_id"}
+
+# Their attnames, as kept in the instance __dict__
+TICKET_SEARCH_ATTNAMES = ("name", "description", "batch_id")
+
+
+def ticket_search_vector():
+    """
+    Weighted tsvector of a ticket: name (A) > batch name (B) > description (C).
+
+    Usable in UPDATE queries, so the batch name is read with a subquery
+    rather than a join.
+    """
+    batch_name = models.Subquery(
+        TicketBatch.objects.filter(pk=models.OuterRef("batch_id")).values("name"),
+    )
+    return (
+        SearchVector("name", weight="A", config=TICKET_SEARCH_CONFIG)
+        + SearchVector(batch_name, weight="B", config=TICKET_SEARCH_CONFIG)
+        + SearchVector("description", weight="C", config=TICKET_SEARCH_CONFIG)
+    )
+
+
+class TicketQuerySet(models.QuerySet):
+    def update_search_vector(self):
+        return self.update(search_vector=ticket_search_vector())
+
 
 class Ticket(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
@@ -170,6 +228,16 @@ class Ticket(models.Model):
         help_text="Template ticket was created from",
     )
 
+    # Set once on creation; ON CONFLICT DO NOTHING inserts rely on it
+    dedup_key = models.CharField(
+        max_length=200,
+        null=True,
+        blank=True,
+        unique=True,
+        editable=False,
+        help_text="Template and target of a generated ticket, unique per ticket",
+    )
+
     name = models.CharField(max_length=200)
     description = models.TextField(
         blank=True,
@@ -217,6 +285,16 @@ class Ticket(models.Model):
     modified_at = models.DateTimeField(auto_now=True)
     completed_at = models.DateTimeField(null=True, blank=True)
 
+    # Maintained by save(), bulk ticket generation and TicketBatch renames
+    search_vector = SearchVectorField(null=True, editable=False)
+
+    objects = TicketQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            GinIndex(fields=["search_vector"], name="tickets_ticket_search_gin"),
+        ]
+
     def __str__(self):
         return self.name
 
@@ -232,8 +310,62 @@ class Ticket(models.Model):
         if self.status != TicketStatus.COMPLETED:
             self.completed_at = None
 
+        if self._state.adding and self.dedup_key is None:
+            self.dedup_key = self.compute_dedup_key()
+
+        # New tickets and tickets that were not loaded from the database have
+        # no loaded values to compare with
+        update_fields = kwargs.get("update_fields")
+        search_changed = (
+            self._state.adding
+            or self._search_values() != getattr(self, "_loaded_search_values", None)
+        ) and (update_fields is None or TICKET_SEARCH_FIELDS & set(update_fields))
+
         super().save(*args, **kwargs)
 
+        if search_changed:
+            Ticket.objects.filter(pk=self.pk).update_search_vector()
+        # Values left out of update_fields are still unsaved
+        if update_fields is None:
+            self._loaded_search_values = self._search_values()
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        ticket = super().from_db(db, field_names, values)
+        ticket._loaded_search_values = ticket._search_values()  # noqa: SLF001
+        return ticket
+
+    def _search_values(self):
+        """
+        Loaded (not deferred) fields of TICKET_SEARCH_ATTNAMES.
+        """
+        return {
+            attname: self.__dict__[attname]
+            for attname in TICKET_SEARCH_ATTNAMES
+            if attname in self.__dict__
+        }
+
+    def compute_dedup_key(self):
+        """
+        Key identifying a ticket generated from a template for a given target.
+
+        Tickets without a template are never deduplicated. The key is built from
+        ids at creation time, so later SET_NULL cascades (deleted event, shift or
+        person) can not make two tickets collide.
+        """
+        if self.template_id is None:
+            return None
+        return ":".join(
+            str(value) if value else "-"
+            for value in (
+                self.template_id,
+                self.org_id,
+                self.person_id,
+                self.event_id,
+                self.shift_id,
+            )
+        )
+
     @cached_property
     def manual_actions(self):
         """
@@ -299,3 +431,129 @@ class TicketAuditLog(models.Model):
 
     def __str__(self):
         return f"{self.ticket} - {self.event_type}"
+
+
+class TicketAuditArchiveMonth(models.Model):
+    """
+    A month whose audit log archive holds entries of `ticket`.
+
+    Written when a partition is archived, so reading the archived activity of
+    a ticket only opens the archives that have some.
+    """
+
+    ticket = models.ForeignKey(
+        "tickets.Ticket",
+        on_delete=models.CASCADE,
+        related_name="audit_archive_months",
+    )
+    month = models.DateField(help_text="First day of the archived (UTC) month")
+
+    class Meta:
+        unique_together = ("ticket", "month")
+
+    def __str__(self):
+        return f"{self.ticket} - {self.month:%Y-%m}"
+
+
+class TicketGenerationJobStatus(models.TextChoices):
+    PENDING = "pending", "Pending"
+    RUNNING = "running", "Running"
+    COMPLETED = "completed", "Completed"
+    FAILED = "failed", "Failed"
+
+
+class TicketGenerationJob(models.Model):
+    """
+    Background generation of a TicketBatch for an Event.
+
+    Tracks state and progress so the UI can poll while a worker generates.
+    """
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+
+    org = models.ForeignKey(
+        Organization,
+        on_delete=models.CASCADE,
+        related_name="ticket_generation_jobs",
+    )
+
+    event = models.ForeignKey(
+        "events.Event",
+        on_delete=models.CASCADE,
+        related_name="ticket_generation_jobs",
+    )
+
+    shift = models.ForeignKey(
+        "events.Shift",
+        null=True,
+        blank=True,
+        on_delete=models.SET_NULL,
+        related_name="ticket_generation_jobs",
+    )
+
+    ticket_templates = models.ManyToManyField(
+        TicketTemplate,
+        blank=True,
+        related_name="generation_jobs",
+        help_text="Templates to generate; empty means the event template defaults",
+    )
+
+    person_ids = models.JSONField(
+        null=True,
+        blank=True,
+        help_text="Restrict generation to these people; null means all assigned",
+    )
+
+    include_default_shift = models.BooleanField(default=True)
+    batch_name = models.CharField(max_length=200, blank=True)
+    reason = models.TextField(blank=True)
+
+    batch = models.ForeignKey(
+        TicketBatch,
+        null=True,
+        blank=True,
+        on_delete=models.SET_NULL,
+        related_name="generation_jobs",
+    )
+
+    status = models.CharField(
+        max_length=20,
+        choices=TicketGenerationJobStatus,
+        default=TicketGenerationJobStatus.PENDING,
+    )
+
+    total = models.PositiveIntegerField(default=0)
+    processed = models.PositiveIntegerField(default=0)
+    created_count = models.PositiveIntegerField(default=0)
+    errors = models.JSONField(default=list, blank=True)
+
+    created_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        null=True,
+        blank=True,
+        on_delete=models.SET_NULL,
+        related_name="ticket_generation_jobs",
+    )
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ["-created_at"]
+
+    def __str__(self):
+        return f"{self.event} ({self.get_status_display()})"
+
+    @property
+    def is_finished(self):
+        return self.status in {
+            TicketGenerationJobStatus.COMPLETED,
+            TicketGenerationJobStatus.FAILED,
+        }
+
+    @property
+    def progress_percent(self):
+        if not self.total:
+            return 100 if self.is_finished else 0
+        return min(100, int(self.processed * 100 / self.total))
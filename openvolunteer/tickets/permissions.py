@@ -1,12 +1,18 @@
+from openvolunteer.events.models import Event
 from openvolunteer.events.permissions import (
     user_can_assign_people as user_can_assign_people_event,
 )
+from openvolunteer.orgs.models import OrgRole
+from openvolunteer.orgs.permissions import permission_context
 from openvolunteer.orgs.permissions import user_can_manage_members
 from openvolunteer.orgs.permissions import user_can_participate
 from openvolunteer.orgs.permissions import user_can_view_org
 
+from .models import Ticket
 from .models import TicketStatus
 
+MANAGE_MEMBER_ROLES = {OrgRole.OWNER, OrgRole.ADMIN}
+
 
 def user_can_view_ticket(user, ticket):
     if not user.is_authenticated:
@@ -18,8 +24,8 @@ def user_can_view_ticket(user, ticket):
     if ticket.assigned_to == user:
         return True
 
-    if ticket.event and ticket.event.org:
-        if user_can_view_org(user, ticket.event.org):
+    if ticket.event and ticket.event.org_id:
+        if user_can_view_org(user, ticket.event.org_id):
             return True
 
     return False
@@ -51,12 +57,12 @@ def user_can_claim_ticket(user, ticket, event=None):
         if event.owned_by == user:
             return True
 
-    if ticket.org:
-        if not user_can_participate(user, ticket.org):
+    if ticket.org_id:
+        if not user_can_participate(user, ticket.org_id):
             return False
         if not ticket.claimable:
             # Only certain people can claim unclaimable tickets
-            if user_can_manage_members(user, ticket.org):
+            if user_can_manage_members(user, ticket.org_id):
                 return True
     # Default to claimable tickets flag
     return ticket.claimable
@@ -81,7 +87,7 @@ def user_can_edit_ticket(user, ticket, event=None):
     if event:
         if event.owned_by == user:
             return True
-        if user_can_manage_members(user, event.org):
+        if user_can_manage_members(user, event.org_id):
             return True
     return False
 
@@ -90,3 +96,85 @@ def user_can_run_action(user, ticket, event):
     if ticket.status != TicketStatus.INPROGRESS:
         return False
     return user_can_edit_ticket(user, ticket, event)
+
+
+def _ticket_events(tickets):
+    """
+    {event id: event} for `tickets`, reusing events already loaded on them.
+    """
+    event_field = Ticket._meta.get_field("event")  # noqa: SLF001
+    events = {}
+    for ticket in tickets:
+        if ticket.event_id and event_field.is_cached(ticket) and ticket.event:
+            events[ticket.event_id] = ticket.event
+
+    missing = {ticket.event_id for ticket in tickets if ticket.event_id} - set(events)
+    if missing:
+        events.update(
+            Event.objects.only("id", "org_id", "owned_by_id").in_bulk(missing),
+        )
+    return events
+
+
+def ticket_permission_flags(user, tickets):
+    """
+    Permission flags of `user` for each of `tickets`, for rendering lists.
+
+    Returns {ticket id: {"can_view", "can_claim", "can_unclaim", "can_edit",
+    "can_run_action"}}, matching the user_can_* functions above. Costs at most
+    one query for the events not already loaded on the tickets and one for the
+    user's memberships (none within a request that already loaded them).
+    """
+    tickets = list(tickets)
+    if not user.is_authenticated:
+        return {
+            ticket.id: dict.fromkeys(
+                ("can_view", "can_claim", "can_unclaim", "can_edit", "can_run_action"),
+                False,
+            )
+            for ticket in tickets
+        }
+
+    is_admin = user.is_staff or user.is_superuser
+    roles = permission_context(user).roles
+    events = _ticket_events(tickets)
+
+    def can_manage_members(org_id):
+        return user.is_superuser or roles.get(org_id) in MANAGE_MEMBER_ROLES
+
+    flags = {}
+    for ticket in tickets:
+        event = events.get(ticket.event_id)
+        is_assignee = ticket.assigned_to_id == user.pk
+        is_reporter = ticket.reporter_id == user.pk
+        is_event_owner = event is not None and event.owned_by_id == user.pk
+
+        can_view = (
+            is_admin or is_assignee or (event is not None and event.org_id in roles)
+        )
+
+        if is_admin or is_reporter or is_event_owner:
+            can_claim = True
+        elif ticket.org_id and roles.get(ticket.org_id) in (None, OrgRole.VIEWER):
+            can_claim = False
+        elif ticket.org_id and not ticket.claimable:
+            can_claim = can_manage_members(ticket.org_id)
+        else:
+            can_claim = ticket.claimable
+
+        can_edit = (
+            is_admin
+            or is_assignee
+            or is_reporter
+            or is_event_owner
+            or (event is not None and can_manage_members(event.org_id))
+        )
+
+        flags[ticket.id] = {
+            "can_view": can_view,
+            "can_claim": can_claim,
+            "can_unclaim": ticket.assigned_to_id is not None and can_claim,
+            "can_edit": can_edit,
+            "can_run_action": ticket.status == TicketStatus.INPROGRESS and can_edit,
+        }
+    return flags
@@ -5,6 +5,7 @@ from django.db.models import When
 
 from .models import Ticket
 from .models import TicketStatus
+from .permissions import ticket_permission_flags
 
 
 def get_filtered_tickets(  # noqa: PLR0913
@@ -17,6 +18,7 @@ def get_filtered_tickets(  # noqa: PLR0913
     exclude_statuses=None,
     claimed_by=None,
     limit=10,
+    user=None,
 ):
     qs = Ticket.objects.all()
     claim_qs = {}
@@ -62,6 +64,11 @@ def get_filtered_tickets(  # noqa: PLR0913
         .order_by("finished_sort", "priority", "-created_at")[:limit]
     )
 
+    if user is not None:
+        # Evaluate the page once and batch the per-row permission checks
+        tickets = list(tickets)
+        ctx["ticket_permissions"] = ticket_permission_flags(user, tickets)
+
     ctx["tickets"] = tickets
     ctx["ticket_count"] = qs.count()
 
@@ -0,0 +1,7 @@
+from openvolunteer.core.org_preferred import OrgPreferredResolver
+
+from .models import TicketTemplate
+
+# Template of an org, else the global template of the same name; see
+# core.org_preferred
+ticket_template_resolver = OrgPreferredResolver(TicketTemplate)
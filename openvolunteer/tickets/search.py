@@ -0,0 +1,45 @@
+"""
+Full text search over Ticket.search_vector.
+"""
+
+import re
+
+from django.contrib.postgres.search import SearchQuery
+from django.contrib.postgres.search import SearchRank
+from django.db.models import F
+
+from .models import TICKET_SEARCH_CONFIG
+
+SEARCH_TERM_RE = re.compile(r"\w+")
+
+
+def ticket_search_query(text):
+    """
+    SearchQuery matching tickets containing every word of `text`, each as a
+    prefix, or None if `text` has no words.
+    """
+    terms = SEARCH_TERM_RE.findall(text.lower())
+    if not terms:
+        return None
+    # Terms only contain word characters, so they are safe in a raw tsquery
+    return SearchQuery(
+        " & ".join(f"{term}:*" for term in terms),
+        search_type="raw",
+        config=TICKET_SEARCH_CONFIG,
+    )
+
+
+def full_text_search(queryset, text):
+    """
+    Tickets of `queryset` matching `text`, best matches first and otherwise in
+    the queryset ordering. Annotates `search_rank`.
+    """
+    query = ticket_search_query(text)
+    if query is None:
+        return queryset.none()
+
+    return (
+        queryset.filter(search_vector=query)
+        .annotate(search_rank=SearchRank(F("search_vector"), query))
+        .order_by("-search_rank", *queryset.query.order_by)
+    )
@@ -1,43 +1,52 @@
 import os
+from functools import lru_cache
 from zoneinfo import ZoneInfo
 
 from django.db import transaction
-from django.db.models import Case
-from django.db.models import IntegerField
-from django.db.models import Q
+from django.db.models import Prefetch
 from django.db.models import QuerySet
-from django.db.models import Value
-from django.db.models import When
 from django.template import Context
-from django.template import Template
+from django.utils import timezone
 
 from openvolunteer.events.models import ShiftAssignment
+from openvolunteer.orgs.models import DEFAULT_DISPLAY_TIMEZONES
 from openvolunteer.people.models import Person
 
 from .actions.models import TicketAction
-from .audit import log_ticket_event
+from .actions.models import TicketActionTemplate
+from .audit import log_ticket_events
 from .models import Ticket
 from .models import TicketAuditEvent
 from .models import TicketBatch
+from .models import TicketGenerationJobStatus
 from .models import TicketTemplate
+from .resolvers import ticket_template_resolver
+from .template_cache import ticket_template_cache
 
+# Rows per INSERT when generating tickets in bulk
+BULK_CREATE_BATCH_SIZE = 1000
 
-def render_template(template_str: str, context: dict) -> str:
-    return Template(template_str).render(Context(context)).strip()
+# Assignments generated (and committed) per step of a background job
+GENERATION_JOB_CHUNK_SIZE = 250
 
 
-# TODO: Move to another central file
-TIMEZONES = {
-    "utc": ("UTC", ZoneInfo("UTC")),
-    "est": ("EST", ZoneInfo("America/New_York")),
-    "cdt": ("CDT", ZoneInfo("America/Chicago")),
-    "mst": ("MT", ZoneInfo("America/Denver")),
-    "pdt": ("PDT", ZoneInfo("America/Los_Angeles")),
-    "cet": ("CET", ZoneInfo("Europe/Paris")),
-}
+def render_ticket_template(ticket_template, field: str, context: dict) -> str:
+    """
+    Render a TicketTemplate field using the compiled template cache.
+    """
+    compiled = ticket_template_cache.get(ticket_template, field)
+    return compiled.render(Context(context)).strip()
+
+
+DEFAULT_TIMEZONES = tuple(
+    (key, label, zone) for key, (label, zone) in DEFAULT_DISPLAY_TIMEZONES.items()
+)
+
+# Distinct (datetime, timezones) pairs kept by format_event_times
+EVENT_TIMES_CACHE_SIZE = 1024
 
 
-def format_event_times(dt):
+def format_event_times(dt, timezones=None):
     """
     Returns a dict suitable for template access:
 
@@ -45,15 +54,23 @@ def format_event_times(dt):
     starts_at.cdt
     starts_at.date.utc
     starts_at.time.cdt
+
+    `timezones` is a tuple of (key, label, zone name), usually
+    `org.display_timezones`. Results are memoized per datetime, so the
+    returned dict is shared and must not be mutated.
     """
+    return _format_event_times(dt, timezones or DEFAULT_TIMEZONES)
+
 
+@lru_cache(maxsize=EVENT_TIMES_CACHE_SIZE)
+def _format_event_times(dt, timezones):
     result = {
         "date": {},
         "time": {},
     }
 
-    for key, (label, tz) in TIMEZONES.items():
-        localized = dt.astimezone(tz)
+    for key, label, zone in timezones:
+        localized = dt.astimezone(ZoneInfo(zone))
 
         # Full datetime string
         result[key] = localized.strftime(f"%b %-d, %Y %-I:%M %p {label}")
@@ -67,13 +84,11 @@ def format_event_times(dt):
     return result
 
 
-def create_actions_for_ticket(*, ticket, ticket_template):
+def build_actions_for_ticket(*, ticket, action_templates):
     """
-    Instantiate TicketActions from TicketActionTemplates.
+    Build (unsaved) TicketActions for a ticket from TicketActionTemplates.
     """
-    action_templates = ticket_template.action_templates.filter(is_active=True)
-
-    actions = [
+    return [
         TicketAction(
             ticket=ticket,
             template=action_tmpl,
@@ -87,30 +102,98 @@ def create_actions_for_ticket(*, ticket, ticket_template):
         for action_tmpl in action_templates
     ]
 
-    TicketAction.objects.bulk_create(actions)
 
+def create_actions_for_ticket(*, ticket, ticket_template):
+    """
+    Instantiate TicketActions from TicketActionTemplates.
+    """
+    action_templates = ticket_template.action_templates.filter(is_active=True)
 
-# ruff: noqa: PLR0913, PLR0912, C901
-@transaction.atomic
-def generate_tickets_for_event(
+    TicketAction.objects.bulk_create(
+        build_actions_for_ticket(ticket=ticket, action_templates=action_templates),
+    )
+
+
+def safe_attr(obj, attr, default=None):
+    return getattr(obj, attr, default) if obj is not None else default
+
+
+def safe_name(user):
+    if user is None:
+        return None
+    return user.name or user.username
+
+
+def build_shared_ticket_context(
     *,
-    event,
+    template,
+    org,
     created_by,
-    ticket_templates=None,
-    person_queryset=None,
-    batch_name=None,
-    reason="",
+    event=None,
     shift=None,
-    include_default_shift=True,
 ):
     """
-    Generate a TicketBatch + Tickets for an Event.
+    Person-independent part of the ticket template context.
 
-    - One ticket per (TicketTemplate by Person)
-    - Persons are derived from shift assignments unless overridden
-    - Tickets are NOT generated for unassigned people
+    It only depends on (template, event, shift), so it can be built once and
+    reused for every person of a batch.
+    """
+    timezones = org.display_timezones
+
+    def event_times(dt):
+        return format_event_times(dt, timezones) if dt else None
+
+    return {
+        "org_name": org.name,
+        # Event-related
+        "event_title": safe_attr(event, "title"),
+        "event_owner": safe_name(safe_attr(event, "owned_by")),
+        "event_type": safe_attr(safe_attr(event, "template"), "name"),
+        "event_starts_at": event_times(safe_attr(event, "starts_at")),
+        "event_ends_at": event_times(safe_attr(event, "ends_at")),
+        # Shift-related
+        "shift_starts_at": event_times(safe_attr(shift, "starts_at")),
+        "shift_ends_at": event_times(safe_attr(shift, "ends_at")),
+        # People
+        "person": None,
+        # Ticket / task
+        "task_name": safe_attr(template, "name"),
+        "task_type": safe_attr(safe_attr(event, "template"), "name"),
+        # Reporter
+        "reporter_name": safe_name(created_by),
+    }
+
+
+def build_ticket_context(
+    *,
+    template,
+    org,
+    created_by,
+    person=None,
+    event=None,
+    shift=None,
+):
+    """
+    Template context used to render ticket names and descriptions.
     """
+    return {
+        **build_shared_ticket_context(
+            template=template,
+            org=org,
+            created_by=created_by,
+            event=event,
+            shift=shift,
+        ),
+        "person": person,
+    }
+
 
+# ruff: noqa: PLR0913
+def resolve_ticket_templates(*, event, ticket_templates=None):
+    """
+    Coerce `ticket_templates` (default: the event template's active ones) to a
+    list with active action templates prefetched.
+    """
     if not event.template:
         msg = "Event has no EventTemplate"
         raise ValueError(msg)
@@ -124,13 +207,31 @@ def generate_tickets_for_event(
         ticket_templates = TicketTemplate.objects.filter(
             id__in=[t.id for t in ticket_templates],
         )
-    if not ticket_templates.exists():
+    ticket_templates = list(
+        ticket_templates.prefetch_related(
+            Prefetch(
+                "action_templates",
+                queryset=TicketActionTemplate.objects.filter(is_active=True),
+                to_attr="active_action_templates",
+            ),
+        ),
+    )
+    if not ticket_templates:
         msg = "No active TicketTemplates attached to EventTemplate"
         raise ValueError(msg)
+    return ticket_templates
 
-    # --------------------
-    # Resolve assignments / people
-    # --------------------
+
+def event_assignments(
+    *,
+    event,
+    person_queryset=None,
+    shift=None,
+    include_default_shift=True,
+):
+    """
+    ShiftAssignments that event tickets are generated for.
+    """
     if not shift:
         assignments_qs = ShiftAssignment.objects.filter(
             shift__event=event,
@@ -150,16 +251,89 @@ def generate_tickets_for_event(
     if person_queryset is not None:
         assignments_qs = assignments_qs.filter(person__in=person_queryset)
 
-    assignments = list(assignments_qs)
+    return assignments_qs
+
+
+def resolve_event_generation(
+    *,
+    event,
+    ticket_templates=None,
+    person_queryset=None,
+    shift=None,
+    include_default_shift=True,
+):
+    """
+    Validate a ticket generation for an Event.
+
+    Returns (ticket_templates, assignments) or raises ValueError.
+    """
+    ticket_templates = resolve_ticket_templates(
+        event=event,
+        ticket_templates=ticket_templates,
+    )
+
+    assignments = list(
+        event_assignments(
+            event=event,
+            person_queryset=person_queryset,
+            shift=shift,
+            include_default_shift=include_default_shift,
+        ),
+    )
 
     if not assignments:
         msg = "No assigned people found for event"
         raise ValueError(msg)
 
-    # --------------------
-    # Create batch
-    # --------------------
-    batch = TicketBatch.objects.create(
+    for tmpl in ticket_templates:
+        if tmpl.max_tickets and tmpl.max_tickets < len(assignments):
+            msg = f"TicketTemplate '{tmpl.name}' max_tickets exceeded"
+            raise ValueError(
+                msg,
+            )
+
+    return ticket_templates, assignments
+
+
+def count_event_tickets(
+    *,
+    event,
+    ticket_templates=None,
+    person_queryset=None,
+    shift=None,
+    include_default_shift=True,
+):
+    """
+    Upper bound of tickets a generation would create, without loading rows.
+    """
+    if ticket_templates is None:
+        if not event.template:
+            return 0
+        template_count = event.template.ticket_templates.filter(
+            is_active=True,
+        ).count()
+    else:
+        template_count = len(ticket_templates)
+
+    return template_count * (
+        event_assignments(
+            event=event,
+            person_queryset=person_queryset,
+            shift=shift,
+            include_default_shift=include_default_shift,
+        ).count()
+    )
+
+
+def create_event_ticket_batch(
+    *,
+    event,
+    created_by,
+    shift=None,
+    batch_name=None,
+    reason="",
+):
+    return TicketBatch.objects.create(
         org=event.org,
         event=event,
         shift=shift,
@@ -168,31 +342,250 @@ def generate_tickets_for_event(
         created_by=created_by,
     )
 
-    # --------------------
-    # Generate tickets
-    # --------------------
 
-    tickets = []
-    for tmpl in ticket_templates:
-        if tmpl.max_tickets and tmpl.max_tickets < len(assignments):
-            msg = f"TicketTemplate '{tmpl.name}' max_tickets exceeded"
-            raise ValueError(
-                msg,
+@transaction.atomic
+def generate_tickets_for_event(
+    *,
+    event,
+    created_by,
+    ticket_templates=None,
+    person_queryset=None,
+    batch_name=None,
+    reason="",
+    shift=None,
+    include_default_shift=True,
+):
+    """
+    Generate a TicketBatch + Tickets for an Event.
+
+    - One ticket per (TicketTemplate by Person)
+    - Persons are derived from shift assignments unless overridden
+    - Tickets are NOT generated for unassigned people
+    """
+    ticket_templates, assignments = resolve_event_generation(
+        event=event,
+        ticket_templates=ticket_templates,
+        person_queryset=person_queryset,
+        shift=shift,
+        include_default_shift=include_default_shift,
+    )
+
+    batch = create_event_ticket_batch(
+        event=event,
+        created_by=created_by,
+        shift=shift,
+        batch_name=batch_name,
+        reason=reason,
+    )
+
+    tickets = bulk_create_tickets(
+        templates=ticket_templates,
+        org=event.org,
+        event=event,
+        targets=[
+            (assignment.person, shift if shift else assignment.shift)
+            for assignment in assignments
+        ],
+        batch=batch,
+        created_by=created_by,
+    )
+    return batch, tickets
+
+
+def run_ticket_generation_job(job, chunk_size=GENERATION_JOB_CHUNK_SIZE):
+    """
+    Execute a TicketGenerationJob.
+
+    Unlike generate_tickets_for_event(), assignments are processed in chunks
+    that each commit on their own, so progress is visible while the job runs
+    and locks are only held per chunk. Re-running a failed job is safe:
+    already generated tickets are skipped by deduplication.
+    """
+    job.status = TicketGenerationJobStatus.RUNNING
+    job.started_at = timezone.now()
+    job.save(update_fields=["status", "started_at"])
+
+    try:
+        person_queryset = None
+        if job.person_ids is not None:
+            person_queryset = Person.objects.filter(id__in=job.person_ids)
+
+        ticket_templates, assignments = resolve_event_generation(
+            event=job.event,
+            ticket_templates=job.ticket_templates.all() or None,
+            person_queryset=person_queryset,
+            shift=job.shift,
+            include_default_shift=job.include_default_shift,
+        )
+
+        job.batch = create_event_ticket_batch(
+            event=job.event,
+            created_by=job.created_by,
+            shift=job.shift,
+            batch_name=job.batch_name,
+            reason=job.reason,
+        )
+        job.total = len(ticket_templates) * len(assignments)
+        job.save(update_fields=["batch", "total"])
+
+        for start in range(0, len(assignments), chunk_size):
+            chunk = assignments[start : start + chunk_size]
+            tickets = bulk_create_tickets(
+                templates=ticket_templates,
+                org=job.event.org,
+                event=job.event,
+                targets=[
+                    (assignment.person, job.shift or assignment.shift)
+                    for assignment in chunk
+                ],
+                batch=job.batch,
+                created_by=job.created_by,
             )
+            job.processed += len(ticket_templates) * len(chunk)
+            job.created_count += len(tickets)
+            job.save(update_fields=["processed", "created_count"])
+    except Exception as exc:
+        job.status = TicketGenerationJobStatus.FAILED
+        job.errors = [*job.errors, str(exc)]
+        job.finished_at = timezone.now()
+        job.save(update_fields=["status", "errors", "finished_at"])
+        if not isinstance(exc, ValueError):
+            raise
+        return job
+
+    job.status = TicketGenerationJobStatus.COMPLETED
+    job.finished_at = timezone.now()
+    job.save(update_fields=["status", "finished_at"])
+    return job
 
-        for assignment in assignments:
-            ticket = create_ticket(
-                template=tmpl,
-                org=event.org,
+
+@transaction.atomic
+def bulk_create_tickets(
+    *,
+    templates,
+    org,
+    created_by,
+    targets,
+    event=None,
+    batch=None,
+):
+    """
+    Create one Ticket per (TicketTemplate by target) in a fixed number of queries.
+
+    `targets` is an iterable of (person, shift) pairs. This is the set-based
+    counterpart of create_ticket():
+    - names / descriptions are rendered in memory
+    - tickets are inserted with ON CONFLICT DO NOTHING on Ticket.dedup_key, so
+      duplicates are skipped by the database, also across concurrent workers
+    - actions and audit logs are bulk inserted for the tickets actually created
+
+    Templates may carry a prefetched `active_action_templates` list; otherwise
+    their active action templates are loaded here.
+
+    Returns the list of created tickets.
+    """
+    targets = list(targets)
+    if not templates or not targets:
+        return []
+
+    # --------------------
+    # Render tickets in memory
+    # --------------------
+    tickets = []
+    ticket_action_templates = {}
+    shared_contexts = {}
+    for tmpl in templates:
+        action_templates = getattr(tmpl, "active_action_templates", None)
+        if action_templates is None:
+            action_templates = list(tmpl.action_templates.filter(is_active=True))
+
+        for person, shift in targets:
+            ticket = Ticket(
+                org=org,
                 event=event,
-                person=assignment.person,
-                shift=shift if shift else assignment.shift,
+                person=person,
                 batch=batch,
-                created_by=created_by,
+                shift=shift,
+                template=tmpl,
+                reporter=created_by,
+                priority=tmpl.default_priority,
+                claimable=tmpl.claimable,
+            )
+            ticket.dedup_key = ticket.compute_dedup_key()
+            if ticket.dedup_key in ticket_action_templates:
+                continue
+
+            shared_key = (tmpl.pk, shift.pk if shift else None)
+            if shared_key not in shared_contexts:
+                shared_contexts[shared_key] = build_shared_ticket_context(
+                    template=tmpl,
+                    org=org,
+                    created_by=created_by,
+                    event=event,
+                    shift=shift,
+                )
+            context = {**shared_contexts[shared_key], "person": person}
+
+            ticket.name = render_ticket_template(
+                tmpl,
+                "ticket_name_template",
+                context,
+            )
+            ticket.description = render_ticket_template(
+                tmpl,
+                "description_template",
+                context,
             )
-
             tickets.append(ticket)
-    return batch, tickets
+            ticket_action_templates[ticket.dedup_key] = action_templates
+
+    # --------------------
+    # Bulk insert
+    # --------------------
+    Ticket.objects.bulk_create(
+        tickets,
+        batch_size=BULK_CREATE_BATCH_SIZE,
+        ignore_conflicts=True,
+    )
+
+    # ignore_conflicts does not report which rows were inserted; ids are
+    # generated client side, so look up which of ours made it in
+    inserted_ids = set(
+        Ticket.objects.filter(id__in=[ticket.id for ticket in tickets]).values_list(
+            "id",
+            flat=True,
+        ),
+    )
+    tickets = [ticket for ticket in tickets if ticket.id in inserted_ids]
+    Ticket.objects.filter(id__in=inserted_ids).update_search_vector()
+
+    TicketAction.objects.bulk_create(
+        [
+            action
+            for ticket in tickets
+            for action in build_actions_for_ticket(
+                ticket=ticket,
+                action_templates=ticket_action_templates[ticket.dedup_key],
+            )
+        ],
+        batch_size=BULK_CREATE_BATCH_SIZE,
+    )
+    log_ticket_events(
+        (
+            (
+                ticket,
+                TicketAuditEvent.CREATED,
+                {
+                    "template": ticket.template.name,
+                    "batch": str(batch.id) if batch else None,
+                },
+            )
+            for ticket in tickets
+        ),
+        actor=created_by,
+    )
+
+    return tickets
 
 
 @transaction.atomic
@@ -211,108 +604,36 @@ def create_ticket(
     - system on-create action
     - user actions
     - audit logging
-    """
-
-    # Deduplication
-    if Ticket.objects.filter(
-        template=template,
-        org=org,
-        person=person if person else None,
-        event=event if event else None,
-        shift=shift if shift else None,
-    ).exists():
-        return None
-
-    def safe_attr(obj, attr, default=None):
-        return getattr(obj, attr, default) if obj is not None else default
 
-    def safe_name(user):
-        if user is None:
-            return None
-        return user.name or user.username
-
-    context = {
-        "org_name": org.name,
-        # Event-related
-        "event_title": safe_attr(event, "title"),
-        "event_owner": safe_name(safe_attr(event, "owned_by")),
-        "event_type": safe_attr(safe_attr(event, "template"), "name"),
-        "event_starts_at": (
-            format_event_times(event.starts_at) if event and event.starts_at else None
-        ),
-        "event_ends_at": (
-            format_event_times(event.ends_at) if event and event.ends_at else None
-        ),
-        # Shift-related
-        "shift_starts_at": (
-            format_event_times(shift.starts_at) if shift and shift.starts_at else None
-        ),
-        "shift_ends_at": (
-            format_event_times(shift.ends_at) if shift and shift.ends_at else None
-        ),
-        # People
-        "person": None,
-        # Ticket / task
-        "task_name": safe_attr(template, "name"),
-        "task_type": safe_attr(safe_attr(event, "template"), "name"),
-        # Reporter
-        "reporter_name": safe_name(created_by),
-    }
+    Returns None if a ticket already exists for this template and target.
+    """
 
     # Lazy-load person only if provided and needed
+    person_obj = None
     if person is not None:
         if isinstance(person, Person):
             person_obj = person
         else:
             person_obj = Person.objects.get(id=person)
-        context["person"] = person_obj
 
-    name = render_template(template.ticket_name_template, context)
-    description = render_template(template.description_template, context)
-
-    ticket = Ticket.objects.create(
-        name=name,
-        description=description,
+    tickets = bulk_create_tickets(
+        templates=[template],
         org=org,
+        created_by=created_by,
+        targets=[(person_obj, shift)],
         event=event,
-        person=person,
         batch=batch,
-        shift=shift,
-        template=template,
-        reporter=created_by,
-        priority=template.default_priority,
-        claimable=template.claimable,
-    )
-
-    # Create user-visible actions
-    create_actions_for_ticket(
-        ticket=ticket,
-        ticket_template=template,
     )
+    return tickets[0] if tickets else None
 
-    log_ticket_event(
-        ticket=ticket,
-        event_type=TicketAuditEvent.CREATED,
-        message="Ticket created",
-        actor=created_by,
-        metadata={
-            "template": template.name,
-            "batch": str(batch.id) if batch else None,
-        },
-    )
 
-    return ticket
+def get_ticket_templates_for_org(names, org) -> dict:
+    """
+    {name: TicketTemplate} of `names`, preferring the templates of `org` over
+    the global ones. Names without a template are left out.
+    """
+    return ticket_template_resolver.resolve_many(names, org)
 
 
 def get_ticket_template_for_org(name, org):
-    return (
-        TicketTemplate.objects.filter(Q(name=name) & (Q(org=org) | Q(org__isnull=True)))
-        .order_by(
-            Case(
-                When(org=org, then=Value(0)),
-                When(org__isnull=True, then=Value(1)),
-                output_field=IntegerField(),
-            ),
-        )
-        .first()
-    )
+    return ticket_template_resolver.resolve(name, org)
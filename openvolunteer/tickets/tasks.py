@@ -11,12 +11,17 @@ from openvolunteer.events.models import EventStatus
 from openvolunteer.orgs.models import Organization
 from openvolunteer.people.models import Person
 
+from .audit_archive import archive_audit_log_partitions
+from .audit_archive import ensure_audit_log_partitions
 from .models import Ticket
 from .models import TicketBatch
+from .models import TicketGenerationJob
+from .models import TicketGenerationJobStatus
 from .models import TicketStatus
 from .models import TicketTemplate
 from .services import create_ticket
 from .services import get_ticket_template_for_org
+from .services import run_ticket_generation_job
 
 
 @shared_task(bind=True)
@@ -208,3 +213,113 @@ def create_tickets_for_people_with_tag(  # noqa: PLR0913
             batch.delete()
 
     return total_created
+
+
+@shared_task(bind=True)
+def create_ticket_audit_log_partitions(self) -> int:
+    """
+    Create upcoming monthly TicketAuditLog partitions.
+
+    Returns the number of created partitions.
+    """
+    return len(ensure_audit_log_partitions())
+
+
+@shared_task(bind=True)
+def archive_ticket_audit_logs(self, *, retention_months: int | None = None) -> int:
+    """
+    Export TicketAuditLog partitions older than `retention_months` months
+    (default: settings.TICKET_AUDIT_RETENTION_MONTHS) to compressed JSONL
+    files and drop them.
+
+    Returns the number of archived audit log entries.
+    """
+    archived = archive_audit_log_partitions(retention_months)
+    return sum(archived.values())
+
+
+# Large events take longer than the default soft time limit
+GENERATION_JOB_SOFT_TIME_LIMIT = 30 * 60
+GENERATION_JOB_TIME_LIMIT = 35 * 60
+
+
+@shared_task(
+    bind=True,
+    soft_time_limit=GENERATION_JOB_SOFT_TIME_LIMIT,
+    time_limit=GENERATION_JOB_TIME_LIMIT,
+)
+def generate_tickets_job(self, *, job_id: str) -> int:
+    """
+    Run a TicketGenerationJob in the background.
+
+    Returns the number of created tickets.
+    """
+    job = TicketGenerationJob.objects.select_related(
+        "event__org",
+        "event__template",
+        "shift",
+        "created_by",
+    ).get(id=job_id)
+
+    run_ticket_generation_job(job)
+    return job.created_count
+
+
+@shared_task(bind=True)
+def fail_stale_ticket_generation_jobs(self) -> int:
+    """
+    Mark jobs that are still running past the time limit of
+    generate_tickets_job as failed. Their worker was killed or died, so they
+    would be left running forever.
+
+    Returns the number of failed jobs.
+    """
+    cutoff = timezone.now() - timedelta(seconds=GENERATION_JOB_TIME_LIMIT)
+    jobs = TicketGenerationJob.objects.filter(
+        status=TicketGenerationJobStatus.RUNNING,
+        started_at__lt=cutoff,
+    )
+
+    failed = 0
+    for job in jobs:
+        job.status = TicketGenerationJobStatus.FAILED
+        job.errors = [*job.errors, "The job was interrupted; run it again."]
+        job.finished_at = timezone.now()
+        job.save(update_fields=["status", "errors", "finished_at"])
+        failed += 1
+    return failed
+
+
+def enqueue_ticket_generation_job(  # noqa: PLR0913
+    *,
+    event,
+    created_by,
+    ticket_templates=None,
+    person_ids=None,
+    shift=None,
+    include_default_shift=True,
+    batch_name="",
+    reason="",
+):
+    """
+    Persist a TicketGenerationJob and start it once the transaction commits.
+    """
+    job = TicketGenerationJob.objects.create(
+        org=event.org,
+        event=event,
+        shift=shift,
+        person_ids=(
+            [str(person_id) for person_id in person_ids]
+            if person_ids is not None
+            else None
+        ),
+        include_default_shift=include_default_shift,
+        batch_name=batch_name or "",
+        reason=reason,
+        created_by=created_by,
+    )
+    if ticket_templates is not None:
+        job.ticket_templates.set(ticket_templates)
+
+    transaction.on_commit(lambda: generate_tickets_job.delay(job_id=str(job.id)))
+    return job
@@ -0,0 +1,74 @@
+import hashlib
+import threading
+from collections import OrderedDict
+
+from django.template import Template
+
+# Number of compiled (TicketTemplate, field) pairs kept per process
+TEMPLATE_CACHE_SIZE = 256
+
+
+class CompiledTemplateCache:
+    """
+    Process-local LRU of compiled TicketTemplate fields.
+
+    Entries are keyed by (TicketTemplate id, field, hash of the source), so
+    any change of the source, saved or not, compiles it anew.
+    """
+
+    def __init__(self, maxsize=TEMPLATE_CACHE_SIZE):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, ticket_template, field) -> Template:
+        """
+        Return the compiled template for `field` of `ticket_template`.
+        """
+        source = getattr(ticket_template, field)
+        key = (
+            ticket_template.pk,
+            field,
+            hashlib.sha256(source.encode()).hexdigest(),
+        )
+
+        with self._lock:
+            compiled = self._entries.get(key)
+            if compiled is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return compiled
+            self.misses += 1
+
+        compiled = Template(source)
+
+        with self._lock:
+            self._entries[key] = compiled
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+        return compiled
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self):
+        """
+        Hit/miss counters, e.g. for monitoring or debugging.
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+            }
+
+
+ticket_template_cache = CompiledTemplateCache()
@@ -6,9 +6,14 @@ register = template.Library()
 
 
 @register.simple_tag
-def can_claim_ticket(user, ticket):
+def can_claim_ticket(user, ticket, ticket_permissions=None):
     """
     Usage:
-      {% can_assign_ticket request.user ticket as can_assign %}
+      {% can_claim_ticket request.user ticket ticket_permissions as can_claim %}
+
+    `ticket_permissions` is the optional result of ticket_permission_flags for
+    the listed tickets; without it the permission is evaluated per ticket.
     """
+    if ticket_permissions and ticket.id in ticket_permissions:
+        return ticket_permissions[ticket.id]["can_claim"]
     return user_can_claim_ticket(user, ticket, event=ticket.event)
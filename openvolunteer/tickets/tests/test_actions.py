@@ -0,0 +1,180 @@
+from datetime import timedelta
+
+import pytest
+from django.urls import reverse
+from django.utils import timezone
+
+from openvolunteer.events.models import Event
+from openvolunteer.events.models import EventTemplate
+from openvolunteer.events.models import ShiftAssignment
+from openvolunteer.events.models import ShiftAssignmentStatus
+from openvolunteer.orgs.models import Membership
+from openvolunteer.orgs.models import Organization
+from openvolunteer.orgs.models import OrgRole
+from openvolunteer.people.models import Person
+from openvolunteer.people.models import PersonOrganization
+from openvolunteer.people.models import PersonTag
+from openvolunteer.tickets.actions import handlers
+from openvolunteer.tickets.actions.enum import TicketActionRunWhen
+from openvolunteer.tickets.actions.enum import TicketActionType
+from openvolunteer.tickets.actions.models import TicketAction
+from openvolunteer.tickets.actions.models import TicketActionTemplate
+from openvolunteer.tickets.actions.service import TicketActionService
+from openvolunteer.tickets.models import Ticket
+from openvolunteer.tickets.models import TicketAuditEvent
+from openvolunteer.tickets.models import TicketAuditLog
+from openvolunteer.tickets.models import TicketStatus
+from openvolunteer.tickets.models import TicketTemplate
+from openvolunteer.tickets.services import generate_tickets_for_event
+
+# ruff: noqa: PLR2004
+
+
+@pytest.mark.django_db
+def test_on_create_actions_run_as_one_batch(user, django_capture_on_commit_callbacks):
+    org = Organization.objects.create(name="Org", slug="org")
+    event_template = EventTemplate.objects.create(org=org, name="Confirm")
+    ticket_template = TicketTemplate.objects.create(
+        org=org,
+        name="Confirm",
+        ticket_name_template="Confirm {{ person.full_name }}",
+    )
+    ticket_template.action_templates.add(
+        TicketActionTemplate.objects.create(
+            slug="pending-on-create",
+            action_type=TicketActionType.UPDATE_SHIFT_STATUS,
+            label="Mark pending",
+            config={"status": ShiftAssignmentStatus.PENDING},
+            updates_ticket_status=TicketStatus.COMPLETED,
+            run_when=TicketActionRunWhen.ON_CREATE,
+        ),
+    )
+    event_template.ticket_templates.add(ticket_template)
+
+    starts_at = timezone.now() + timedelta(days=1)
+    event = Event.objects.create(
+        org=org,
+        title="Confirm",
+        template=event_template,
+        starts_at=starts_at,
+        ends_at=starts_at + timedelta(hours=2),
+    )
+    shift = event.default_shift(annotate=False)
+    for i in range(4):
+        ShiftAssignment.objects.create(
+            shift=shift,
+            person=Person.objects.create(full_name=f"Person {i}"),
+        )
+
+    with django_capture_on_commit_callbacks(execute=True) as callbacks:
+        generate_tickets_for_event(event=event, created_by=user)
+
+    # One batch run; the other callbacks are cache invalidations
+    batch_runs = [
+        c for c in callbacks if c.__qualname__.startswith("run_bulk_on_create_actions")
+    ]
+    assert len(batch_runs) == 1
+    assert not ShiftAssignment.objects.exclude(
+        status=ShiftAssignmentStatus.PENDING,
+    ).exists()
+    assert not TicketAction.objects.filter(is_completed=False).exists()
+    assert Ticket.objects.filter(status=TicketStatus.COMPLETED).count() == 4
+    assert (
+        TicketAuditLog.objects.filter(event_type=TicketAuditEvent.ACTION_RUN).count()
+        == 4
+    )
+    assert (
+        TicketAuditLog.objects.filter(
+            event_type=TicketAuditEvent.STATUS_CHANGED,
+        ).count()
+        == 4
+    )
+
+
+@pytest.mark.django_db
+def test_on_create_tag_action_refreshes_person_search(
+    client,
+    user,
+    django_capture_on_commit_callbacks,
+):
+    org = Organization.objects.create(name="Org", slug="org")
+    Membership.objects.create(org=org, user=user, role=OrgRole.ADMIN)
+    event_template = EventTemplate.objects.create(org=org, name="Confirm")
+    ticket_template = TicketTemplate.objects.create(
+        org=org,
+        name="Confirm",
+        ticket_name_template="Confirm {{ person.full_name }}",
+    )
+    ticket_template.action_templates.add(
+        TicketActionTemplate.objects.create(
+            slug="tag-on-create",
+            action_type=TicketActionType.UPSERT_TAG,
+            label="Tag",
+            config={"tag": "Contacted"},
+            run_when=TicketActionRunWhen.ON_CREATE,
+        ),
+    )
+    event_template.ticket_templates.add(ticket_template)
+
+    starts_at = timezone.now() + timedelta(days=1)
+    event = Event.objects.create(
+        org=org,
+        title="Confirm",
+        template=event_template,
+        starts_at=starts_at,
+        ends_at=starts_at + timedelta(hours=2),
+    )
+    person = Person.objects.create(full_name="John Smith")
+    PersonOrganization.objects.create(person=person, org=org)
+    ShiftAssignment.objects.create(shift=event.default_shift(), person=person)
+    # Existing tag, so only the tagging is written
+    PersonTag.objects.create(name="Contacted")
+
+    client.force_login(user)
+    url = reverse("people:person_search")
+    response = client.get(url, {"q": "john"})
+    assert response.json()["results"][0]["tags"] == []
+
+    with django_capture_on_commit_callbacks(execute=True):
+        generate_tickets_for_event(event=event, created_by=user)
+
+    response = client.get(url, {"q": "john"})
+    tags = response.json()["results"][0]["tags"]
+    assert [tag["name"] for tag in tags] == ["Contacted"]
+
+
+@pytest.mark.django_db
+def test_execute_batch_logs_only_committed_audit_entries(monkeypatch):
+    org = Organization.objects.create(name="Org", slug="org")
+    ticket = Ticket.objects.create(org=org, name="Call")
+    actions = [
+        TicketAction.objects.create(
+            ticket=ticket,
+            action_type=TicketActionType.NOOP,
+            label=label,
+            updates_ticket_status=TicketStatus.COMPLETED,
+        )
+        for label in ("ok", "broken")
+    ]
+
+    def noop_or_fail(*, ticket, action, user):
+        if action.label == "broken":
+            raise RuntimeError(action.label)
+
+    # Force the per-action fallback
+    monkeypatch.delitem(handlers.BATCH_ACTION_HANDLERS, TicketActionType.NOOP)
+    monkeypatch.setitem(handlers.ACTION_HANDLERS, TicketActionType.NOOP, noop_or_fail)
+
+    TicketActionService.execute_batch(actions)
+
+    logs = TicketAuditLog.objects.filter(ticket=ticket)
+    assert sorted(logs.values_list("event_type", "message")) == sorted(
+        [
+            (TicketAuditEvent.ACTION_RUN, "Action 'ok' executed"),
+            (
+                TicketAuditEvent.STATUS_CHANGED,
+                "Status changed from 'open' to 'completed'",
+            ),
+            (TicketAuditEvent.ACTION_FAILED, "Action 'broken' failed: broken"),
+        ],
+    )
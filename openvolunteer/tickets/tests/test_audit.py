@@ -0,0 +1,137 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from openvolunteer.orgs.models import Organization
+from openvolunteer.tickets.audit import atomic_audit
+from openvolunteer.tickets.audit import buffered_audit
+from openvolunteer.tickets.audit import log_ticket_event
+from openvolunteer.tickets.audit import log_ticket_events
+from openvolunteer.tickets.audit_archive import add_months
+from openvolunteer.tickets.audit_archive import archive_path
+from openvolunteer.tickets.audit_archive import audit_log_partitions
+from openvolunteer.tickets.audit_archive import ensure_audit_log_partitions
+from openvolunteer.tickets.audit_archive import month_start
+from openvolunteer.tickets.audit_archive import partition_name
+from openvolunteer.tickets.audit_archive import read_archived_audit_logs
+from openvolunteer.tickets.models import Ticket
+from openvolunteer.tickets.models import TicketAuditEvent
+from openvolunteer.tickets.models import TicketAuditLog
+from openvolunteer.tickets.tasks import archive_ticket_audit_logs
+
+
+@pytest.mark.django_db
+def test_buffered_audit_flushes_with_one_insert(user):
+    org = Organization.objects.create(name="Org", slug="org")
+    ticket = Ticket.objects.create(org=org, name="Call")
+
+    with CaptureQueriesContext(connection) as queries, buffered_audit():
+        log_ticket_event(
+            ticket=ticket,
+            event_type=TicketAuditEvent.CLAIMED,
+            message="Ticket claimed",
+            actor=user,
+        )
+        log_ticket_events(
+            [
+                (ticket, TicketAuditEvent.STATUS_CHANGED, {"to": "todo"}),
+                (ticket, TicketAuditEvent.SYSTEM, None, "Reminder sent"),
+            ],
+            actor=user,
+        )
+        assert not TicketAuditLog.objects.filter(ticket=ticket).exists()
+
+    inserts = [q for q in queries.captured_queries if q["sql"].startswith("INSERT")]
+    assert len(inserts) == 1
+    assert set(
+        TicketAuditLog.objects.filter(ticket=ticket).values_list("message", flat=True),
+    ) == {"Ticket claimed", "Status changed", "Reminder sent"}
+
+
+@pytest.mark.django_db
+def test_buffered_audit_discards_entries_on_error():
+    org = Organization.objects.create(name="Org", slug="org")
+    ticket = Ticket.objects.create(org=org, name="Call")
+
+    @buffered_audit()
+    def fail():
+        log_ticket_event(
+            ticket=ticket,
+            event_type=TicketAuditEvent.SYSTEM,
+            message="Never written",
+        )
+        raise RuntimeError
+
+    with pytest.raises(RuntimeError):
+        fail()
+
+    assert not TicketAuditLog.objects.filter(ticket=ticket).exists()
+
+
+@pytest.mark.django_db
+def test_buffered_audit_drops_entries_of_rolled_back_savepoints():
+    org = Organization.objects.create(name="Org", slug="org")
+    ticket = Ticket.objects.create(org=org, name="Call")
+
+    with buffered_audit():
+        log_ticket_event(
+            ticket=ticket,
+            event_type=TicketAuditEvent.SYSTEM,
+            message="Kept",
+        )
+
+        @atomic_audit()
+        def fail():
+            log_ticket_event(
+                ticket=ticket,
+                event_type=TicketAuditEvent.SYSTEM,
+                message="Rolled back",
+            )
+            raise RuntimeError
+
+        with pytest.raises(RuntimeError):
+            fail()
+
+    assert list(
+        TicketAuditLog.objects.filter(ticket=ticket).values_list("message", flat=True),
+    ) == ["Kept"]
+
+
+@pytest.mark.django_db
+def test_archive_ticket_audit_logs_exports_old_partitions(user, settings, tmp_path):
+    settings.TICKET_AUDIT_ARCHIVE_DIR = str(tmp_path)
+    settings.TICKET_AUDIT_RETENTION_MONTHS = 12
+    org = Organization.objects.create(name="Org", slug="org")
+    ticket = Ticket.objects.create(org=org, name="Call")
+    log_ticket_event(
+        ticket=ticket,
+        event_type=TicketAuditEvent.CLAIMED,
+        message="Ticket claimed",
+        actor=user,
+    )
+
+    # Move the ticket and its entry into a partition past the retention window
+    old_month = add_months(month_start(timezone.now()), -14)
+    ensure_audit_log_partitions(start=old_month)
+    Ticket.objects.filter(id=ticket.id).update(created_at=old_month)
+    TicketAuditLog.objects.filter(ticket=ticket).update(created_at=old_month)
+    ticket.refresh_from_db()
+
+    assert archive_ticket_audit_logs(retention_months=12) == 1
+
+    assert not TicketAuditLog.objects.filter(ticket=ticket).exists()
+    assert partition_name(old_month) not in audit_log_partitions().values()
+    assert archive_path(old_month).exists()
+
+    archived = read_archived_audit_logs(ticket)
+    assert [log.message for log in archived] == ["Ticket claimed"]
+    assert archived[0].actor == user
+
+    # Only tickets indexed in an archive read it
+    assert list(ticket.audit_archive_months.values_list("month", flat=True)) == [
+        old_month.date(),
+    ]
+    quiet = Ticket.objects.create(org=org, name="Quiet")
+    archive_path(old_month).unlink()
+    assert read_archived_audit_logs(quiet) == []
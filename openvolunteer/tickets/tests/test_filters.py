@@ -0,0 +1,66 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from openvolunteer.orgs.models import Organization
+from openvolunteer.tickets.models import Ticket
+from openvolunteer.tickets.models import TicketBatch
+from openvolunteer.tickets.search import full_text_search
+
+
+@pytest.mark.django_db
+def test_ticket_search_ranks_name_over_batch_over_description():
+    org = Organization.objects.create(name="Org", slug="org")
+    batch = TicketBatch.objects.create(org=org, name="Canvass followups")
+    by_description = Ticket.objects.create(
+        org=org,
+        name="Call Jane",
+        description="Ask about the canvassing shift",
+    )
+    by_batch = Ticket.objects.create(org=org, name="Call Sam", batch=batch)
+    by_name = Ticket.objects.create(org=org, name="Canvass training")
+    Ticket.objects.create(org=org, name="Unrelated")
+
+    tickets = Ticket.objects.order_by("-created_at")
+    assert list(full_text_search(tickets, "canv")) == [
+        by_name,
+        by_batch,
+        by_description,
+    ]
+    assert list(full_text_search(tickets, "call canv")) == [by_batch, by_description]
+    assert not full_text_search(tickets, "?!").exists()
+
+    # Renaming the batch updates the vectors of its tickets
+    batch.name = "Phonebank"
+    batch.save()
+    assert list(full_text_search(tickets, "phone")) == [by_batch]
+
+
+@pytest.mark.django_db
+def test_saves_only_update_search_vectors_of_changed_search_fields():
+    org = Organization.objects.create(name="Org", slug="org")
+    batch = TicketBatch.objects.create(org=org, name="Canvass")
+    ticket = Ticket.objects.create(org=org, name="Call Jane", batch=batch)
+    tickets = Ticket.objects.all()
+
+    ticket = Ticket.objects.get(pk=ticket.pk)
+    ticket.priority = 1
+    with CaptureQueriesContext(connection) as queries:
+        ticket.save()
+    assert len(queries) == 1
+
+    batch = TicketBatch.objects.get(pk=batch.pk)
+    batch.claimable = False
+    with CaptureQueriesContext(connection) as queries:
+        batch.save()
+    assert len(queries) == 1
+
+    ticket.description = "Ask about phonebanking"
+    ticket.save()
+    assert list(full_text_search(tickets, "phone")) == [ticket]
+
+    # Deferred fields that are set later count as changed
+    ticket = Ticket.objects.only("org").get(pk=ticket.pk)
+    ticket.name = "Text Jane"
+    ticket.save()
+    assert list(full_text_search(tickets, "text")) == [ticket]
@@ -0,0 +1,89 @@
+import pytest
+from django.core.cache import cache
+from django.db.models import Case
+from django.db.models import IntegerField
+from django.db.models import Value
+from django.db.models import When
+
+from openvolunteer.core.counts import COUNT_CACHED
+from openvolunteer.core.counts import COUNT_ESTIMATE
+from openvolunteer.core.counts import ResultCount
+from openvolunteer.core.counts import count_queryset
+from openvolunteer.core.pagination import KeysetPaginator
+from openvolunteer.orgs.models import Organization
+from openvolunteer.tickets.models import Ticket
+from openvolunteer.tickets.models import TicketStatus
+
+# ruff: noqa: PLR2004
+
+
+@pytest.mark.django_db
+def test_keyset_paginator_walks_ticket_list_ordering():
+    org = Organization.objects.create(name="Org", slug="org")
+    for i in range(8):
+        Ticket.objects.create(
+            org=org,
+            name=f"Ticket {i}",
+            priority=i % 3,
+            status=TicketStatus.OPEN if i % 2 else TicketStatus.COMPLETED,
+        )
+    tickets = (
+        Ticket.objects.annotate(
+            finished_sort=Case(
+                When(status=TicketStatus.OPEN, then=Value(0)),
+                default=Value(1),
+                output_field=IntegerField(),
+            ),
+        )
+        .distinct()
+        .order_by("finished_sort", "priority", "-created_at")
+    )
+    expected = [ticket.id for ticket in tickets.order_by(*tickets.query.order_by, "pk")]
+    paginator = KeysetPaginator(tickets, per_page=3)
+
+    # Forward
+    pages = [paginator.page()]
+    while pages[-1].has_next():
+        pages.append(paginator.page(pages[-1].next_cursor))
+    assert [ticket.id for page in pages for ticket in page] == expected
+    assert [len(page) for page in pages] == [3, 3, 2]
+    assert not pages[0].has_previous()
+
+    # Backward from the last page
+    previous = paginator.page(pages[-1].previous_cursor)
+    assert [ticket.id for ticket in previous] == expected[3:6]
+    assert previous.has_next()
+    first = paginator.page(previous.previous_cursor)
+    assert [ticket.id for ticket in first] == expected[:3]
+    assert not first.has_previous()
+
+
+@pytest.mark.django_db
+def test_keyset_paginator_ignores_invalid_cursor():
+    org = Organization.objects.create(name="Org", slug="org")
+    Ticket.objects.create(org=org, name="Only")
+
+    page = KeysetPaginator(Ticket.objects.order_by("-created_at"), 5).page("bogus")
+
+    assert [ticket.name for ticket in page] == ["Only"]
+    assert not page.has_other_pages()
+
+
+@pytest.mark.django_db
+def test_count_queryset_strategies(settings):
+    org = Organization.objects.create(name="Org", slug="org")
+    for i in range(3):
+        Ticket.objects.create(org=org, name=f"Ticket {i}")
+    tickets = Ticket.objects.filter(org=org)
+
+    assert count_queryset(tickets) == ResultCount(3, is_exact=True)
+
+    # Treat every list as large
+    settings.PAGINATION_EXACT_COUNT_LIMIT = -1
+    cache.clear()
+
+    assert not count_queryset(tickets, COUNT_ESTIMATE).is_exact
+    assert count_queryset(tickets, COUNT_CACHED) == ResultCount(3, is_exact=True)
+    Ticket.objects.create(org=org, name="Ticket 3")
+    assert count_queryset(tickets, COUNT_CACHED) == ResultCount(3, is_exact=False)
+    assert count_queryset(tickets.order_by("name"), COUNT_CACHED).value == 3
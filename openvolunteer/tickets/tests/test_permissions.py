@@ -0,0 +1,77 @@
+from datetime import timedelta
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from openvolunteer.events.models import Event
+from openvolunteer.events.models import EventTemplate
+from openvolunteer.orgs.models import Membership
+from openvolunteer.orgs.models import Organization
+from openvolunteer.orgs.models import OrgRole
+from openvolunteer.orgs.permissions import attach_permission_context
+from openvolunteer.tickets.models import Ticket
+from openvolunteer.tickets.models import TicketStatus
+from openvolunteer.tickets.permissions import ticket_permission_flags
+from openvolunteer.tickets.permissions import user_can_claim_ticket
+from openvolunteer.tickets.permissions import user_can_edit_ticket
+from openvolunteer.tickets.permissions import user_can_run_action
+from openvolunteer.tickets.permissions import user_can_unclaim_ticket
+from openvolunteer.tickets.permissions import user_can_view_ticket
+
+# ruff: noqa: PLR2004
+
+
+@pytest.mark.django_db
+def test_ticket_permission_flags_match_per_ticket_checks(user):
+    admin_org = Organization.objects.create(name="Admin org", slug="admin-org")
+    volunteer_org = Organization.objects.create(name="Volunteer org", slug="vol-org")
+    other_org = Organization.objects.create(name="Other org", slug="other-org")
+    viewer_org = Organization.objects.create(name="Viewer org", slug="viewer-org")
+    Membership.objects.create(org=admin_org, user=user, role=OrgRole.ADMIN)
+    Membership.objects.create(org=volunteer_org, user=user, role=OrgRole.VOLUNTEER)
+    Membership.objects.create(org=viewer_org, user=user, role=OrgRole.VIEWER)
+
+    starts_at = timezone.now() + timedelta(days=1)
+    events = [
+        Event.objects.create(
+            org=org,
+            title="Canvass",
+            template=EventTemplate.objects.create(org=org, name="Canvass"),
+            starts_at=starts_at,
+            ends_at=starts_at + timedelta(hours=2),
+            owned_by=user if org == other_org else None,
+        )
+        for org in (admin_org, volunteer_org, other_org, viewer_org)
+    ]
+
+    for event in [*events, None]:
+        org = event.org if event else other_org
+        for claimable in (True, False):
+            for status in (TicketStatus.OPEN, TicketStatus.INPROGRESS):
+                Ticket.objects.create(
+                    org=org,
+                    event=event,
+                    name="Ticket",
+                    claimable=claimable,
+                    status=status,
+                    assigned_to=user if claimable else None,
+                )
+    Ticket.objects.create(org=other_org, name="Mine", reporter=user)
+
+    attach_permission_context(user)
+    with CaptureQueriesContext(connection) as queries:
+        flags = ticket_permission_flags(user, Ticket.objects.all())
+    # Tickets, their events and the memberships
+    assert len(queries) == 3
+
+    for ticket in Ticket.objects.select_related("event"):
+        event = ticket.event
+        assert flags[ticket.id] == {
+            "can_view": user_can_view_ticket(user, ticket),
+            "can_claim": user_can_claim_ticket(user, ticket, event=event),
+            "can_unclaim": user_can_unclaim_ticket(user, ticket, event=event),
+            "can_edit": bool(user_can_edit_ticket(user, ticket, event=event)),
+            "can_run_action": bool(user_can_run_action(user, ticket, event)),
+        }, ticket
@@ -0,0 +1,289 @@
+from datetime import timedelta
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from openvolunteer.events.models import Event
+from openvolunteer.events.models import EventTemplate
+from openvolunteer.events.models import ShiftAssignment
+from openvolunteer.orgs.models import Organization
+from openvolunteer.people.models import Person
+from openvolunteer.people.models import PersonTag
+from openvolunteer.people.services import generate_tags_org_prefered
+from openvolunteer.tickets.actions.models import TicketAction
+from openvolunteer.tickets.actions.models import TicketActionTemplate
+from openvolunteer.tickets.models import Ticket
+from openvolunteer.tickets.models import TicketAuditEvent
+from openvolunteer.tickets.models import TicketAuditLog
+from openvolunteer.tickets.models import TicketGenerationJob
+from openvolunteer.tickets.models import TicketGenerationJobStatus
+from openvolunteer.tickets.models import TicketTemplate
+from openvolunteer.tickets.resolvers import ticket_template_resolver
+from openvolunteer.tickets.services import create_ticket
+from openvolunteer.tickets.services import format_event_times
+from openvolunteer.tickets.services import generate_tickets_for_event
+from openvolunteer.tickets.services import get_ticket_template_for_org
+from openvolunteer.tickets.services import get_ticket_templates_for_org
+from openvolunteer.tickets.services import render_ticket_template
+from openvolunteer.tickets.services import run_ticket_generation_job
+from openvolunteer.tickets.template_cache import ticket_template_cache
+
+# ruff: noqa: PLR2004
+
+
+def _make_event(org, people_count):
+    event_template = EventTemplate.objects.create(org=org, name="Canvass Test")
+    ticket_template = TicketTemplate.objects.create(
+        org=org,
+        name="Call",
+        ticket_name_template="Call {{ person.full_name }}",
+        description_template="For {{ event_title }} at {{ event_starts_at.utc }}",
+    )
+    ticket_template.action_templates.add(
+        TicketActionTemplate.objects.create(
+            slug=f"{org.slug}-noop",
+            action_type="noop",
+            label="Done",
+        ),
+    )
+    event_template.ticket_templates.add(ticket_template)
+
+    starts_at = timezone.now() + timedelta(days=1)
+    event = Event.objects.create(
+        org=org,
+        title="Canvass",
+        template=event_template,
+        starts_at=starts_at,
+        ends_at=starts_at + timedelta(hours=2),
+    )
+    shift = event.default_shift(annotate=False)
+    for i in range(people_count):
+        ShiftAssignment.objects.create(
+            shift=shift,
+            person=Person.objects.create(full_name=f"Person {i}"),
+        )
+    return event, ticket_template
+
+
+@pytest.mark.django_db
+def test_generate_tickets_for_event_creates_tickets_actions_and_audit(user):
+    org = Organization.objects.create(name="Org", slug="org")
+    event, _ = _make_event(org, people_count=3)
+
+    batch, tickets = generate_tickets_for_event(event=event, created_by=user)
+
+    assert len(tickets) == 3
+    assert Ticket.objects.filter(batch=batch).count() == 3
+    assert TicketAction.objects.filter(ticket__batch=batch).count() == 3
+    assert (
+        TicketAuditLog.objects.filter(
+            ticket__batch=batch,
+            event_type=TicketAuditEvent.CREATED,
+        ).count()
+        == 3
+    )
+    assert Ticket.objects.filter(name="Call Person 0").exists()
+
+
+@pytest.mark.django_db
+def test_generate_tickets_for_event_skips_existing_tickets(user):
+    org = Organization.objects.create(name="Org", slug="org")
+    event, _ = _make_event(org, people_count=3)
+
+    generate_tickets_for_event(event=event, created_by=user)
+    _, tickets = generate_tickets_for_event(event=event, created_by=user)
+
+    assert tickets == []
+    assert Ticket.objects.filter(event=event).count() == 3
+
+
+@pytest.mark.django_db
+def test_generate_tickets_for_event_enforces_max_tickets(user):
+    org = Organization.objects.create(name="Org", slug="org")
+    event, ticket_template = _make_event(org, people_count=3)
+    ticket_template.max_tickets = 2
+    ticket_template.save()
+
+    with pytest.raises(ValueError, match="max_tickets exceeded"):
+        generate_tickets_for_event(event=event, created_by=user)
+
+
+@pytest.mark.django_db
+def test_generate_tickets_for_event_query_count_is_constant(user):
+    small_org = Organization.objects.create(name="Small", slug="small")
+    small_event, _ = _make_event(small_org, people_count=2)
+    large_org = Organization.objects.create(name="Large", slug="large")
+    large_event, _ = _make_event(large_org, people_count=25)
+
+    with CaptureQueriesContext(connection) as small:
+        generate_tickets_for_event(event=small_event, created_by=user)
+    with CaptureQueriesContext(connection) as large:
+        generate_tickets_for_event(event=large_event, created_by=user)
+
+    assert len(large.captured_queries) == len(small.captured_queries)
+
+
+@pytest.mark.django_db
+def test_ticket_template_cache_reuses_and_invalidates_compiled_templates():
+    org = Organization.objects.create(name="Org", slug="org")
+    template = TicketTemplate.objects.create(
+        org=org,
+        name="Cached",
+        ticket_name_template="Hello {{ person }}",
+    )
+    ticket_template_cache.clear()
+
+    assert render_ticket_template(template, "ticket_name_template", {"person": "A"})
+    assert render_ticket_template(template, "ticket_name_template", {"person": "B"})
+    assert ticket_template_cache.info()["hits"] == 1
+    assert ticket_template_cache.info()["misses"] == 1
+
+    template.ticket_name_template = "Bye {{ person }}"
+    template.save()
+
+    rendered = render_ticket_template(template, "ticket_name_template", {"person": "C"})
+    assert rendered == "Bye C"
+    assert ticket_template_cache.info()["misses"] == 2
+
+    # Edits that leave modified_at alone are picked up too
+    TicketTemplate.objects.filter(pk=template.pk).update(
+        ticket_name_template="Hi {{ person }}",
+    )
+    template.refresh_from_db()
+    rendered = render_ticket_template(template, "ticket_name_template", {"person": "D"})
+    assert rendered == "Hi D"
+
+    template.ticket_name_template = "Hey {{ person }}"
+    rendered = render_ticket_template(template, "ticket_name_template", {"person": "E"})
+    assert rendered == "Hey E"
+
+
+@pytest.mark.django_db
+def test_org_preferred_lookups_are_cached_and_invalidated(
+    django_capture_on_commit_callbacks,
+):
+    org = Organization.objects.create(name="Org", slug="org")
+    other = Organization.objects.create(name="Other", slug="other")
+    shared = TicketTemplate.objects.create(org=None, name="Call")
+    own = TicketTemplate.objects.create(org=org, name="Call")
+    ticket_template_resolver.reset_stats()
+
+    with django_capture_on_commit_callbacks(execute=True):
+        with CaptureQueriesContext(connection) as first:
+            templates = get_ticket_templates_for_org(["Call", "Missing"], org)
+        assert templates == {"Call": own}
+        assert len(first.captured_queries) == 1
+        assert get_ticket_template_for_org("Call", other) == shared
+
+    with CaptureQueriesContext(connection) as cached:
+        assert get_ticket_templates_for_org(["Call", "Missing"], org) == templates
+    assert len(cached.captured_queries) == 0
+    assert ticket_template_resolver.info()["misses"] == 3
+
+    # A template of the other org now overrides the global one
+    with django_capture_on_commit_callbacks(execute=True):
+        override = TicketTemplate.objects.create(org=other, name="Call")
+    assert get_ticket_template_for_org("Call", other) == override
+
+    with django_capture_on_commit_callbacks(execute=True):
+        tags = generate_tags_org_prefered(["Volunteer", "Donor"], org)
+    assert {tag.org for tag in tags.values()} == {org}
+    assert generate_tags_org_prefered(["Volunteer"], None)["Volunteer"].org is None
+    assert PersonTag.objects.filter(name="Volunteer").count() == 2
+
+
+@pytest.mark.django_db
+def test_generate_tickets_for_event_uses_org_timezones(user):
+    org = Organization.objects.create(
+        name="Org",
+        slug="org",
+        timezones={"local": ["JST", "Asia/Tokyo"]},
+    )
+    event, ticket_template = _make_event(org, people_count=1)
+    ticket_template.description_template = "{{ event_starts_at.local }}"
+    ticket_template.save()
+
+    _, tickets = generate_tickets_for_event(event=event, created_by=user)
+
+    assert (
+        tickets[0].description
+        == format_event_times(
+            event.starts_at,
+            org.display_timezones,
+        )["local"]
+    )
+    assert tickets[0].description.endswith("JST")
+
+
+@pytest.mark.django_db
+def test_run_ticket_generation_job_processes_chunks(user):
+    org = Organization.objects.create(name="Org", slug="org")
+    event, _ = _make_event(org, people_count=5)
+    job = TicketGenerationJob.objects.create(
+        org=org,
+        event=event,
+        created_by=user,
+    )
+
+    run_ticket_generation_job(job, chunk_size=2)
+
+    job.refresh_from_db()
+    assert job.status == TicketGenerationJobStatus.COMPLETED
+    assert job.total == 5
+    assert job.processed == 5
+    assert job.created_count == 5
+    assert job.progress_percent == 100
+    assert Ticket.objects.filter(batch=job.batch).count() == 5
+
+
+@pytest.mark.django_db
+def test_run_ticket_generation_job_records_failure(user):
+    org = Organization.objects.create(name="Org", slug="org")
+    event, ticket_template = _make_event(org, people_count=3)
+    ticket_template.max_tickets = 2
+    ticket_template.save()
+    job = TicketGenerationJob.objects.create(
+        org=org,
+        event=event,
+        created_by=user,
+    )
+
+    run_ticket_generation_job(job)
+
+    job.refresh_from_db()
+    assert job.status == TicketGenerationJobStatus.FAILED
+    assert "max_tickets exceeded" in job.errors[0]
+    assert not Ticket.objects.filter(event=event).exists()
+
+
+@pytest.mark.django_db
+def test_create_ticket_is_deduplicated_by_database(user):
+    org = Organization.objects.create(name="Org", slug="org")
+    event, ticket_template = _make_event(org, people_count=1)
+    assignment = ShiftAssignment.objects.select_related("person", "shift").get(
+        shift__event=event,
+    )
+    options = {
+        "template": ticket_template,
+        "org": org,
+        "created_by": user,
+        "person": assignment.person,
+        "event": event,
+        "shift": assignment.shift,
+    }
+
+    ticket = create_ticket(**options)
+    duplicate = create_ticket(**options)
+
+    assert ticket.dedup_key == ticket.compute_dedup_key()
+    assert duplicate is None
+    assert Ticket.objects.filter(event=event).count() == 1
+    assert TicketAction.objects.filter(ticket__event=event).count() == 1
+
+    # The key is fixed at creation, so detached tickets do not collide
+    event.delete()
+    ticket.refresh_from_db()
+    assert ticket.event_id is None
+    assert ticket.dedup_key is not None
@@ -5,6 +5,7 @@ from django.utils import timezone
 
 from openvolunteer.events.models import Event
 from openvolunteer.events.models import EventStatus
+from openvolunteer.events.models import EventTemplate
 from openvolunteer.orgs.models import Organization
 from openvolunteer.people.models import Person
 from openvolunteer.people.models import PersonOrganization
@@ -12,6 +13,8 @@ from openvolunteer.people.models import PersonTag
 from openvolunteer.people.models import PersonTagging
 from openvolunteer.tickets.models import Ticket
 from openvolunteer.tickets.models import TicketBatch
+from openvolunteer.tickets.models import TicketGenerationJob
+from openvolunteer.tickets.models import TicketGenerationJobStatus
 from openvolunteer.tickets.models import TicketStatus
 from openvolunteer.tickets.models import TicketTemplate
 from openvolunteer.tickets.tasks import cancel_stale_tickets
@@ -19,6 +22,7 @@ from openvolunteer.tickets.tasks import cancel_tickets_for_canceled_events
 from openvolunteer.tickets.tasks import create_tickets_for_people_with_tag
 from openvolunteer.tickets.tasks import delete_ticket_batches
 from openvolunteer.tickets.tasks import delete_tickets
+from openvolunteer.tickets.tasks import fail_stale_ticket_generation_jobs
 
 # ruff: noqa: PLR2004
 
@@ -207,3 +211,40 @@ def test_create_tickets_for_people_with_tag_creates_and_cleans_batches():
     assert created == 1
     assert Ticket.objects.count() == 1
     assert TicketBatch.objects.count() == 1
+
+
+@pytest.mark.django_db
+def test_fail_stale_ticket_generation_jobs():
+    org = Organization.objects.create(name="Org", slug="org")
+    now = timezone.now()
+    event = Event.objects.create(
+        org=org,
+        title="Canvass",
+        template=EventTemplate.objects.create(org=org, name="Canvass"),
+        starts_at=now,
+        ends_at=now + timedelta(hours=2),
+    )
+    stale, running, completed = (
+        TicketGenerationJob.objects.create(
+            org=org,
+            event=event,
+            status=status,
+            started_at=now - timedelta(hours=hours),
+        )
+        for status, hours in (
+            (TicketGenerationJobStatus.RUNNING, 2),
+            (TicketGenerationJobStatus.RUNNING, 0),
+            (TicketGenerationJobStatus.COMPLETED, 2),
+        )
+    )
+
+    assert fail_stale_ticket_generation_jobs() == 1
+
+    stale.refresh_from_db()
+    assert stale.status == TicketGenerationJobStatus.FAILED
+    assert stale.finished_at is not None
+    assert stale.errors
+    running.refresh_from_db()
+    assert running.status == TicketGenerationJobStatus.RUNNING
+    completed.refresh_from_db()
+    assert completed.status == TicketGenerationJobStatus.COMPLETED
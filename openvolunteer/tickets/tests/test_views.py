@@ -0,0 +1,86 @@
+import json
+from datetime import timedelta
+
+import pytest
+from django.urls import reverse
+from django.utils import timezone
+
+from openvolunteer.events.models import Event
+from openvolunteer.events.models import EventTemplate
+from openvolunteer.orgs.models import Membership
+from openvolunteer.orgs.models import Organization
+from openvolunteer.orgs.models import OrgRole
+from openvolunteer.tickets.models import Ticket
+from openvolunteer.tickets.models import TicketAuditEvent
+from openvolunteer.tickets.models import TicketAuditLog
+from openvolunteer.tickets.models import TicketStatus
+from openvolunteer.users.tests.factories import UserFactory
+
+# ruff: noqa: PLR2004
+
+
+@pytest.mark.django_db
+def test_update_ticket(client, user):
+    org = Organization.objects.create(name="Org", slug="org")
+    Membership.objects.create(org=org, user=user, role=OrgRole.ADMIN)
+    starts_at = timezone.now() + timedelta(days=1)
+    event = Event.objects.create(
+        org=org,
+        title="Canvass",
+        template=EventTemplate.objects.create(org=org, name="Canvass"),
+        starts_at=starts_at,
+        ends_at=starts_at + timedelta(hours=2),
+    )
+    ticket = Ticket.objects.create(org=org, event=event, name="Call")
+    url = reverse("tickets:update_ticket", args=[ticket.id])
+    data = {"status": TicketStatus.TODO, "priority": 2, "assigned_to": user.id}
+
+    # Not a member of the org
+    client.force_login(UserFactory())
+    assert client.post(url, data).status_code == 403
+
+    client.force_login(user)
+    assert client.post(url, data).json() == {"ok": True}
+    ticket.refresh_from_db()
+    assert (ticket.status, ticket.priority, ticket.assigned_to) == (
+        TicketStatus.TODO,
+        2,
+        user,
+    )
+    assert TicketAuditLog.objects.filter(
+        ticket=ticket,
+        event_type=TicketAuditEvent.UPDATED,
+        success=True,
+    ).exists()
+
+    response = client.post(url, {**data, "status": TicketStatus.OPEN})
+    assert "assigned_to" in response.json()["err"]
+
+
+@pytest.mark.django_db
+def test_ticket_export(client, user):
+    org = Organization.objects.create(name="Org", slug="org")
+    other_org = Organization.objects.create(name="Other", slug="other")
+    Membership.objects.create(org=org, user=user, role=OrgRole.VOLUNTEER)
+    Ticket.objects.create(
+        org=org,
+        name="Call",
+        status=TicketStatus.TODO,
+        assigned_to=user,
+    )
+    Ticket.objects.create(org=org, name="Text", status=TicketStatus.COMPLETED)
+    Ticket.objects.create(org=other_org, name="Hidden")
+    client.force_login(user)
+
+    response = client.get(
+        reverse("tickets:ticket_export"),
+        {"status": TicketStatus.TODO, "format": "jsonl"},
+    )
+    rows = [json.loads(line) for line in response.getvalue().decode().splitlines()]
+    assert [(r["name"], r["org_name"], r["assigned_to_email"]) for r in rows] == [
+        ("Call", "Org", user.email),
+    ]
+    assert (
+        client.get(reverse("tickets:ticket_export"), {"format": "xml"}).status_code
+        == 400
+    )
@@ -1,50 +1,63 @@
 #!/usr/bin/env python3
+from asgiref.sync import sync_to_async
+from django.conf import settings
 from django.contrib import messages
 from django.contrib.auth.decorators import login_required
 from django.core.exceptions import PermissionDenied
+from django.db import transaction
 from django.db.models import Case
+from django.db.models import F
 from django.db.models import IntegerField
+from django.db.models import Model
 from django.db.models import Value
 from django.db.models import When
 from django.http import HttpResponseForbidden
 from django.http import JsonResponse
+from django.shortcuts import aget_object_or_404
 from django.shortcuts import get_object_or_404
 from django.shortcuts import redirect
 from django.shortcuts import render
 
+from openvolunteer.core.export import export_response
 from openvolunteer.core.filters import apply_filters
 from openvolunteer.core.pagination import paginate
 from openvolunteer.events.forms import GenerateTicketsForTemplateForm
 from openvolunteer.events.models import Event
 from openvolunteer.events.models import Shift
 from openvolunteer.events.permissions import user_can_manage_events
+from openvolunteer.orgs.permissions import apermission_context
 from openvolunteer.orgs.queryset import orgs_for_user
 from openvolunteer.people.models import Person
 
 from .actions.enum import TicketActionRunWhen
 from .actions.service import TicketActionService
 from .actions.utils import reset_ticket_actions
+from .audit import buffered_audit
 from .audit import log_ticket_event
+from .audit_archive import archive_cutoff
+from .audit_archive import read_archived_audit_logs
 from .filters import TICKET_FILTERS
 from .forms import TicketUpdateForm
 from .models import Ticket
 from .models import TicketAuditEvent
 from .models import TicketAuditLog
+from .models import TicketGenerationJob
 from .models import TicketStatus
+from .permissions import ticket_permission_flags
 from .permissions import user_can_assign_ticket
 from .permissions import user_can_claim_ticket
 from .permissions import user_can_edit_ticket
 from .permissions import user_can_run_action
 from .permissions import user_can_unclaim_ticket
 from .permissions import user_can_view_ticket
+from .services import count_event_tickets
 from .services import generate_tickets_for_event
+from .tasks import enqueue_ticket_generation_job
 
 
-@login_required
-def ticket_list(request):
-    tickets = (
-        Ticket.objects.select_related("event", "batch", "assigned_to", "person")
-        .filter(org__in=orgs_for_user(request.user))
+def _visible_tickets(user):
+    return (
+        Ticket.objects.filter(org__in=orgs_for_user(user))
         .annotate(
             finished_sort=Case(
                 When(status=TicketStatus.OPEN, then=Value(0)),
@@ -52,18 +65,30 @@ def ticket_list(request):
                 output_field=IntegerField(),
             ),
         )
-        .distinct()
         .order_by("finished_sort", "priority", "-created_at")
     )
 
+
+@login_required
+def ticket_list(request):
+    tickets = _visible_tickets(request.user).select_related(
+        "event",
+        "batch",
+        "assigned_to",
+        "person",
+    )
+
     tickets, filter_ctx = apply_filters(request, tickets, TICKET_FILTERS)
-    pagination = paginate(request, tickets, per_page=20)
+    pagination = paginate(request, tickets, per_page=20, keyset=True)
 
     return render(
         request,
         "tickets/ticket_list.html",
         {
-            "user_can_assign_ticket": user_can_assign_ticket,
+            "ticket_permissions": ticket_permission_flags(
+                request.user,
+                pagination["page_obj"],
+            ),
             "tickets": pagination["page_obj"],
             **pagination,
             **filter_ctx,
@@ -71,6 +96,37 @@ def ticket_list(request):
     )
 
 
+TICKET_EXPORT_FIELDS = [
+    "id",
+    "name",
+    "status",
+    "priority",
+    "org_name",
+    "event_id",
+    "event_title",
+    "batch_name",
+    "person_id",
+    "person_name",
+    "assigned_to_email",
+    "created_at",
+    "modified_at",
+    "completed_at",
+]
+
+
+@login_required
+def ticket_export(request):
+    tickets, _ = apply_filters(request, _visible_tickets(request.user), TICKET_FILTERS)
+    tickets = tickets.annotate(
+        org_name=F("org__name"),
+        event_title=F("event__title"),
+        batch_name=F("batch__name"),
+        person_name=F("person__full_name"),
+        assigned_to_email=F("assigned_to__email"),
+    )
+    return export_response(request, tickets, TICKET_EXPORT_FIELDS, "tickets")
+
+
 @login_required
 def ticket_detail(request, ticket_id):
     ticket = get_object_or_404(
@@ -97,6 +153,14 @@ def ticket_detail(request, ticket_id):
     )
     pagination = paginate(request, audit_logs, per_page=10)
 
+    # Entries of archived partitions are only read from disk on demand
+    has_archived_logs = (
+        ticket.created_at < archive_cutoff() and ticket.audit_archive_months.exists()
+    )
+    archived_logs = None
+    if has_archived_logs and request.GET.get("archived"):
+        archived_logs = read_archived_audit_logs(ticket)
+
     return render(
         request,
         "tickets/ticket_detail.html",
@@ -123,6 +187,8 @@ def ticket_detail(request, ticket_id):
             ),
             "ticket": ticket,
             "audit_logs": pagination["page_obj"],
+            "has_archived_logs": has_archived_logs,
+            "archived_logs": archived_logs,
             **pagination,
             "form": form,
             "status_buttons": TicketStatus.choices,
@@ -173,15 +239,45 @@ def generate_tickets_for_event_template(request, event_id, template_id):
     )
 
     if request.method == "POST" and form.is_valid():
+        people = form.cleaned_data["people"]
+        include_default_shift = form.cleaned_data.get("shift") is None
+        reason = f"Generated via event UI ({ticket_template.name})"
+
+        ticket_count = count_event_tickets(
+            event=event,
+            ticket_templates=[ticket_template],
+            person_queryset=people,
+            shift=shift,
+            include_default_shift=include_default_shift,
+        )
+
+        # Large generations run in a worker; the user follows the job progress
+        if ticket_count > settings.TICKET_GENERATION_SYNC_LIMIT:
+            job = enqueue_ticket_generation_job(
+                event=event,
+                shift=shift,
+                created_by=request.user,
+                ticket_templates=[ticket_template],
+                person_ids=people.values_list("id", flat=True),
+                batch_name=form.cleaned_data.get("batch_name"),
+                include_default_shift=include_default_shift,
+                reason=reason,
+            )
+            messages.info(
+                request,
+                f"Generating {ticket_count} tickets in the background.",
+            )
+            return redirect("tickets:generation_job", job_id=job.id)
+
         generate_tickets_for_event(
             event=event,
             shift=shift,
             created_by=request.user,
             ticket_templates=[ticket_template],
-            person_queryset=form.cleaned_data["people"],
+            person_queryset=people,
             batch_name=form.cleaned_data.get("batch_name"),
-            include_default_shift=form.cleaned_data.get("shift") is None,
-            reason=f"Generated via event UI ({ticket_template.name})",
+            include_default_shift=include_default_shift,
+            reason=reason,
         )
 
         messages.success(
@@ -204,7 +300,51 @@ def generate_tickets_for_event_template(request, event_id, template_id):
     )
 
 
+def _get_generation_job(request, job_id):
+    job = get_object_or_404(
+        TicketGenerationJob.objects.select_related("event__org", "batch"),
+        id=job_id,
+    )
+    if not user_can_manage_events(request.user, job.event):
+        msg = "User can not view this ticket generation job"
+        raise PermissionDenied(msg)
+    return job
+
+
+@login_required
+def generation_job_detail(request, job_id):
+    job = _get_generation_job(request, job_id)
+
+    return render(
+        request,
+        "tickets/generation_job.html",
+        {
+            "job": job,
+            "event": job.event,
+        },
+    )
+
+
 @login_required
+def generation_job_status(request, job_id):
+    job = _get_generation_job(request, job_id)
+
+    return JsonResponse(
+        {
+            "status": job.status,
+            "status_display": job.get_status_display(),
+            "is_finished": job.is_finished,
+            "total": job.total,
+            "processed": job.processed,
+            "created": job.created_count,
+            "progress": job.progress_percent,
+            "errors": job.errors,
+        },
+    )
+
+
+@login_required
+@buffered_audit()
 def claim_ticket(request, ticket_id):
     ticket = get_object_or_404(Ticket, id=ticket_id)
 
@@ -240,6 +380,7 @@ def claim_ticket(request, ticket_id):
 
 
 @login_required
+@buffered_audit()
 def unclaim_ticket(request, ticket_id):
     ticket = get_object_or_404(Ticket, id=ticket_id)
 
@@ -274,26 +415,21 @@ def unclaim_ticket(request, ticket_id):
     return redirect("tickets:ticket_detail", ticket_id=ticket.id)
 
 
-@login_required
-def update_ticket(request, ticket_id):
-    ticket = get_object_or_404(Ticket, id=ticket_id)
-
-    if request.method != "POST":
-        return redirect("tickets:ticket_detail", ticket_id=ticket.id)
-
-    if not user_can_edit_ticket(request.user, ticket, event=ticket.event):
-        return HttpResponseForbidden("This ticket is not claimable.")
-
+@transaction.atomic
+@buffered_audit()
+def _save_ticket_update(request, user, ticket):
     form = TicketUpdateForm(request.POST, instance=ticket)
 
     if form.is_valid():
+        # Related objects (assigned_to) are logged by their display name
         changed_fields = {
-            field: form.cleaned_data[field] for field in form.changed_data
+            field: str(value) if isinstance(value, Model) else value
+            for field, value in form.cleaned_data.items()
+            if field in form.changed_data
         }
         if "assigned_to" in form.changed_data:
-            if not user_can_assign_ticket(request.user, event=ticket.event):
-                messages.error(
-                    "request",
+            if not user_can_assign_ticket(user, event=ticket.event):
+                return HttpResponseForbidden(
                     "You do not have permission to assign tickets for this event.",
                 )
 
@@ -303,7 +439,7 @@ def update_ticket(request, ticket_id):
             log_ticket_event(
                 ticket=ticket,
                 event_type=TicketAuditEvent.UPDATED,
-                actor=request.user,
+                actor=user,
                 message="Ticket updated",
                 metadata={
                     "changed_fields": changed_fields,
@@ -314,7 +450,7 @@ def update_ticket(request, ticket_id):
         log_ticket_event(
             ticket=ticket,
             event_type=TicketAuditEvent.UPDATED,
-            actor=request.user,
+            actor=user,
             success=False,
             message="Ticket update failed due to validation errors",
             metadata={
@@ -326,3 +462,31 @@ def update_ticket(request, ticket_id):
         return JsonResponse({"err": form.errors})
 
     return JsonResponse({"ok": True})
+
+
+# Async: inline edits from the ticket lists are frequent and mostly wait on
+# the database. The lookup and permission check use the async ORM; the update
+# itself runs in one transaction in a thread, as ATOMIC_REQUESTS would.
+@transaction.non_atomic_requests
+@login_required
+async def update_ticket(request, ticket_id):
+    user = await request.auser()
+    # The permission checks then answer without I/O; the related users are
+    # select_related for the same reason
+    await apermission_context(user)
+    ticket = await aget_object_or_404(
+        Ticket.objects.select_related(
+            "assigned_to",
+            "reporter",
+            "event__owned_by",
+        ),
+        id=ticket_id,
+    )
+
+    if request.method != "POST":
+        return redirect("tickets:ticket_detail", ticket_id=ticket.id)
+
+    if not user_can_edit_ticket(user, ticket, event=ticket.event):
+        return HttpResponseForbidden("This ticket is not claimable.")
+
+    return await sync_to_async(_save_ticket_update)(request, user, ticket)